@@ -0,0 +1,224 @@
+"""
+Single-file agent pack: every file of an agent dir in one deterministic tar.
+
+Nothing of it is committed; build_agent_packs.py builds the table of contents
+and the archives from the committed agent dir at site build time:
+
+  pack/toc.json             member paths, data offsets, sizes and digests
+  pack/agent-pack.tar       uncompressed ustar, members sorted by path
+  pack/agent-pack.tar.gz    the same tar, gzip-compressed (mtime 0, no name)
+
+Members carry fixed metadata (mode 0644, uid/gid 0, mtime 0, no user names) and
+plain ustar headers, so the tar bytes depend only on the member paths and
+contents and the TOC can give each member's data offset for range reads. The
+TOC itself is appended as the last member (pack/toc.json). manifest.json and
+the build-time views and symbol index are not packed. `build_agent_packs.py
+--check` compares the built files with a fresh build after a site build.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+from pathlib import Path
+from typing import BinaryIO
+
+import _content_store
+import _hash_cache
+import _manifest_views
+import _tree_model
+
+
+TOC_PATH = "pack/toc.json"
+ARCHIVE_NAME = "agent-pack.tar"
+ARCHIVE_GZ_NAME = "agent-pack.tar.gz"
+# Agent-dir-relative URLs of the archives (advertised in index.json and entrypoints.json).
+ARCHIVE_PATH = f"pack/{ARCHIVE_NAME}"
+ARCHIVE_GZ_PATH = f"pack/{ARCHIVE_GZ_NAME}"
+
+_TOC_SCHEMA = "x07.website.agent.pack_toc@v1"
+
+_BLOCK = 512
+_RECORD = 20 * _BLOCK
+_CHUNK_SIZE = 1024 * 1024
+
+
+def is_packed(rel: str) -> bool:
+    if rel.startswith("pack/"):
+        return False
+    return rel != "manifest.json" and not _manifest_views.is_view_path(rel)
+
+
+def _padded(size: int) -> int:
+    return -(-size // _BLOCK) * _BLOCK
+
+
+def _split_name(name: str) -> tuple[str, str]:
+    raw = name.encode("utf-8")
+    if len(raw) <= 100:
+        return "", name
+    # ustar stores long paths as prefix (<= 155 bytes) + "/" + name (<= 100 bytes).
+    for i, ch in enumerate(name):
+        if ch != "/":
+            continue
+        prefix, rest = name[:i], name[i + 1 :]
+        if len(prefix.encode("utf-8")) <= 155 and 0 < len(rest.encode("utf-8")) <= 100:
+            return prefix, rest
+    raise SystemExit(f"path too long for an agent pack (ustar): {name}")
+
+
+def _octal(value: int, width: int) -> bytes:
+    return f"{value:0{width - 1}o}".encode("ascii") + b"\0"
+
+
+def ustar_header(name: str, size: int) -> bytes:
+    prefix, short = _split_name(name)
+    header = bytearray(_BLOCK)
+    header[0:100] = short.encode("utf-8").ljust(100, b"\0")
+    header[100:108] = _octal(0o644, 8)
+    header[108:116] = _octal(0, 8)
+    header[116:124] = _octal(0, 8)
+    header[124:136] = _octal(size, 12)
+    header[136:148] = _octal(0, 12)
+    header[148:156] = b" " * 8
+    header[156:157] = b"0"
+    header[257:263] = b"ustar\0"
+    header[263:265] = b"00"
+    header[329:337] = _octal(0, 8)
+    header[337:345] = _octal(0, 8)
+    header[345:500] = prefix.encode("utf-8").ljust(155, b"\0")
+    header[148:156] = f"{sum(header):06o}".encode("ascii") + b"\0 "
+    return bytes(header)
+
+
+def dumps_toc(toc: dict) -> bytes:
+    return (json.dumps(toc, indent=2) + "\n").encode("utf-8")
+
+
+def build_toc(tree: _tree_model.Node) -> dict:
+    """TOC for the agent dir scanned as `tree` (sizes and digests come from the model)."""
+    members: list[dict] = []
+    offset = 0
+    for node in tree.walk_files():
+        rel = tree.rel_of(node)
+        if not is_packed(rel):
+            continue
+        offset += len(ustar_header(rel, node.size))
+        members.append({"path": rel, "offset": offset, "size": node.size, "sha256": node.sha256})
+        offset += _padded(node.size)
+    return {
+        "schema_version": _TOC_SCHEMA,
+        "archive": ARCHIVE_NAME,
+        "archive_gz": ARCHIVE_GZ_NAME,
+        "format": "ustar",
+        "toc_member": TOC_PATH,
+        "members": members,
+    }
+
+
+def write_archive(agent_dir: Path, toc: dict, out: BinaryIO) -> int:
+    """Stream the tar described by `toc` to `out`; fails if a member changed since the TOC was built."""
+    written = 0
+
+    def emit(data: bytes) -> None:
+        nonlocal written
+        out.write(data)
+        written += len(data)
+
+    for m in toc["members"]:
+        emit(ustar_header(m["path"], m["size"]))
+        if written != m["offset"]:
+            raise SystemExit(f"agent pack offset mismatch: {agent_dir / m['path']}")
+        h = hashlib.sha256()
+        size = 0
+        with (agent_dir / m["path"]).open("rb") as f:
+            for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+                h.update(chunk)
+                size += len(chunk)
+                emit(chunk)
+        if (size, h.hexdigest()) != (m["size"], m["sha256"]):
+            raise SystemExit(f"agent pack member changed while it was packed: {agent_dir / m['path']}")
+        emit(b"\0" * (_padded(size) - size))
+
+    toc_bytes = dumps_toc(toc)
+    emit(ustar_header(TOC_PATH, len(toc_bytes)))
+    emit(toc_bytes + b"\0" * (_padded(len(toc_bytes)) - len(toc_bytes)))
+    emit(b"\0" * (2 * _BLOCK))
+    emit(b"\0" * (-written % _RECORD))
+    return written
+
+
+class _DigestWriter:
+    """Write-only sink that keeps the size and sha256 of what it is given."""
+
+    def __init__(self) -> None:
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        self.sha256.update(data)
+        self.size += len(data)
+        return len(data)
+
+
+def _digest_of(path: Path) -> tuple[int, str] | None:
+    if not path.is_file():
+        return None
+    return path.stat().st_size, _hash_cache.sha256_file(path)
+
+
+def check_archives(agent_dir: Path, out_dir: Path) -> list[str]:
+    """Names of the pack files in `out_dir` that are missing or differ from a fresh build of `agent_dir`.
+
+    The .tar.gz is checked by its decompressed bytes, so the result does not depend on the zlib build.
+    """
+    toc = build_toc(_tree_model.scan(agent_dir))
+    tar = _DigestWriter()
+    write_archive(agent_dir, toc, tar)
+    toc_bytes = dumps_toc(toc)
+    stale: list[str] = []
+    if not _hash_cache.file_matches(out_dir / Path(TOC_PATH).name, toc_bytes):
+        stale.append(Path(TOC_PATH).name)
+    if _digest_of(out_dir / ARCHIVE_NAME) != (tar.size, tar.sha256.hexdigest()):
+        stale.append(ARCHIVE_NAME)
+    gz_path = out_dir / ARCHIVE_GZ_NAME
+    unpacked = _DigestWriter()
+    try:
+        with gzip.open(gz_path, "rb") as gz:
+            for chunk in iter(lambda: gz.read(_CHUNK_SIZE), b""):
+                unpacked.write(chunk)
+    except (OSError, EOFError):
+        stale.append(ARCHIVE_GZ_NAME)
+    else:
+        if (unpacked.size, unpacked.sha256.hexdigest()) != (tar.size, tar.sha256.hexdigest()):
+            stale.append(ARCHIVE_GZ_NAME)
+    return stale
+
+
+def build_archives(agent_dir: Path, out_dir: Path) -> tuple[int, int]:
+    """Write toc.json, agent-pack.tar and agent-pack.tar.gz for `agent_dir` into `out_dir`.
+
+    Returns the sizes of the two archives.
+    """
+    toc = build_toc(_tree_model.scan(agent_dir))
+    out_dir.mkdir(parents=True, exist_ok=True)
+    toc_path = out_dir / Path(TOC_PATH).name
+    toc_bytes = dumps_toc(toc)
+    if not _hash_cache.file_matches(toc_path, toc_bytes):
+        _content_store.atomic_write_bytes(toc_path, toc_bytes)
+
+    tar_path = out_dir / ARCHIVE_NAME
+    tmp = tar_path.with_name(f".{ARCHIVE_NAME}.tmp")
+    with tmp.open("wb") as f:
+        tar_size = write_archive(agent_dir, toc, f)
+    tmp.replace(tar_path)
+
+    gz_path = out_dir / ARCHIVE_GZ_NAME
+    tmp = gz_path.with_name(f".{ARCHIVE_GZ_NAME}.tmp")
+    with tmp.open("wb") as raw, tar_path.open("rb") as src:
+        with gzip.GzipFile(filename="", mode="wb", compresslevel=9, fileobj=raw, mtime=0) as gz:
+            for chunk in iter(lambda: src.read(_CHUNK_SIZE), b""):
+                gz.write(chunk)
+    tmp.replace(gz_path)
+    return tar_size, gz_path.stat().st_size
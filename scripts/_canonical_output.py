@@ -0,0 +1,84 @@
+"""
+Canonical rendering of generated outputs, compared by digest.
+
+Generated JSON and text files are rendered as a stream of str chunks (JSON via
+`json.JSONEncoder.iterencode`) with LF line endings and one trailing newline.
+`status` hashes that stream and compares it with the on-disk file's digest from
+the shared hash cache, so an up-to-date output is checked without reading it
+or holding a second copy of the document in memory. Only when the digests
+differ is the file read, to accept copies that differ in line endings alone
+(e.g. a CRLF checkout).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+import _content_store
+import _hash_cache
+
+
+# Chunks are buffered and hashed in batches; iterencode yields many tiny strings.
+_BATCH_CHUNKS = 4096
+
+_TEXT_SLICE = 1024 * 1024
+
+
+def json_chunks(obj: object, *, sort_keys: bool = False, ensure_ascii: bool = True) -> Iterator[str]:
+    """`json.dumps(obj, indent=2, ...)` plus a trailing newline, as a stream."""
+    encoder = json.JSONEncoder(indent=2, sort_keys=sort_keys, ensure_ascii=ensure_ascii)
+    yield from encoder.iterencode(obj)
+    yield "\n"
+
+
+def text_chunks(content: str) -> Iterator[str]:
+    """`content` with LF line endings and exactly one trailing newline guaranteed."""
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    for i in range(0, len(content), _TEXT_SLICE):
+        yield content[i : i + _TEXT_SLICE]
+    if not content.endswith("\n"):
+        yield "\n"
+
+
+def digest(chunks: Iterable[str]) -> tuple[str, int]:
+    """(sha256, size in bytes) of the UTF-8 encoding of the stream."""
+    h = hashlib.sha256()
+    size = 0
+    batch: list[str] = []
+    for chunk in chunks:
+        batch.append(chunk)
+        if len(batch) >= _BATCH_CHUNKS:
+            data = "".join(batch).encode("utf-8")
+            h.update(data)
+            size += len(data)
+            batch.clear()
+    data = "".join(batch).encode("utf-8")
+    h.update(data)
+    size += len(data)
+    return h.hexdigest(), size
+
+
+def status(path: Path, render: Callable[[], Iterable[str]]) -> str:
+    """Compare `render()` with the file at `path`: "same", "missing" or "stale"."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return "missing"
+    expected, size = digest(render())
+    if st.st_size == size and _hash_cache.sha256_file(path) == expected:
+        return "same"
+    data = path.read_bytes()
+    if b"\r" in data:
+        data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        if hashlib.sha256(data).hexdigest() == expected:
+            return "same"
+    return "stale"
+
+
+def write(path: Path, render: Callable[[], Iterable[str]]) -> None:
+    # Replace instead of truncating: the file may be hardlinked into the object store.
+    _content_store.atomic_write_bytes(path, "".join(render()).encode("utf-8"))
@@ -0,0 +1,116 @@
+"""
+Change scoping for the check scripts (`--since <git-rev>`).
+
+`from_git(root, since)` lists the paths that differ between `since` and the
+working tree (committed, staged, unstaged and untracked; renames count as a
+delete plus an add) and maps them to the units the checkers validate:
+
+  docs/vX.Y.Z/**, agent/vX.Y.Z/**       -> toolchain version X.Y.Z
+  docs/latest/**, agent/latest/**       -> latest (and the version it aliases)
+  site/src/pages/agent/_agent_data/**   -> latest (generated from agent/latest)
+  site/static/install/**                -> install manifests
+
+A change that can affect every unit makes the scope full: the check scripts
+themselves (scripts/**), the CI workflows (.github/**), versions/,
+site/static/versions/, docs/_overlays/, any agent/*/manifest.json (newer
+versions' manifest deltas are built from older manifests), and any other path
+under docs/ or agent/. Everything else (the rest of site/src, blog posts,
+README) maps to no unit; the generated Docusaurus inputs listed in
+site/.gitignore never show up as changes.
+
+Scoped runs are for pull requests; the unscoped runs on main remain the
+safety net.
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import re
+import subprocess
+
+
+_VERSION_DIR_RE = re.compile(r"^(?:docs|agent)/v(\d+\.\d+\.\d+)/")
+
+_FULL_PREFIXES = ("scripts/", ".github/", "versions/", "site/static/versions/", "docs/_overlays/")
+_LATEST_PREFIXES = ("docs/latest/", "agent/latest/", "site/src/pages/agent/_agent_data/")
+
+
+class Scope:
+    def __init__(self, *, since: str, paths: list[str]) -> None:
+        self.since = since
+        self.paths = set(paths)
+        self.full = False
+        self.latest = False
+        self.install = False
+        self.versions: set[str] = set()
+        for rel in sorted(self.paths):
+            self._add(rel)
+
+    def _add(self, rel: str) -> None:
+        if rel.startswith(_FULL_PREFIXES):
+            self.full = True
+        elif rel.startswith("agent/") and rel.endswith("/manifest.json") and rel.count("/") == 2:
+            self.full = True
+        elif rel.startswith(_LATEST_PREFIXES):
+            self.latest = True
+        elif rel.startswith("site/static/install/"):
+            self.install = True
+        elif m := _VERSION_DIR_RE.match(rel):
+            self.versions.add(m.group(1))
+        elif rel.startswith(("docs/", "agent/")):
+            self.full = True
+
+    def covers_version(self, version: str) -> bool:
+        return self.full or version in self.versions
+
+    def covers_latest(self, latest_version: str | None) -> bool:
+        # agent/latest and docs/latest must stay identical to the version they alias.
+        return self.full or self.latest or (latest_version is not None and latest_version in self.versions)
+
+    def covers_install(self) -> bool:
+        return self.full or self.install
+
+    def covers_path(self, rel: str) -> bool:
+        return self.full or rel in self.paths
+
+    def describe(self) -> str:
+        if self.full:
+            return f"full (shared inputs changed since {self.since})"
+        units = [f"v{v}" for v in sorted(self.versions)]
+        if self.latest:
+            units.append("latest")
+        if self.install:
+            units.append("install")
+        return f"{', '.join(units) or 'nothing to check'} (changed since {self.since})"
+
+
+def _git_paths(root: Path, args: list[str]) -> list[str]:
+    proc = subprocess.run(["git", "-C", str(root), *args], check=False, capture_output=True)
+    if proc.returncode != 0:
+        raise SystemExit(f"git {' '.join(args)} failed: {proc.stderr.decode('utf-8', 'replace').strip()}")
+    return [p.decode("utf-8") for p in proc.stdout.split(b"\0") if p]
+
+
+def from_git(root: Path, since: str) -> Scope:
+    changed = _git_paths(root, ["diff", "--name-only", "--no-renames", "-z", since, "--"])
+    untracked = _git_paths(root, ["ls-files", "--others", "--exclude-standard", "-z"])
+    return Scope(since=since, paths=changed + untracked)
+
+
+def add_argument(ap: argparse.ArgumentParser) -> None:
+    ap.add_argument(
+        "--since",
+        metavar="GIT_REV",
+        default=None,
+        help="only validate the units affected by changes since this git revision (see scripts/_change_scope.py)",
+    )
+
+
+def from_args(root: Path, since: str | None) -> Scope | None:
+    """Scope for `--since`, or None for an unscoped run."""
+    if since is None:
+        return None
+    scope = from_git(root, since)
+    print(f"scope: {scope.describe()}")
+    return scope
@@ -0,0 +1,65 @@
+"""
+Structured results of check_site.py: every violation with its rule id, file and
+JSON pointer, plus wall-clock time, file count and violation count per phase.
+
+Written by `check_site.py --check --json-report PATH`, which keeps checking
+after a failed phase so one run lists every problem.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import time
+from typing import Iterator
+
+
+SCHEMA_VERSION = "x07.website.check-site-report@0.1.0"
+
+
+class Report:
+    def __init__(self) -> None:
+        self.violations: list[dict] = []
+        self.phases: list[dict] = []
+        # Rule id used for violations that do not name one; set by the section being checked.
+        self.rule = "site.structure"
+        self._current: dict | None = None
+
+    def add(
+        self, message: str, *, rule: str | None = None, path: str | None = None, pointer: str | None = None
+    ) -> None:
+        self.violations.append(
+            {
+                "rule": rule or self.rule,
+                "path": path,
+                "pointer": pointer,
+                "message": message,
+                "phase": self._current["name"] if self._current is not None else None,
+            }
+        )
+
+    def count_files(self, n: int) -> None:
+        if self._current is not None:
+            self._current["files"] += n
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[dict]:
+        entry = {"name": name, "seconds": 0.0, "files": 0, "violations": 0}
+        before = len(self.violations)
+        outer, self._current = self._current, entry
+        start = time.perf_counter()
+        try:
+            yield entry
+        finally:
+            entry["seconds"] = round(time.perf_counter() - start, 3)
+            entry["violations"] = len(self.violations) - before
+            self._current = outer
+            self.phases.append(entry)
+
+    def to_json(self) -> dict:
+        return {
+            "schema_version": SCHEMA_VERSION,
+            "ok": not self.violations,
+            "seconds": round(sum(p["seconds"] for p in self.phases), 3),
+            "phases": self.phases,
+            "violations": self.violations,
+        }
@@ -0,0 +1,201 @@
+"""
+Content-addressed object store shared by the sync and index scripts.
+
+Blobs live under <store>/sha256/<aa>/<digest>. Version trees (docs/vX.Y.Z,
+docs/latest, agent/vX.Y.Z, agent/latest) are materialized as hardlinks into
+the store, so identical files across versions share one inode on disk.
+
+Objects hold their own copy of the bytes (never a link to the file they were
+added from) and are read-only (0444); an existing object is re-hashed before
+it is reused, so a damaged blob is replaced instead of spreading. Because
+linked files still share an inode, writers must replace files (write to a
+sibling temp file + rename) instead of truncating them in place; use
+`atomic_write_bytes` / `atomic_write_text` for any file that may be linked.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+import shutil
+import tempfile
+from typing import BinaryIO
+
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+def sha256_file(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def object_path(store: Path, digest: str) -> Path:
+    return store / "sha256" / digest[:2] / digest
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def atomic_write_text(path: Path, content: str) -> None:
+    atomic_write_bytes(path, content.encode("utf-8"))
+
+
+def link_or_copy(src: Path, dst: Path) -> None:
+    """Replace `dst` with a hardlink to `src` (a copy when linking is not possible)."""
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    # Per-process temp name: parallel sync workers may link the same object at once.
+    tmp = dst.with_name(f".{dst.name}.{os.getpid()}.link.tmp")
+    tmp.unlink(missing_ok=True)
+    try:
+        os.link(src, tmp)
+    except OSError:
+        # Cross-device store or a filesystem without hardlinks: fall back to a copy.
+        shutil.copyfile(src, tmp)
+    os.replace(tmp, dst)
+
+
+def _spool(f: BinaryIO, tmp_dir: Path) -> tuple[str, str, int]:
+    """Copy `f` into a new temp file in `tmp_dir`; return (temp path, sha256, size)."""
+    tmp_dir.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=".spool.", suffix=".tmp", dir=tmp_dir)
+    try:
+        h = hashlib.sha256()
+        size = 0
+        with os.fdopen(fd, "wb") as out:
+            for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+                h.update(chunk)
+                size += len(chunk)
+                out.write(chunk)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return tmp, h.hexdigest(), size
+
+
+def _write_object(obj: Path, src: Path, digest: str) -> None:
+    with src.open("rb") as f:
+        tmp, actual, _ = _spool(f, obj.parent)
+    try:
+        if actual != digest:
+            raise ValueError(f"{src} changed while it was added to the store")
+        os.chmod(tmp, 0o444)
+        os.replace(tmp, obj)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _object_ok(obj: Path, digest: str) -> bool:
+    return obj.is_file() and sha256_file(obj) == digest
+
+
+def put_file(store: Path, src: Path, *, digest: str | None = None) -> str:
+    """Copy `src` into the store unless an intact object with its content exists; return its digest."""
+    if digest is None:
+        digest = sha256_file(src)
+    obj = object_path(store, digest)
+    if not _object_ok(obj, digest):
+        _write_object(obj, src, digest)
+    return digest
+
+
+def link_file(store: Path, digest: str, dst: Path) -> None:
+    """Replace `dst` with a hardlink to the object `digest` (added with `put_file` first)."""
+    obj = object_path(store, digest)
+    if not obj.is_file():
+        raise FileNotFoundError(f"object not in store: {digest}")
+    if dst.is_file():
+        try:
+            if os.path.samefile(obj, dst):
+                return
+        except OSError:
+            pass
+    link_or_copy(obj, dst)
+
+
+def dedupe_tree(store: Path, root: Path) -> int:
+    """Replace every file under `root` with a hardlink into the store.
+
+    Returns the number of files that were relinked.
+    """
+    relinked = 0
+    for dirpath, _, filenames in os.walk(root):
+        for name in sorted(filenames):
+            p = Path(dirpath) / name
+            if p.is_symlink() or not p.is_file():
+                continue
+            digest = sha256_file(p)
+            obj = object_path(store, digest)
+            if obj.is_file() and os.path.samefile(obj, p):
+                # Already linked; hashing `p` just verified the object.
+                continue
+            put_file(store, p, digest=digest)
+            link_file(store, digest, p)
+            relinked += 1
+    return relinked
+
+
+def copy_file(src: Path, dst: Path, *, store: Path | None) -> None:
+    """Copy `src` to `dst`, sharing bytes through the store when one is configured."""
+    if store is None:
+        atomic_write_bytes(dst, src.read_bytes())
+        return
+    link_file(store, put_file(store, src), dst)
+
+
+def write_stream(dst: Path, f: BinaryIO, *, store: Path | None) -> tuple[str, int]:
+    """Write the bytes read from `f` to `dst` in one pass, through the store when one is configured.
+
+    Returns (sha256, size). Without a store the bytes land in a temp file next to `dst`; with
+    one they land in the store, become the object (unless an intact one exists) and `dst`
+    is linked to it.
+    """
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    tmp, digest, size = _spool(f, dst.parent if store is None else store / "sha256")
+    try:
+        if store is None:
+            os.chmod(tmp, 0o644)
+            os.replace(tmp, dst)
+            return digest, size
+        obj = object_path(store, digest)
+        if _object_ok(obj, digest):
+            Path(tmp).unlink()
+        else:
+            obj.parent.mkdir(parents=True, exist_ok=True)
+            os.chmod(tmp, 0o444)
+            os.replace(tmp, obj)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    link_file(store, digest, dst)
+    return digest, size
+
+
+def copy_tree(src: Path, dst: Path, *, store: Path | None, ignore=None) -> None:
+    """`shutil.copytree` equivalent that materializes `dst` as hardlinks into the store.
+
+    Existing files are replaced, never written in place, even without a store: they may be
+    links into a store from an earlier run.
+    """
+    shutil.copytree(
+        src,
+        dst,
+        ignore=ignore,
+        dirs_exist_ok=True,
+        copy_function=lambda s, d: copy_file(Path(s), Path(d), store=store),
+    )
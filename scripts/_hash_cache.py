@@ -0,0 +1,72 @@
+"""
+Persistent sha256 cache shared by the sync, generate and check scripts.
+
+Entries are keyed by (st_dev, st_ino, st_size, st_mtime_ns). A file whose stat
+key is unchanged since it was last hashed is not read again; any change to the
+key falls back to rehashing. The cache lives in .x07-cache/hash-cache.json at
+the repo root (override with X07_WEBSITE_HASH_CACHE, disable with
+X07_WEBSITE_HASH_CACHE=off).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+import time
+
+import _content_store
+import _json_cache
+
+
+# Files modified this recently may still change within the same mtime tick;
+# hash them but do not remember the result (same idea as git's "racy" check).
+_RACY_WINDOW_NS = 2_000_000_000
+
+_cache = _json_cache.JsonCache(
+    env_var="X07_WEBSITE_HASH_CACHE",
+    file_name="hash-cache.json",
+    schema_version="x07.website.hash-cache@0.1.0",
+    # Upper bound on remembered entries; stale keys beyond it are dropped on save.
+    max_entries=500_000,
+    valid=lambda v: isinstance(v, str),
+)
+
+cache_path = _cache.path
+save = _cache.save
+
+
+def _stat_key(st: os.stat_result) -> str:
+    return f"{st.st_dev}:{st.st_ino}:{st.st_size}:{st.st_mtime_ns}"
+
+
+def sha256_file(path: Path) -> str:
+    st = path.stat()
+    key = _stat_key(st)
+    digest = _cache.get(key)
+    if digest is not None:
+        return digest
+
+    digest = _content_store.sha256_file(path)
+    if time.time_ns() - st.st_mtime_ns > _RACY_WINDOW_NS:
+        _cache.put(key, digest)
+    return digest
+
+
+def files_equal(a: Path, b: Path) -> bool:
+    """Content equality via stat sizes and cached digests (no full reads for unchanged files)."""
+    st_a = a.stat()
+    st_b = b.stat()
+    if (st_a.st_dev, st_a.st_ino) == (st_b.st_dev, st_b.st_ino):
+        return True
+    if st_a.st_size != st_b.st_size:
+        return False
+    return sha256_file(a) == sha256_file(b)
+
+
+def file_matches(path: Path, data: bytes) -> bool:
+    """True if `path` is a file holding exactly `data` (size first, then the cached digest)."""
+    if not path.is_file() or path.stat().st_size != len(data):
+        return False
+    return sha256_file(path) == hashlib.sha256(data).hexdigest()
+
@@ -0,0 +1,545 @@
+"""
+Declarative validation of an agent dir's index.json and the item indexes it
+points to (schemas, examples, examples catalog, packages, catalog,
+capabilities, skills).
+
+Each index is described by an `IndexRule`: the index.json field naming it, its
+schema_version, required item keys, string fields, URL fields (with the prefix
+they must live under and whether the item carries the target's sha256/size),
+the sort order, and the item ids the agent dir implies. Checks that do not fit
+the common shape are per-rule hooks. `check_index` runs one rule and returns
+every problem it finds, each with a JSON pointer into the index.
+
+Rules run against an `AgentDirView`: the agent dir scanned once with
+_tree_model, so existence checks, sizes and digests cost no further stat
+calls, and a memoized JSON loader, so every file is parsed at most once.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+from pathlib import Path
+from typing import Callable, Iterable
+
+import _agent_pack
+import _manifest_views
+import _symbol_index
+import _tree_model
+from _tree_model import Node
+
+
+class AgentDirView:
+    def __init__(self, root: Path, agent_dir: Path, tree: Node) -> None:
+        self.root = root
+        self.agent_dir = agent_dir
+        self.tree = tree
+        self.rel = agent_dir.relative_to(root).as_posix()
+        self.url_prefix = f"/{self.rel}"
+        self.index: dict = {}
+        self._json: dict[Path, object] = {}
+        self._scans: dict[Path, Node] = {}
+
+    def load_json(self, path: Path) -> object:
+        """Parsed JSON at `path`, loaded once; raises ValueError like check_site's read_json."""
+        if path not in self._json:
+            try:
+                self._json[path] = json.loads(path.read_text(encoding="utf-8"))
+            except Exception as e:
+                raise ValueError(f"{path} invalid JSON: {e}")
+        return self._json[path]
+
+    def scan(self, path: Path) -> Node:
+        """Tree model of another directory (e.g. the matching docs tree), scanned once."""
+        if path not in self._scans:
+            self._scans[path] = _tree_model.scan(path)
+        return self._scans[path]
+
+    def node_for_url(self, url: str) -> Node | None:
+        """File node for a site URL inside this agent dir, or None."""
+        if not url.startswith(f"{self.url_prefix}/"):
+            return None
+        node = self.tree.get(url[len(self.url_prefix) + 1 :])
+        return node if node is not None and not node.is_dir else None
+
+    def dirs_named(self, names: set[str]) -> list[Node]:
+        out: list[Node] = []
+        stack = [self.tree]
+        while stack:
+            node = stack.pop()
+            for name, child in sorted(node.children.items()):
+                if child.is_dir:
+                    if name in names:
+                        out.append(child)
+                    stack.append(child)
+        return sorted(out, key=lambda n: n.rel)
+
+
+@dataclass(frozen=True)
+class Problem:
+    path: Path
+    pointer: str | None
+    message: str
+
+
+def pointer(*tokens: object) -> str:
+    """RFC 6901 JSON pointer for the given reference tokens."""
+    return "".join("/" + str(t).replace("~", "~0").replace("/", "~1") for t in tokens)
+
+
+# ---- index.json ----
+
+
+@dataclass(frozen=True)
+class IndexField:
+    name: str
+    required: bool
+    kind: str  # "file" | "dir" | "built" (written at site build time, not in the tree)
+    exact: str | None = None
+
+
+INDEX_FIELDS: tuple[IndexField, ...] = (
+    IndexField("manifest_url", True, "file"),
+    IndexField("manifest_index_url", False, "built", exact=_manifest_views.INDEX_PATH),
+    IndexField("schemas_dir", True, "dir"),
+    IndexField("skills_dir", True, "dir"),
+    IndexField("examples_dir", True, "dir"),
+    IndexField("packages_dir", False, "dir"),
+    IndexField("stdlib_index_url", True, "file"),
+    IndexField("schemas_index_url", True, "file"),
+    IndexField("skills_index_url", True, "file"),
+    IndexField("examples_index_url", True, "file"),
+    IndexField("examples_catalog_index_url", False, "file"),
+    IndexField("packages_index_url", False, "file"),
+    IndexField("catalog_index_url", False, "file"),
+    IndexField("capabilities_index_url", False, "file"),
+    IndexField("symbols_index_url", False, "built", exact=_symbol_index.INDEX_PATH),
+    IndexField("pack_toc_url", False, "built", exact=_agent_pack.TOC_PATH),
+    IndexField("pack_archive_url", False, "built", exact=_agent_pack.ARCHIVE_PATH),
+    IndexField("pack_archive_gz_url", False, "built", exact=_agent_pack.ARCHIVE_GZ_PATH),
+)
+
+
+def check_index_fields(view: AgentDirView) -> list[Problem]:
+    """Type, value and target checks for the INDEX_FIELDS of the agent dir's index.json."""
+    index_path = view.agent_dir / "index.json"
+    index_rel = index_path.relative_to(view.root)
+    problems: list[Problem] = []
+    targets: list[tuple[IndexField, str]] = []
+    for f in INDEX_FIELDS:
+        v = view.index.get(f.name)
+        if v is None and not f.required:
+            continue
+        if not isinstance(v, str) or not v:
+            when = "" if f.required else " when present"
+            message = f"{index_rel} {f.name} must be non-empty string{when}"
+            problems.append(Problem(index_path, pointer(f.name), message))
+        elif f.exact is not None and v != f.exact:
+            problems.append(Problem(index_path, pointer(f.name), f"{index_rel} {f.name} must be {f.exact!r}"))
+        else:
+            targets.append((f, v))
+    if problems:
+        return problems
+    for f, v in targets:
+        if f.kind == "built":
+            continue
+        node = view.tree.get(v)
+        if node is None or node.is_dir != (f.kind == "dir"):
+            problems.append(Problem(index_path, pointer(f.name), f"missing {view.rel}/{v}"))
+    return problems
+
+
+# ---- item indexes ----
+
+
+@dataclass(frozen=True)
+class UrlField:
+    key: str
+    prefix: str  # relative to the agent dir URL, e.g. "schemas/"
+    nullable: bool = False
+    digest: bool = False  # the item's sha256/size describe this target
+
+
+ItemHook = Callable[[AgentDirView, dict], Iterable[tuple[str, str | None] | Problem]]
+IndexHook = Callable[[AgentDirView, dict], Iterable[str]]
+
+
+@dataclass(frozen=True)
+class IndexRule:
+    rule_id: str
+    url_field: str  # index.json field naming the index
+    schema_version: str
+    required_keys: tuple[str, ...]
+    id_keys: tuple[str, ...] = ("id",)
+    string_fields: tuple[str, ...] = ("id",)
+    nullable_string_fields: tuple[str, ...] = ()
+    urls: tuple[UrlField, ...] = ()
+    # Sort key over the id tuple, or None when the order is given by expected_ids.
+    sort_key: Callable[[tuple], object] | None = lambda ids: ids
+    sort_label: str = "id"
+    # Item ids (tuples of id_keys values) the agent dir implies, in index order.
+    expected_ids: Callable[[AgentDirView], list[tuple]] | None = None
+    expected_label: str = ""
+    # Runs before the items; any message stops the rule.
+    check_index: IndexHook | None = None
+    # Extra per-item checks: (message, key or None) pairs about the item, or Problems in other files.
+    check_item: ItemHook | None = None
+
+
+def check_index(view: AgentDirView, rule: IndexRule) -> list[Problem]:
+    """Every problem of the index named by `rule.url_field` (which must be set in index.json)."""
+    index_path = view.agent_dir / view.index[rule.url_field]
+    index_rel = index_path.relative_to(view.root)
+
+    def problem(message: str, *tokens: object) -> Problem:
+        return Problem(index_path, pointer(*tokens) if tokens else None, f"{index_rel} {message}")
+
+    try:
+        doc = view.load_json(index_path)
+    except ValueError as e:
+        return [Problem(index_path, None, str(e))]
+    if not isinstance(doc, dict):
+        return [Problem(index_path, "", f"{index_rel} must be a JSON object")]
+    if doc.get("schema_version") != rule.schema_version:
+        return [problem("schema_version mismatch", "schema_version")]
+    items = doc.get("items")
+    if not isinstance(items, list):
+        return [problem("items must be an array", "items")]
+
+    problems: list[Problem] = []
+    if rule.check_index is not None:
+        try:
+            problems.extend(Problem(index_path, None, message) for message in rule.check_index(view, doc))
+        except ValueError as e:
+            problems.append(Problem(index_path, None, str(e)))
+        if problems:
+            return problems
+
+    ids: list[tuple] = []
+    for i, it in enumerate(items):
+        if not isinstance(it, dict):
+            problems.append(problem("items must be objects", "items", i))
+            continue
+        missing = [k for k in rule.required_keys if k not in it]
+        if missing:
+            problems.extend(problem(f"items[*] missing key: {k}", "items", i) for k in missing)
+            continue
+        bad = [k for k in rule.string_fields if not isinstance(it.get(k), str) or not it.get(k)]
+        problems.extend(problem(f"item.{k} must be non-empty string", "items", i, k) for k in bad)
+        problems.extend(
+            problem(f"item.{k} must be string|null", "items", i, k)
+            for k in rule.nullable_string_fields
+            if it.get(k) is not None and not isinstance(it.get(k), str)
+        )
+        if bad:
+            continue
+        ids.append(tuple(it[k] for k in rule.id_keys))
+
+        for u in rule.urls:
+            url = it.get(u.key)
+            if url is None and u.nullable:
+                continue
+            if not isinstance(url, str) or not url:
+                kind = "string|null" if u.nullable else "non-empty string"
+                problems.append(problem(f"item.{u.key} must be {kind}", "items", i, u.key))
+                continue
+            prefix = f"{view.url_prefix}/{u.prefix}"
+            if not url.startswith(prefix):
+                problems.append(problem(f"item.{u.key} must start with {prefix}", "items", i, u.key))
+                continue
+            node = view.node_for_url(url)
+            if node is None:
+                label = "url" if u.key == "url" else u.key
+                problems.append(problem(f"missing file for {label}: {url}", "items", i, u.key))
+                continue
+            # Items carry sha256/size of their target so clients can revalidate cached copies.
+            if u.digest and (it.get("size") != node.size or it.get("sha256") != node.sha256):
+                problems.append(
+                    problem(f"sha256/size mismatch for {node.path.relative_to(view.root)}", "items", i)
+                )
+
+        if rule.check_item is not None:
+            try:
+                for found in rule.check_item(view, it):
+                    if isinstance(found, Problem):
+                        problems.append(found)
+                        continue
+                    message, key = found
+                    problems.append(problem(message, *(("items", i, key) if key else ("items", i))))
+            except ValueError as e:
+                problems.append(Problem(index_path, pointer("items", i), str(e)))
+
+    if problems:
+        return problems
+    if rule.sort_key is not None and ids != sorted(ids, key=rule.sort_key):
+        problems.append(problem(f"items must be sorted by {rule.sort_label}", "items"))
+    if rule.expected_ids is not None:
+        try:
+            expected = rule.expected_ids(view)
+        except ValueError as e:
+            return problems + [Problem(index_path, None, str(e))]
+        if ids != expected:
+            problems.append(problem(f"items do not match {rule.expected_label}", "items"))
+    return problems
+
+
+def parse_semver(v: str) -> tuple[int, int, int] | None:
+    parts = v.split(".")
+    if len(parts) != 3:
+        return None
+    try:
+        major, minor, patch = (int(p) for p in parts)
+    except ValueError:
+        return None
+    if major < 0 or minor < 0 or patch < 0:
+        return None
+    return (major, minor, patch)
+
+
+def _package_sort_key(ids: tuple) -> tuple:
+    name, version = ids
+    return (name, parse_semver(version) or (0, 0, 0), version)
+
+
+def _dir_files(view: AgentDirView, field_name: str, suffix: str) -> list[Node]:
+    node = view.tree.get(view.index[field_name])
+    return node.files(suffix) if node is not None and node.is_dir else []
+
+
+def _expected_schema_ids(view: AgentDirView) -> list[tuple]:
+    return sorted((n.name,) for n in _dir_files(view, "schemas_dir", ".schema.json"))
+
+
+def _expected_example_ids(view: AgentDirView) -> list[tuple]:
+    return sorted((n.name.removesuffix(".x07.json"),) for n in _dir_files(view, "examples_dir", ".x07.json"))
+
+
+def _expected_package_ids(view: AgentDirView) -> list[tuple]:
+    packages_root = view.tree.get(view.index.get("packages_dir") or "packages")
+    expected: list[tuple] = []
+    if packages_root is not None and packages_root.is_dir:
+        for pkg_dir in packages_root.dirs():
+            for ver_dir in pkg_dir.dirs():
+                if ver_dir.is_file_at("index.json"):
+                    expected.append((pkg_dir.name, ver_dir.name))
+    return sorted(expected, key=_package_sort_key)
+
+
+def _expected_catalog_ids(view: AgentDirView) -> list[tuple]:
+    catalog = view.tree.get("catalog")
+    if catalog is None or not catalog.is_dir:
+        return []
+    return sorted((n.name.removesuffix(".json"),) for n in catalog.files(".json") if n.name != "index.json")
+
+
+# ---- examples catalog ----
+
+
+def _docs_examples(view: AgentDirView) -> Node:
+    # The catalog mirrors docs/<same version>/examples.
+    if view.rel == "agent/latest":
+        docs_root = view.root / "docs" / "latest" / "examples"
+    elif view.rel.startswith("agent/v"):
+        docs_root = view.root / "docs" / f"v{view.rel.removeprefix('agent/v')}" / "examples"
+    else:
+        raise ValueError(f"unsupported agent dir for examples catalog: {view.rel}")
+    if not docs_root.is_dir():
+        raise ValueError(f"missing docs examples root for catalog: {docs_root.relative_to(view.root)}")
+    return view.scan(docs_root)
+
+
+def _catalog_example_ids(root: Node) -> list[tuple]:
+    return sorted((root.rel_of(n).removesuffix(".x07.json"),) for n in root.walk_files(".x07.json"))
+
+
+def _check_examples_catalog_index(view: AgentDirView, doc: dict) -> Iterable[str]:
+    docs_examples = _docs_examples(view)
+    catalog_files = view.tree.get("examples/catalog-files")
+    if catalog_files is None or not catalog_files.is_dir:
+        yield f"missing catalog files dir: {view.rel}/examples/catalog-files"
+        return
+    if _catalog_example_ids(catalog_files) != _catalog_example_ids(docs_examples):
+        yield f"{view.rel}/{view.index['examples_catalog_index_url']} catalog-files tree does not match docs examples"
+
+
+def _check_examples_catalog_item(view: AgentDirView, it: dict) -> Iterable[tuple[str, str | None]]:
+    rel_path = it.get("path")
+    scope = it.get("scope")
+    if scope is not None and scope not in ("top_level", "nested"):
+        yield "item.scope must be top_level|nested|null", "scope"
+    if not isinstance(rel_path, str) or not rel_path:
+        yield "item.path must be non-empty string", "path"
+        return
+    if not rel_path.endswith(".x07.json"):
+        yield "item.path must end with .x07.json", "path"
+        return
+    expected_url = f"{view.url_prefix}/examples/catalog-files/{rel_path}"
+    if it.get("url") != expected_url:
+        yield f"item.url mismatch: expected {expected_url}", "url"
+        return
+    target = view.node_for_url(expected_url)
+    docs_examples = _docs_examples(view)
+    source = docs_examples.get(rel_path)
+    if source is None or source.is_dir:
+        yield f"missing source docs example file: {(docs_examples.path / rel_path).relative_to(view.root)}", "path"
+    elif target is not None and not _tree_model.same_content(source, target):
+        yield f"catalog file differs from docs source: {target.path.relative_to(view.root)}", "path"
+    expected_scope = "top_level" if len(Path(rel_path).parts) == 1 else "nested"
+    if scope is not None and scope != expected_scope:
+        yield f"item.scope mismatch for {rel_path}", "scope"
+
+
+# ---- capabilities ----
+
+
+def _expected_capability_ids(view: AgentDirView) -> list[tuple]:
+    path = view.agent_dir / "catalog" / "capabilities.json"
+    capabilities = view.load_json(path)
+    if not isinstance(capabilities, dict) or not isinstance(capabilities.get("capabilities"), list):
+        raise ValueError(f"{view.rel}/catalog/capabilities.json capabilities must be an array")
+    return [
+        (c["id"],) for c in capabilities["capabilities"] if isinstance(c, dict) and isinstance(c.get("id"), str)
+    ]
+
+
+def _check_capability_item(view: AgentDirView, it: dict) -> Iterable[tuple[str, str | None]]:
+    package = it.get("package")
+    if package is None:
+        if it.get("modules") != []:
+            yield f"{it['id']}: modules must be empty without a package", "modules"
+        return
+    if not isinstance(package, dict):
+        yield f"{it['id']}: package must be object|null", "package"
+        return
+    url = package.get("url")
+    if not isinstance(url, str) or not url.startswith(f"{view.url_prefix}/packages/"):
+        yield f"{it['id']}: package.url must start with {view.url_prefix}/packages/", "package"
+        return
+    node = view.node_for_url(url)
+    if node is None:
+        yield f"missing file for url: {url}", "package"
+        return
+    if package.get("index_size") != node.size or package.get("index_sha256") != node.sha256:
+        yield f"{it['id']}: package index digest mismatch for {url}", "package"
+    pkg_index = view.load_json(node.path)
+    expected_modules = [
+        {"module_id": m.get("module_id"), "path": m.get("path"), "exports": m.get("exports", [])}
+        for m in (pkg_index.get("modules", []) if isinstance(pkg_index, dict) else [])
+        if isinstance(m, dict)
+    ]
+    if it.get("modules") != expected_modules:
+        yield f"{it['id']}: modules do not match {url}", "modules"
+
+
+# ---- skills ----
+
+
+def _check_skill_item(view: AgentDirView, it: dict) -> Iterable[tuple[str, str | None] | Problem]:
+    docs_url = it["docs_url"]
+    if any(x in docs_url for x in ("/.agent/", "/.codex/")):
+        yield f"item.docs_url must not contain hidden paths: {docs_url}", "docs_url"
+        return
+    node = view.node_for_url(docs_url)
+    if node is None:
+        return
+    skill_root = view.tree.get(node.rel.rsplit("/", 1)[0]) if "/" in node.rel else view.tree
+    skill_rel = skill_root.path.relative_to(view.root)
+    if it.get("tree_sha256") != skill_root.sha256:
+        yield f"tree_sha256 mismatch for {skill_rel}", "tree_sha256"
+
+    # skills/<id>.json carries the same digest; a missing or unreadable descriptor is
+    # reported by check_site's descriptor check.
+    descriptor_rel = f"{view.index['skills_dir'].rstrip('/')}/{it['id']}.json"
+    if not view.tree.is_file_at(descriptor_rel):
+        return
+    descriptor_path = view.agent_dir / descriptor_rel
+    try:
+        descriptor = view.load_json(descriptor_path)
+    except ValueError:
+        return
+    if isinstance(descriptor, dict) and descriptor.get("tree_sha256") != skill_root.sha256:
+        yield Problem(
+            descriptor_path,
+            pointer("tree_sha256"),
+            f"{descriptor_path.relative_to(view.root)} tree_sha256 mismatch for {skill_rel}",
+        )
+
+
+AGENT_INDEX_RULES: tuple[IndexRule, ...] = (
+    IndexRule(
+        rule_id="agent.schemas-index",
+        url_field="schemas_index_url",
+        schema_version="x07.website.agent.schemas_index@v1",
+        required_keys=("id", "url", "sha256", "size"),
+        urls=(UrlField("url", "schemas/", digest=True),),
+        expected_ids=_expected_schema_ids,
+        expected_label="schemas_dir",
+    ),
+    IndexRule(
+        rule_id="agent.examples-index",
+        url_field="examples_index_url",
+        schema_version="x07.website.agent.examples_index@v1",
+        required_keys=("id", "url", "sha256", "size"),
+        nullable_string_fields=("purpose",),
+        urls=(UrlField("url", "examples/", digest=True),),
+        expected_ids=_expected_example_ids,
+        expected_label="examples_dir",
+    ),
+    IndexRule(
+        rule_id="agent.examples-catalog",
+        url_field="examples_catalog_index_url",
+        schema_version="x07.website.agent.examples_catalog_index@v1",
+        required_keys=("id", "url", "path", "sha256", "size"),
+        string_fields=("id", "url", "path"),
+        nullable_string_fields=("purpose",),
+        urls=(UrlField("url", "examples/catalog-files/", digest=True),),
+        expected_ids=lambda view: _catalog_example_ids(_docs_examples(view)),
+        expected_label="docs examples",
+        check_index=_check_examples_catalog_index,
+        check_item=_check_examples_catalog_item,
+    ),
+    IndexRule(
+        rule_id="agent.packages-index",
+        url_field="packages_index_url",
+        schema_version="x07.website.agent.packages_index@v1",
+        required_keys=("name", "version", "url", "sha256", "size"),
+        id_keys=("name", "version"),
+        string_fields=("name", "version"),
+        urls=(UrlField("url", "packages/", digest=True),),
+        sort_key=_package_sort_key,
+        sort_label="name and version",
+        expected_ids=_expected_package_ids,
+        expected_label="packages dir",
+    ),
+    IndexRule(
+        rule_id="agent.catalog-index",
+        url_field="catalog_index_url",
+        schema_version="x07.website.agent.catalog_index@v1",
+        required_keys=("id", "url", "sha256", "size"),
+        urls=(UrlField("url", "catalog/", digest=True),),
+        expected_ids=_expected_catalog_ids,
+        expected_label="catalog dir",
+    ),
+    IndexRule(
+        rule_id="agent.capabilities-index",
+        url_field="capabilities_index_url",
+        schema_version="x07.website.agent.capabilities_index@v1",
+        required_keys=("id", "package", "modules"),
+        sort_key=None,
+        expected_ids=_expected_capability_ids,
+        expected_label="catalog/capabilities.json",
+        check_item=_check_capability_item,
+    ),
+    IndexRule(
+        rule_id="agent.skills-index",
+        url_field="skills_index_url",
+        schema_version="x07.website.agent.skills_index@v1",
+        required_keys=("id", "docs_url", "report_schema_url", "tree_sha256"),
+        string_fields=("id", "docs_url"),
+        urls=(
+            UrlField("docs_url", "skills/"),
+            UrlField("report_schema_url", "schemas/", nullable=True),
+        ),
+        check_item=_check_skill_item,
+    ),
+)
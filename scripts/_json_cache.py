@@ -0,0 +1,101 @@
+"""
+Persistent {key: value} caches under .x07-cache/, shared by _hash_cache and
+_module_exports.
+
+A cache file is {"schema_version", "entries"}; a file with another schema
+version is ignored. save() merges with whatever other processes saved
+meanwhile and, past `max_entries`, keeps only the keys used by this process.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import tempfile
+import threading
+from typing import Callable
+
+
+class JsonCache:
+    def __init__(
+        self,
+        *,
+        env_var: str,
+        file_name: str,
+        schema_version: str,
+        max_entries: int,
+        valid: Callable[[object], bool],
+    ) -> None:
+        self._env_var = env_var
+        self._file_name = file_name
+        self._schema_version = schema_version
+        self._max_entries = max_entries
+        self._valid = valid
+        self._entries: dict[str, object] | None = None
+        self._touched: set[str] = set()
+        self._dirty = False
+        # get/put may be called from worker threads (tree comparisons); guard the first load.
+        self._load_lock = threading.Lock()
+
+    def path(self) -> Path | None:
+        """The cache file: `env_var` overrides the location, "", "0" or "off" disables the cache."""
+        override = os.environ.get(self._env_var)
+        if override is not None:
+            if override in ("", "0", "off"):
+                return None
+            return Path(override)
+        return Path(__file__).resolve().parents[1] / ".x07-cache" / self._file_name
+
+    def _read(self, path: Path) -> dict[str, object]:
+        try:
+            doc = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(doc, dict) or doc.get("schema_version") != self._schema_version:
+            return {}
+        entries = doc.get("entries")
+        if not isinstance(entries, dict):
+            return {}
+        return {k: v for k, v in entries.items() if isinstance(k, str) and self._valid(v)}
+
+    def _load(self) -> dict[str, object]:
+        if self._entries is None:
+            with self._load_lock:
+                if self._entries is None:
+                    path = self.path()
+                    self._entries = self._read(path) if path is not None else {}
+        return self._entries
+
+    def get(self, key: str) -> object | None:
+        value = self._load().get(key)
+        if value is not None:
+            self._touched.add(key)
+        return value
+
+    def put(self, key: str, value: object) -> None:
+        self._load()[key] = value
+        self._touched.add(key)
+        self._dirty = True
+
+    def save(self) -> None:
+        """Persist new entries, merging with whatever other processes saved meanwhile."""
+        path = self.path()
+        if path is None or not self._dirty or self._entries is None:
+            return
+
+        merged = self._read(path)
+        merged.update(self._entries)
+        if len(merged) > self._max_entries:
+            merged = {k: v for k, v in merged.items() if k in self._touched}
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"schema_version": self._schema_version, "entries": merged}, f, separators=(",", ":"))
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self._dirty = False
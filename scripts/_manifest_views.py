@@ -0,0 +1,215 @@
+"""
+Derived views of agent/<dir>/manifest.json for clients that do not want the
+whole file.
+
+  manifest/index.json                  shard + delta listing (with digests)
+  manifest/<section>.json              entries at the top level of a section
+  manifest/<section>/<dir>.json        entries under one top-level directory
+  manifest.delta-from-vX.Y.Z.json      added/changed/removed against an older version
+
+<section> is "human_docs" or "agent". Deltas are published against the
+DELTA_DEPTH closest older versions that have a manifest in the repo. All views
+are pure functions of the manifests, so they are not committed:
+build_manifest_views.py writes them into site/static/agent at site build time
+(and with --check compares the built files with the manifests).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+
+import _content_store
+import _hash_cache
+
+
+DELTA_DEPTH = 3
+
+SECTIONS = ("human_docs", "agent")
+
+_INDEX_SCHEMA = "x07.website.docs-bundle-manifest-index@0.1.0"
+_SHARD_SCHEMA = "x07.website.docs-bundle-manifest-shard@0.1.0"
+_DELTA_SCHEMA = "x07.website.docs-bundle-manifest-delta@0.1.0"
+
+INDEX_PATH = "manifest/index.json"
+
+
+def _parse_semver(v: str) -> tuple[int, int, int] | None:
+    parts = v.split(".")
+    if len(parts) != 3:
+        return None
+    try:
+        return (int(parts[0]), int(parts[1]), int(parts[2]))
+    except ValueError:
+        return None
+
+
+def _dumps(obj: object) -> bytes:
+    return (json.dumps(obj, indent=2) + "\n").encode("utf-8")
+
+
+def delta_path(from_version: str) -> str:
+    return f"manifest.delta-from-v{from_version}.json"
+
+
+def is_view_path(rel: str) -> bool:
+    """True for files under an agent dir that are derived from its manifest.json."""
+    if rel == "manifest" or rel.startswith("manifest/"):
+        return True
+    return "/" not in rel and rel.startswith("manifest.delta-from-v") and rel.endswith(".json")
+
+
+def load_manifests(agent_root: Path) -> dict[str, dict]:
+    """Manifests of all published versions (agent/vX.Y.Z/manifest.json), keyed by version."""
+    out: dict[str, dict] = {}
+    for child in sorted(agent_root.iterdir()):
+        if not child.is_dir() or not child.name.startswith("v"):
+            continue
+        if _parse_semver(child.name[1:]) is None:
+            continue
+        manifest_path = child / "manifest.json"
+        if manifest_path.is_file():
+            out[child.name[1:]] = json.loads(manifest_path.read_text(encoding="utf-8"))
+    return out
+
+
+def previous_versions(version: str, available: list[str]) -> list[str]:
+    """Up to DELTA_DEPTH versions older than `version`, newest first."""
+    key = _parse_semver(version)
+    if key is None:
+        return []
+    older = [v for v in available if (_parse_semver(v) or (0, 0, 0)) < key]
+    older.sort(key=lambda v: _parse_semver(v) or (0, 0, 0), reverse=True)
+    return older[:DELTA_DEPTH]
+
+
+def _shard_key(path: str) -> str | None:
+    head, sep, _ = path.partition("/")
+    return head if sep else None
+
+
+def _build_delta(old: dict, new: dict) -> dict:
+    doc: dict = {
+        "schema_version": _DELTA_SCHEMA,
+        "from_toolchain_version": old.get("toolchain_version"),
+        "to_toolchain_version": new.get("toolchain_version"),
+        "from_docs_bundle_sha256": old.get("docs_bundle_sha256"),
+        "to_docs_bundle_sha256": new.get("docs_bundle_sha256"),
+    }
+    for section in SECTIONS:
+        before = {e["path"]: e for e in old.get(section, [])}
+        after = {e["path"]: e for e in new.get(section, [])}
+        doc[section] = {
+            "added": [after[p] for p in sorted(after.keys() - before.keys())],
+            "changed": [
+                after[p]
+                for p in sorted(after.keys() & before.keys())
+                if (after[p]["sha256"], after[p]["size"]) != (before[p]["sha256"], before[p]["size"])
+            ],
+            "removed": sorted(before.keys() - after.keys()),
+        }
+    return doc
+
+
+def build_views(manifest: dict, previous: list[dict]) -> dict[str, bytes]:
+    """All view files for `manifest`, keyed by path relative to the agent dir."""
+    version = manifest.get("toolchain_version")
+    files: dict[str, bytes] = {}
+
+    shards: list[dict] = []
+    for section in SECTIONS:
+        groups: dict[str | None, list[dict]] = {}
+        for entry in manifest.get(section, []):
+            groups.setdefault(_shard_key(entry["path"]), []).append(entry)
+        for key in sorted(groups, key=lambda k: "" if k is None else f"/{k}"):
+            rel = f"manifest/{section}.json" if key is None else f"manifest/{section}/{key}.json"
+            data = _dumps(
+                {
+                    "schema_version": _SHARD_SCHEMA,
+                    "toolchain_version": version,
+                    "section": section,
+                    "prefix": "" if key is None else f"{key}/",
+                    "files": groups[key],
+                }
+            )
+            files[rel] = data
+            shards.append(
+                {
+                    "section": section,
+                    "prefix": "" if key is None else f"{key}/",
+                    "url": rel,
+                    "files": len(groups[key]),
+                    "sha256": hashlib.sha256(data).hexdigest(),
+                    "size": len(data),
+                }
+            )
+
+    deltas: list[dict] = []
+    for old in previous:
+        rel = delta_path(old["toolchain_version"])
+        data = _dumps(_build_delta(old, manifest))
+        files[rel] = data
+        deltas.append(
+            {
+                "from_toolchain_version": old["toolchain_version"],
+                "url": rel,
+                "sha256": hashlib.sha256(data).hexdigest(),
+                "size": len(data),
+            }
+        )
+
+    files[INDEX_PATH] = _dumps(
+        {
+            "schema_version": _INDEX_SCHEMA,
+            "toolchain_version": version,
+            "docs_bundle_sha256": manifest.get("docs_bundle_sha256"),
+            "manifest_url": "manifest.json",
+            "shards": shards,
+            "deltas": deltas,
+        }
+    )
+    return files
+
+
+def expected_views(manifest: dict, manifests: dict[str, dict]) -> dict[str, bytes]:
+    """Views for `manifest`, with deltas against the closest older entries of `manifests`."""
+    older = previous_versions(manifest.get("toolchain_version", ""), list(manifests))
+    return build_views(manifest, [manifests[v] for v in older])
+
+
+def _existing_views(agent_dir: Path) -> set[str]:
+    out: set[str] = set()
+    manifest_dir = agent_dir / "manifest"
+    if manifest_dir.is_dir():
+        out.update(p.relative_to(agent_dir).as_posix() for p in manifest_dir.rglob("*") if p.is_file())
+    out.update(p.name for p in agent_dir.glob("manifest.delta-from-v*.json") if p.is_file())
+    return out
+
+
+def write_views(agent_dir: Path, views: dict[str, bytes]) -> int:
+    """Write changed view files and remove stale ones. Returns the number of files touched."""
+    touched = 0
+    for rel, data in sorted(views.items()):
+        p = agent_dir / rel
+        if _hash_cache.file_matches(p, data):
+            continue
+        _content_store.atomic_write_bytes(p, data)
+        touched += 1
+    for rel in sorted(_existing_views(agent_dir) - views.keys()):
+        (agent_dir / rel).unlink()
+        touched += 1
+    for sub in sorted((agent_dir / "manifest").glob("*/"), reverse=True):
+        if sub.is_dir() and not any(sub.iterdir()):
+            sub.rmdir()
+    return touched
+
+
+def check_views(agent_dir: Path, views: dict[str, bytes]) -> list[str]:
+    """Paths (relative to the agent dir) whose view files are missing, stale or unexpected."""
+    problems: list[str] = []
+    for rel, data in sorted(views.items()):
+        if not _hash_cache.file_matches(agent_dir / rel, data):
+            problems.append(rel)
+    problems.extend(sorted(_existing_views(agent_dir) - views.keys()))
+    return problems
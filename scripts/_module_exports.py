@@ -0,0 +1,93 @@
+"""
+Export lists of X07 modules (`decls[kind=export].names`), for the stdlib and
+package index generators.
+
+Parsed results are cached in .x07-cache/module-exports.json keyed by the sha256
+of the module file, so a re-sync only parses modules whose bytes changed since
+the previous toolchain release (override the location with
+X07_WEBSITE_MODULE_CACHE, disable with X07_WEBSITE_MODULE_CACHE=off). Cache
+misses are parsed in a process pool once there are enough of them to pay for
+the workers.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import json
+import os
+from pathlib import Path
+
+import _hash_cache
+import _json_cache
+
+
+# Below this many cache misses, parsing inline is faster than starting workers.
+_PARALLEL_MIN_MISSES = 64
+
+
+def _valid_entry(v) -> bool:
+    if not isinstance(v, dict):
+        return False
+    module_id = v.get("module_id")
+    names = v.get("names")
+    return (module_id is None or isinstance(module_id, str)) and (
+        isinstance(names, list) and all(isinstance(n, str) for n in names)
+    )
+
+
+_cache = _json_cache.JsonCache(
+    env_var="X07_WEBSITE_MODULE_CACHE",
+    file_name="module-exports.json",
+    schema_version="x07.website.module-exports-cache@0.1.0",
+    max_entries=200_000,
+    valid=_valid_entry,
+)
+
+cache_path = _cache.path
+save = _cache.save
+
+
+def parse_module(path: str) -> dict:
+    """Return {"module_id", "names"}: the declared module id and the sorted set of export names."""
+    doc = json.loads(Path(path).read_text(encoding="utf-8"))
+    module_id = doc.get("module_id")
+    names: set[str] = set()
+    for decl in doc.get("decls", []):
+        if not isinstance(decl, dict):
+            continue
+        if decl.get("kind") != "export":
+            continue
+        decl_names = decl.get("names", [])
+        if not isinstance(decl_names, list):
+            continue
+        names.update(n for n in decl_names if isinstance(n, str))
+    return {"module_id": module_id if isinstance(module_id, str) else None, "names": sorted(names)}
+
+
+def module_exports(paths: list[Path], *, jobs: int | None = None) -> dict[Path, dict]:
+    """Parsed export info for every path, reusing cached results for unchanged module files.
+
+    `jobs` caps the parse workers; callers already running in a worker process pass 1.
+    """
+    digests = {p: _hash_cache.sha256_file(p) for p in paths}
+
+    out: dict[Path, dict] = {}
+    misses: list[Path] = []
+    for p, digest in digests.items():
+        entry = _cache.get(digest)
+        if entry is None:
+            misses.append(p)
+            continue
+        out[p] = entry
+
+    if len(misses) >= _PARALLEL_MIN_MISSES and (jobs or os.cpu_count() or 1) > 1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+            parsed = list(pool.map(parse_module, [str(p) for p in misses], chunksize=16))
+    else:
+        parsed = [parse_module(str(p)) for p in misses]
+
+    for p, entry in zip(misses, parsed):
+        _cache.put(digests[p], entry)
+        out[p] = entry
+    return out
+
@@ -0,0 +1,180 @@
+"""
+Global symbol index of an agent dir: export name -> the stdlib/package modules
+that export it.
+
+  symbols/index.json          shard listing (prefix, url, counts, digest)
+  symbols/<prefix>.json       {name: [{package, version, module_id, path}, ...]}
+
+A name's shard prefix is its dotted name without the last segment, cut to at
+most three segments ("std.net.http.client.get" -> "std.net.http"), so a client
+resolves one name with a single small fetch and no directory lookup. `package`
+is null for stdlib modules; `path` is relative to the stdlib or package
+module root. The files are pure functions of stdlib/index.json and
+packages/*/*/index.json, so they are not committed: build_symbol_indexes.py
+writes them into site/static/agent at site build time, check_site.py only
+checks that the sources build and that no agent dir carries a symbols/ copy,
+and `build_symbol_indexes.py --check` compares the built files with the
+sources after a site build.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+import re
+from typing import Callable
+
+import _content_store
+import _hash_cache
+from _tree_model import Node
+
+
+INDEX_PATH = "symbols/index.json"
+
+_INDEX_SCHEMA = "x07.website.agent.symbols_index@v1"
+_SHARD_SCHEMA = "x07.website.agent.symbols_shard@v1"
+
+_PREFIX_SEGMENTS = 3
+
+# Shard names become file names; anything else goes to the "_" shard.
+_SAFE_PREFIX_RE = re.compile(r"^[A-Za-z0-9_][A-Za-z0-9_.-]*$")
+
+
+def shard_prefix(name: str) -> str:
+    prefix = ".".join(name.split(".")[:-1][:_PREFIX_SEGMENTS])
+    return prefix if _SAFE_PREFIX_RE.match(prefix) else "_"
+
+
+def _dumps(obj: object) -> bytes:
+    return (json.dumps(obj, indent=2) + "\n").encode("utf-8")
+
+
+def _parse_semver(v: str) -> tuple[int, int, int]:
+    try:
+        major, minor, patch = (int(p) for p in v.split("."))
+    except ValueError:
+        return (0, 0, 0)
+    return (major, minor, patch)
+
+
+def _module_entries(index: dict, *, package: str | None, version: str | None) -> list[tuple[str, dict]]:
+    out: list[tuple[str, dict]] = []
+    for module in index.get("modules", []):
+        if not isinstance(module, dict):
+            continue
+        exports = module.get("exports")
+        if not isinstance(exports, list):
+            continue
+        entry = {
+            "package": package,
+            "version": version,
+            "module_id": module.get("module_id"),
+            "path": module.get("path"),
+        }
+        out.extend((name, entry) for name in exports if isinstance(name, str) and name)
+    return out
+
+
+def build_files(stdlib_index: dict | None, package_indexes: list[dict]) -> dict[str, bytes]:
+    """All symbol index files, keyed by path relative to the agent dir."""
+    providers: dict[str, list[dict]] = {}
+    if stdlib_index is not None:
+        version = stdlib_index.get("stdlib_version")
+        for name, entry in _module_entries(
+            stdlib_index, package=None, version=version if isinstance(version, str) else None
+        ):
+            providers.setdefault(name, []).append(entry)
+    for idx in package_indexes:
+        for name, entry in _module_entries(idx, package=idx.get("name"), version=idx.get("version")):
+            providers.setdefault(name, []).append(entry)
+
+    shards: dict[str, dict[str, list[dict]]] = {}
+    for name in sorted(providers):
+        entries = sorted(
+            providers[name],
+            key=lambda e: (
+                e["package"] is not None,
+                e["package"] or "",
+                _parse_semver(e["version"] or ""),
+                e["version"] or "",
+                e["module_id"] or "",
+            ),
+        )
+        shards.setdefault(shard_prefix(name), {})[name] = entries
+
+    files: dict[str, bytes] = {}
+    listing: list[dict] = []
+    for prefix in sorted(shards):
+        rel = f"symbols/{prefix}.json"
+        data = _dumps({"schema_version": _SHARD_SCHEMA, "prefix": prefix, "symbols": shards[prefix]})
+        files[rel] = data
+        listing.append(
+            {
+                "prefix": prefix,
+                "url": rel,
+                "symbols": len(shards[prefix]),
+                "sha256": hashlib.sha256(data).hexdigest(),
+                "size": len(data),
+            }
+        )
+    files[INDEX_PATH] = _dumps(
+        {
+            "schema_version": _INDEX_SCHEMA,
+            "prefix_segments": _PREFIX_SEGMENTS,
+            "symbols": len(providers),
+            "shards": listing,
+        }
+    )
+    return files
+
+
+def _read_json(path: Path) -> object:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def load_sources(
+    tree: Node, load_json: Callable[[Path], object] = _read_json
+) -> tuple[dict | None, list[dict]]:
+    """stdlib/index.json and every packages/<name>/<version>/index.json of the agent dir scanned as `tree`.
+
+    `load_json` lets a caller that already parses the agent dir's JSON share its results.
+    """
+    stdlib_node = tree.get("stdlib/index.json")
+    stdlib_index = load_json(stdlib_node.path) if stdlib_node is not None and not stdlib_node.is_dir else None
+    package_indexes: list[dict] = []
+    packages = tree.get("packages")
+    for pkg_dir in packages.dirs() if packages is not None and packages.is_dir else []:
+        for ver_dir in pkg_dir.dirs():
+            idx_node = ver_dir.get("index.json")
+            if idx_node is not None and not idx_node.is_dir:
+                package_indexes.append(load_json(idx_node.path))
+    return stdlib_index, package_indexes
+
+
+def _existing_files(agent_dir: Path) -> set[str]:
+    symbols_dir = agent_dir / "symbols"
+    if not symbols_dir.is_dir():
+        return set()
+    return {p.relative_to(agent_dir).as_posix() for p in symbols_dir.rglob("*") if p.is_file()}
+
+
+def write_files(agent_dir: Path, files: dict[str, bytes]) -> int:
+    """Write changed files and remove stale shards. Returns the number of files touched."""
+    touched = 0
+    for rel, data in sorted(files.items()):
+        if _hash_cache.file_matches(agent_dir / rel, data):
+            continue
+        _content_store.atomic_write_bytes(agent_dir / rel, data)
+        touched += 1
+    for rel in sorted(_existing_files(agent_dir) - files.keys()):
+        (agent_dir / rel).unlink()
+        touched += 1
+    return touched
+
+
+def check_files(agent_dir: Path, files: dict[str, bytes]) -> list[str]:
+    """Paths (relative to the agent dir) whose symbol files are missing, stale or unexpected."""
+    problems = [rel for rel, data in sorted(files.items()) if not _hash_cache.file_matches(agent_dir / rel, data)]
+    problems.extend(sorted(_existing_files(agent_dir) - files.keys()))
+    return problems
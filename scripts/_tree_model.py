@@ -0,0 +1,220 @@
+"""
+In-memory model of a directory tree, built with a single os.scandir pass.
+
+Each node keeps the stat data the scripts need (kind, size, inode, mtime);
+sha256 digests are computed lazily through the shared digest cache, so a
+generator that only needs names never reads file contents. macOS metadata
+(.DS_Store, AppleDouble "._*" files) is skipped while scanning, so callers do
+not need to filter it.
+
+The model is a snapshot: callers that modify the tree must rescan (or stop
+reading the affected subtree) afterwards.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import hashlib
+import os
+from pathlib import Path
+from typing import Callable
+
+import _hash_cache
+
+
+# Below this many files to digest, hashing inline beats starting threads.
+_PARALLEL_MIN_FILES = 32
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+def _is_macos_metadata(name: str) -> bool:
+    return name == ".DS_Store" or name.startswith("._")
+
+
+class Node:
+    __slots__ = ("path", "rel", "is_dir", "size", "ino", "dev", "mtime_ns", "children", "_sha256")
+
+    def __init__(self, path: Path, rel: str, st: os.stat_result | None, is_dir: bool) -> None:
+        self.path = path
+        self.rel = rel
+        self.is_dir = is_dir
+        self.size = st.st_size if st is not None and not is_dir else 0
+        self.ino = st.st_ino if st is not None else 0
+        self.dev = st.st_dev if st is not None else 0
+        self.mtime_ns = st.st_mtime_ns if st is not None else 0
+        self.children: dict[str, Node] = {}
+        self._sha256: str | None = None
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+    @property
+    def sha256(self) -> str:
+        """File digest, or for a directory its Merkle tree digest (see `tree_digest`)."""
+        if self._sha256 is None:
+            self._sha256 = tree_digest(self) if self.is_dir else _hash_cache.sha256_file(self.path)
+        return self._sha256
+
+    def get(self, rel: str) -> Node | None:
+        """Descendant at a '/'-separated relative path, or None."""
+        node: Node | None = self
+        for part in rel.split("/"):
+            if not part:
+                continue
+            if node is None or not node.is_dir:
+                return None
+            node = node.children.get(part)
+        return node
+
+    def is_file_at(self, rel: str) -> bool:
+        node = self.get(rel)
+        return node is not None and not node.is_dir
+
+    def is_dir_at(self, rel: str) -> bool:
+        node = self.get(rel)
+        return node is not None and node.is_dir
+
+    def dirs(self) -> list[Node]:
+        return [c for _, c in sorted(self.children.items()) if c.is_dir]
+
+    def files(self, suffix: str = "") -> list[Node]:
+        return [c for name, c in sorted(self.children.items()) if not c.is_dir and name.endswith(suffix)]
+
+    def walk_files(self, suffix: str = "") -> list[Node]:
+        """All files below this node, sorted by path relative to it."""
+        out: list[Node] = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            for name, child in node.children.items():
+                if child.is_dir:
+                    stack.append(child)
+                elif name.endswith(suffix):
+                    out.append(child)
+        out.sort(key=lambda n: self.rel_of(n))
+        return out
+
+    def rel_of(self, descendant: Node) -> str:
+        if not self.rel:
+            return descendant.rel
+        return descendant.rel[len(self.rel) + 1 :]
+
+
+def scan(root: Path) -> Node:
+    """Scan `root` once. A missing root yields an empty directory node."""
+    try:
+        st = root.stat()
+    except FileNotFoundError:
+        return Node(root, "", None, True)
+    node = Node(root, "", st, True)
+    _scan_into(node)
+    return node
+
+
+class Scans:
+    """Scans shared by the readers of one run, one per root (see sync_pipeline.py).
+
+    Only for trees nobody writes while the run reads them: a model is never refreshed.
+    """
+
+    def __init__(self) -> None:
+        self._trees: dict[Path, Node] = {}
+
+    def get(self, root: Path) -> Node:
+        key = root.resolve()
+        tree = self._trees.get(key)
+        if tree is None:
+            tree = self._trees[key] = scan(root)
+        return tree
+
+
+def _scan_into(node: Node) -> None:
+    with os.scandir(node.path) as it:
+        entries = list(it)
+    for entry in entries:
+        if _is_macos_metadata(entry.name):
+            continue
+        rel = f"{node.rel}/{entry.name}" if node.rel else entry.name
+        is_dir = entry.is_dir()
+        if not is_dir and not entry.is_file():
+            continue
+        child = Node(Path(entry.path), rel, entry.stat(), is_dir)
+        node.children[entry.name] = child
+        if is_dir:
+            _scan_into(child)
+
+
+def tree_digest(node: Node) -> str:
+    """Merkle digest of a directory.
+
+    sha256 over one line per child, sorted by name: "file <sha256> <name>\\n" or
+    "dir <tree digest> <name>\\n". Two directories have the same digest exactly when
+    they hold the same names and file contents.
+    """
+    h = hashlib.sha256()
+    for name, child in sorted(node.children.items()):
+        kind = "dir" if child.is_dir else "file"
+        h.update(f"{kind} {child.sha256} {name}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+def same_content(a: Node, b: Node) -> bool:
+    """Content equality from the model: shared inode, then size, then (cached) digest."""
+    if a.ino and (a.dev, a.ino) == (b.dev, b.ino):
+        return True
+    if a.size != b.size:
+        return False
+    return a.sha256 == b.sha256
+
+
+def _same_bytes(a: Path, b: Path) -> bool:
+    with a.open("rb") as fa, b.open("rb") as fb:
+        while True:
+            ca = fa.read(_CHUNK_SIZE)
+            if ca != fb.read(_CHUNK_SIZE):
+                return False
+            if not ca:
+                return True
+
+
+def diff_files(
+    a: Node, b: Node, *, include: Callable[[str], bool] | None = None, jobs: int | None = None
+) -> tuple[list[str], list[str], list[str]]:
+    """Compare two subtrees: (only in a, only in b, differing), as paths relative to each root.
+
+    Every difference is returned. Pairs are settled by stat first (shared inode,
+    size); the remaining pairs are compared by digest, computed (or looked up in
+    the digest cache) in a thread pool once there are enough of them. A digest
+    mismatch is confirmed by reading both files, so a stale cache entry cannot
+    report a false difference. `include` filters the relative paths compared.
+    """
+    a_files = {a.rel_of(n): n for n in a.walk_files()}
+    b_files = {b.rel_of(n): n for n in b.walk_files()}
+    if include is not None:
+        a_files = {rel: n for rel, n in a_files.items() if include(rel)}
+        b_files = {rel: n for rel, n in b_files.items() if include(rel)}
+    only_a = sorted(a_files.keys() - b_files.keys())
+    only_b = sorted(b_files.keys() - a_files.keys())
+
+    differ: list[str] = []
+    pending: list[str] = []
+    for rel in sorted(a_files.keys() & b_files.keys()):
+        na, nb = a_files[rel], b_files[rel]
+        if na.ino and (na.dev, na.ino) == (nb.dev, nb.ino):
+            continue
+        if na.size != nb.size:
+            differ.append(rel)
+        else:
+            pending.append(rel)
+
+    nodes = [n for rel in pending for n in (a_files[rel], b_files[rel]) if n._sha256 is None]
+    if len(nodes) >= _PARALLEL_MIN_FILES:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as pool:
+            list(pool.map(lambda n: n.sha256, nodes))
+    for rel in pending:
+        na, nb = a_files[rel], b_files[rel]
+        if na.sha256 != nb.sha256 and not _same_bytes(na.path, nb.path):
+            differ.append(rel)
+    return only_a, only_b, sorted(differ)
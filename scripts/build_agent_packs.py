@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+
+import _agent_pack
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    ap = argparse.ArgumentParser(
+        description="Build the agent pack (pack/toc.json, agent-pack.tar, agent-pack.tar.gz) of each agent dir."
+    )
+    ap.add_argument(
+        "--out-dir",
+        type=Path,
+        default=None,
+        help="directory mirroring agent/ that receives <dir>/pack/. Default: site/static/agent",
+    )
+    ap.add_argument(
+        "--agent-dir",
+        action="append",
+        default=[],
+        help="agent dir to pack, relative to the repo root (repeatable). Default: every dir with pack_archive_url",
+    )
+    ap.add_argument("--check", action="store_true", help="fail if the built pack files are missing or out of date")
+    return ap.parse_args(argv)
+
+
+def _advertises_pack(agent_dir: Path) -> bool:
+    index = json.loads((agent_dir / "index.json").read_text(encoding="utf-8"))
+    return isinstance(index, dict) and index.get("pack_archive_url") == _agent_pack.ARCHIVE_PATH
+
+
+def main(argv: list[str]) -> int:
+    args = parse_args(argv)
+    root = Path(__file__).resolve().parents[1]
+    out_root = (args.out_dir or root / "site" / "static" / "agent").resolve()
+
+    if args.agent_dir:
+        agent_dirs = [root / rel for rel in args.agent_dir]
+    else:
+        agent_dirs = sorted(p.parent for p in (root / "agent").glob("*/index.json") if _advertises_pack(p.parent))
+
+    rc = 0
+    for agent_dir in agent_dirs:
+        if not (agent_dir / "index.json").is_file():
+            print(f"ERROR: missing {agent_dir.relative_to(root)}/index.json", file=sys.stderr)
+            return 2
+        out_dir = out_root / agent_dir.name / "pack"
+        if args.check:
+            stale = _agent_pack.check_archives(agent_dir, out_dir)
+            for name in stale:
+                print(f"ERROR: {out_dir / name} is missing or stale (rerun the site build)", file=sys.stderr)
+            rc = rc or (1 if stale else 0)
+            continue
+        tar_size, gz_size = _agent_pack.build_archives(agent_dir, out_dir)
+        print(f"ok: {agent_dir.relative_to(root)}: {_agent_pack.ARCHIVE_NAME} {tar_size} bytes, .gz {gz_size} bytes")
+    if args.check and rc == 0:
+        print(f"ok: agent packs of {len(agent_dirs)} agent dirs are up to date")
+    return rc
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
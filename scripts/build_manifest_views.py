@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+
+import _manifest_views
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    ap = argparse.ArgumentParser(
+        description="Build the manifest shards and deltas (manifest/, manifest.delta-from-v*.json) of each agent dir."
+    )
+    ap.add_argument(
+        "--out-dir",
+        type=Path,
+        default=None,
+        help="directory mirroring agent/ that receives the views of <dir>. Default: site/static/agent",
+    )
+    ap.add_argument(
+        "--agent-dir",
+        action="append",
+        default=[],
+        help=(
+            "agent dir to build views for, relative to the repo root (repeatable). "
+            "Default: every dir with a manifest.json"
+        ),
+    )
+    ap.add_argument("--check", action="store_true", help="fail if the built views are missing or out of date")
+    return ap.parse_args(argv)
+
+
+def main(argv: list[str]) -> int:
+    args = parse_args(argv)
+    root = Path(__file__).resolve().parents[1]
+    out_root = (args.out_dir or root / "site" / "static" / "agent").resolve()
+
+    if args.agent_dir:
+        agent_dirs = [root / rel for rel in args.agent_dir]
+    else:
+        agent_dirs = sorted(p.parent for p in (root / "agent").glob("*/manifest.json"))
+
+    # Deltas are built against the published versions' manifests, so load them all once.
+    manifests = _manifest_views.load_manifests(root / "agent")
+    rc = 0
+    for agent_dir in agent_dirs:
+        manifest_path = agent_dir / "manifest.json"
+        if not manifest_path.is_file():
+            print(f"ERROR: missing {manifest_path.relative_to(root)}", file=sys.stderr)
+            return 2
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        views = _manifest_views.expected_views(manifest, manifests)
+        out_dir = out_root / agent_dir.name
+        if args.check:
+            stale = _manifest_views.check_views(out_dir, views)
+            for rel in stale:
+                print(f"ERROR: {out_dir / rel} is missing, stale or unexpected (rerun the site build)", file=sys.stderr)
+            rc = rc or (1 if stale else 0)
+            continue
+        written = _manifest_views.write_views(out_dir, views)
+        print(f"ok: {agent_dir.relative_to(root)}: {len(views)} manifest views ({written} written)")
+    if args.check and rc == 0:
+        print(f"ok: manifest views of {len(agent_dirs)} agent dirs are up to date")
+    return rc
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
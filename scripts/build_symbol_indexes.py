@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+
+import _symbol_index
+import _tree_model
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    ap = argparse.ArgumentParser(
+        description="Build the symbol index (symbols/*) of each agent dir from its stdlib and package indexes."
+    )
+    ap.add_argument(
+        "--out-dir",
+        type=Path,
+        default=None,
+        help="directory mirroring agent/ that receives <dir>/symbols/. Default: site/static/agent",
+    )
+    ap.add_argument(
+        "--agent-dir",
+        action="append",
+        default=[],
+        help="agent dir to index, relative to the repo root (repeatable). Default: every dir with symbols_index_url",
+    )
+    ap.add_argument("--check", action="store_true", help="fail if the built files are missing or out of date")
+    return ap.parse_args(argv)
+
+
+def _advertises_symbols(agent_dir: Path) -> bool:
+    index = json.loads((agent_dir / "index.json").read_text(encoding="utf-8"))
+    return isinstance(index, dict) and index.get("symbols_index_url") == _symbol_index.INDEX_PATH
+
+
+def main(argv: list[str]) -> int:
+    args = parse_args(argv)
+    root = Path(__file__).resolve().parents[1]
+    out_root = (args.out_dir or root / "site" / "static" / "agent").resolve()
+
+    if args.agent_dir:
+        agent_dirs = [root / rel for rel in args.agent_dir]
+    else:
+        agent_dirs = sorted(p.parent for p in (root / "agent").glob("*/index.json") if _advertises_symbols(p.parent))
+
+    rc = 0
+    for agent_dir in agent_dirs:
+        if not (agent_dir / "index.json").is_file():
+            print(f"ERROR: missing {agent_dir.relative_to(root)}/index.json", file=sys.stderr)
+            return 2
+        stdlib_index, package_indexes = _symbol_index.load_sources(_tree_model.scan(agent_dir))
+        files = _symbol_index.build_files(stdlib_index, package_indexes)
+        out_dir = out_root / agent_dir.name
+        if args.check:
+            stale = _symbol_index.check_files(out_dir, files)
+            for rel in stale:
+                print(f"ERROR: {out_dir / rel} is missing, stale or unexpected (rerun the site build)", file=sys.stderr)
+            rc = rc or (1 if stale else 0)
+            continue
+        written = _symbol_index.write_files(out_dir, files)
+        print(f"ok: {agent_dir.relative_to(root)}: {len(files)} symbol files ({written} written)")
+    if args.check and rc == 0:
+        print(f"ok: symbol indexes of {len(agent_dirs)} agent dirs are up to date")
+    return rc
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
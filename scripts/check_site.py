@@ -1,101 +1,218 @@
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
 import json
+import os
 from pathlib import Path
 import sys
 
+import _agent_pack
+import _change_scope
+import _check_report
+import _hash_cache
+import _index_rules
+import _manifest_views
+import _symbol_index
+import _tree_model
+
 
 def parse_args(argv: list[str]) -> argparse.Namespace:
     ap = argparse.ArgumentParser()
     ap.add_argument("--check", action="store_true")
+    ap.add_argument(
+        "--verify-manifests",
+        action="store_true",
+        help="check every docs/vX.Y.Z and agent/vX.Y.Z tree against its agent/vX.Y.Z/manifest.json",
+    )
+    ap.add_argument("--jobs", type=int, default=None, help="versions verified in parallel (default: CPU count)")
+    ap.add_argument(
+        "--json-report",
+        type=Path,
+        default=None,
+        help="with --check: keep going after a failed phase and write every violation, with rule ids,"
+        " JSON pointers and per-phase timings, to this JSON file",
+    )
+    _change_scope.add_argument(ap)
     return ap.parse_args(argv)
 
 
 def main(argv: list[str]) -> int:
     args = parse_args(argv)
-    if not args.check:
-        print("usage: check_site.py --check", file=sys.stderr)
+    if not args.check and not args.verify_manifests or args.json_report and not args.check:
+        print(
+            "usage: check_site.py --check [--json-report PATH] | --verify-manifests [--jobs N] [--since GIT_REV]",
+            file=sys.stderr,
+        )
         return 2
 
     root = Path(__file__).resolve().parents[1]
+    scope = _change_scope.from_args(root, args.since)
+    rc = 0
+    if args.check:
+        report = _check_report.Report()
+        rc = check_repo(root, report=report, keep_going=args.json_report is not None, scope=scope)
+        if args.json_report is not None:
+            args.json_report.write_text(json.dumps(report.to_json(), indent=2) + "\n", encoding="utf-8")
+    if rc == 0 and args.verify_manifests:
+        rc = verify_manifests(root, jobs=args.jobs, scope=scope)
+    return rc
+
+
+def _manifest_problems(*, root: Path, toolchain_version: str, overlays: dict[str, Path]) -> list[str]:
+    """Differences between one version's trees and the file lists in its manifest."""
+    version_dir = f"v{toolchain_version}"
+    manifest_path = root / "agent" / version_dir / "manifest.json"
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        return [f"{manifest_path.relative_to(root)}: unreadable: {e}"]
+    if not isinstance(manifest, dict):
+        return [f"{manifest_path.relative_to(root)}: must be a JSON object"]
+
+    problems: list[str] = []
+    for section, tree_root in (("human_docs", root / "docs" / version_dir), ("agent", root / "agent" / version_dir)):
+        label = tree_root.relative_to(root).as_posix()
+        expected = {
+            e["path"]: e
+            for e in manifest.get(section, [])
+            if isinstance(e, dict) and isinstance(e.get("path"), str)
+        }
+        tree = _tree_model.scan(tree_root)
+        actual = {tree.rel_of(n): n for n in tree.walk_files()}
+        if section == "agent":
+            # manifest.json and its derived views are not listed in the manifest itself.
+            actual = {
+                rel: n for rel, n in actual.items() if rel != "manifest.json" and not _manifest_views.is_view_path(rel)
+            }
+        else:
+            # Overlays replace or add docs after extraction; they must match docs/_overlays instead.
+            for rel in sorted(overlays.keys() & actual.keys()):
+                if not _hash_cache.files_equal(actual[rel].path, overlays[rel]):
+                    problems.append(f"{label}: overlay differs from docs/_overlays: {rel}")
+            expected = {rel: e for rel, e in expected.items() if rel not in overlays}
+            actual = {rel: n for rel, n in actual.items() if rel not in overlays}
+
+        for rel in sorted(expected.keys() - actual.keys()):
+            problems.append(f"{label}: missing: {rel}")
+        for rel in sorted(actual.keys() - expected.keys()):
+            problems.append(f"{label}: extra: {rel}")
+        for rel in sorted(expected.keys() & actual.keys()):
+            node = actual[rel]
+            if (expected[rel].get("size"), expected[rel].get("sha256")) != (node.size, node.sha256):
+                problems.append(f"{label}: modified: {rel}")
+    return problems
+
+
+def verify_manifests(root: Path, *, jobs: int | None = None, scope: _change_scope.Scope | None = None) -> int:
+    """Verify every published version (or those in `scope`) against its own manifest.json, in parallel."""
+    versions = json.loads((root / "versions" / "toolchain_versions.json").read_text(encoding="utf-8"))
+    toolchain_versions = [
+        e["toolchain_version"]
+        for e in versions.get("versions", [])
+        if isinstance(e, dict)
+        and isinstance(e.get("toolchain_version"), str)
+        and (scope is None or scope.covers_version(e["toolchain_version"]))
+    ]
+
+    overlays_root = root / "docs" / "_overlays"
+    overlays: dict[str, Path] = {}
+    if overlays_root.is_dir():
+        overlay_tree = _tree_model.scan(overlays_root)
+        overlays = {overlay_tree.rel_of(n): n.path for n in overlay_tree.walk_files()}
+
+    # Hashing releases the GIL and most digests come from the shared cache, so threads suffice.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as pool:
+        results = list(
+            pool.map(
+                lambda v: _manifest_problems(root=root, toolchain_version=v, overlays=overlays), toolchain_versions
+            )
+        )
 
-    def err(msg: str) -> int:
+    total = 0
+    for toolchain_version, problems in zip(toolchain_versions, results):
+        for problem in problems:
+            print(f"[VERIFY] {problem}")
+        total += len(problems)
+    if total:
+        print(f"ERROR: {total} differences between published trees and their manifests", file=sys.stderr)
+        return 1
+    print(f"ok: {len(toolchain_versions)} versions match their manifests")
+    return 0
+
+
+def check_repo(
+    root: Path,
+    *,
+    report: _check_report.Report | None = None,
+    keep_going: bool = False,
+    scope: _change_scope.Scope | None = None,
+    scans: _tree_model.Scans | None = None,
+) -> int:
+    """
+    Run all structural checks against the repo at `root` (importable entry point).
+
+    Violations are also recorded in `report`. With `keep_going`, a failed phase
+    (install manifests, one agent dir, one tree comparison, entrypoints) does not
+    stop the later ones, and an agent dir runs every index rule and check whose
+    inputs are valid; other phases still stop at their first failure.
+    With `scope`, only the phases for the units it covers run; the structure
+    checks always run. The checks only read, so every tree is scanned once;
+    `scans` lets a caller that read the same trees (sync_from_bundle.py --check)
+    share its models.
+    """
+    if report is None:
+        report = _check_report.Report()
+    if scans is None:
+        scans = _tree_model.Scans()
+
+    def err(msg: str, *, rule: str | None = None, path: Path | None = None, pointer: str | None = None) -> int:
         print(f"ERROR: {msg}", file=sys.stderr)
+        report.add(
+            msg,
+            rule=rule,
+            path=path.relative_to(root).as_posix() if path is not None else None,
+            pointer=pointer,
+        )
         return 1
 
-    def iter_files_sorted(dir_path: Path) -> list[Path]:
-        out: list[Path] = []
-        for p in dir_path.rglob("*"):
-            if not p.is_file():
-                continue
-            rel = p.relative_to(dir_path)
-            if rel.name == ".DS_Store":
-                continue
-            if any(part.startswith("._") for part in rel.parts):
-                continue
-            out.append(rel)
-        return sorted(out, key=lambda p: p.as_posix())
-
-    def compare_trees(*, a: Path, b: Path, label: str) -> int:
-        a_files = iter_files_sorted(a)
-        b_files = iter_files_sorted(b)
-        if a_files != b_files:
-            return err(f"tree mismatch ({label}): {a} vs {b}")
-        for rel in a_files:
-            if (a / rel).read_bytes() != (b / rel).read_bytes():
-                return err(f"file differs ({label}): {rel}")
-        return 0
+    def compare_trees(*, a: Path, b: Path, label: str, include=None) -> int:
+        tree_a, tree_b = scans.get(a), scans.get(b)
+        report.count_files(len(tree_a.walk_files()) + len(tree_b.walk_files()))
+        only_a, only_b, differ = _tree_model.diff_files(tree_a, tree_b, include=include)
+        rule = f"tree.{label.replace(' ', '-').replace('/', '-')}"
+        for rel in only_a:
+            err(f"tree mismatch ({label}): only in {a.relative_to(root)}: {rel}", rule=rule, path=a / rel)
+        for rel in only_b:
+            err(f"tree mismatch ({label}): only in {b.relative_to(root)}: {rel}", rule=rule, path=b / rel)
+        for rel in differ:
+            err(f"file differs ({label}): {rel}", rule=rule, path=a / rel)
+        return 1 if only_a or only_b or differ else 0
+
+    # agent/latest and agent/vX.Y.Z differ in index metadata because they embed URL prefixes
+    # or generated_from paths; everything else must be identical.
+    url_bearing_agent_files = {
+        "index.json",
+        "entrypoints.json",
+        "manifest.json",
+        "schemas/index.json",
+        "examples/index.json",
+        "examples/catalog.json",
+        "packages/index.json",
+        "catalog/index.json",
+        "capabilities/index.json",
+        "skills/index.json",
+    }
+
+    def is_agent_payload(rel: str) -> bool:
+        if rel in url_bearing_agent_files:
+            return False
+        # skills/<skill_id>.json descriptors embed docs_url/report_schema_url.
+        return not (rel.startswith("skills/") and rel.count("/") == 1 and rel.endswith(".json"))
 
     def compare_agent_payload(*, latest_dir: Path, version_dir: Path) -> int:
-        # agent/latest and agent/vX.Y.Z differ in index metadata because they embed URL prefixes.
         # Compare the underlying published payload to prevent accidental manual edits.
-
-        def iter_payload_files(agent_dir: Path) -> list[Path]:
-            out: list[Path] = []
-            for p in agent_dir.rglob("*"):
-                if not p.is_file():
-                    continue
-                rel = p.relative_to(agent_dir)
-                if rel.name == ".DS_Store":
-                    continue
-                if any(part.startswith("._") for part in rel.parts):
-                    continue
-
-                # Exclude index metadata files that include URL prefixes or generated_from paths.
-                if rel == Path("index.json"):
-                    continue
-                if rel == Path("entrypoints.json"):
-                    continue
-                if rel == Path("manifest.json"):
-                    continue
-                if rel == Path("schemas/index.json"):
-                    continue
-                if rel == Path("examples/index.json"):
-                    continue
-                if rel == Path("examples/catalog.json"):
-                    continue
-                if rel == Path("packages/index.json"):
-                    continue
-                if rel == Path("catalog/index.json"):
-                    continue
-                if rel == Path("skills/index.json"):
-                    continue
-                if rel.parent == Path("skills") and rel.suffix == ".json":
-                    # skills/<skill_id>.json descriptors embed docs_url/report_schema_url.
-                    continue
-
-                out.append(rel)
-            return sorted(out, key=lambda p: p.as_posix())
-
-        latest_files = iter_payload_files(latest_dir)
-        version_files = iter_payload_files(version_dir)
-        if latest_files != version_files:
-            return err(f"tree mismatch (agent/latest payload): {latest_dir} vs {version_dir}")
-        for rel in latest_files:
-            if (latest_dir / rel).read_bytes() != (version_dir / rel).read_bytes():
-                return err(f"file differs (agent/latest payload): {rel}")
-        return 0
+        return compare_trees(a=latest_dir, b=version_dir, label="agent/latest payload", include=is_agent_payload)
 
     def read_json(path: Path) -> dict | list | str | int | float | bool | None:
         try:
@@ -120,724 +237,551 @@ def main(argv: list[str]) -> int:
         return ".".join(str(num) for num in nums)
 
     def check_install_manifests() -> int:
+        report.rule = "install.channels"
         install_root = root / "site" / "static" / "install"
         channels_path = install_root / "channels.json"
         if not channels_path.is_file():
-            return err(f"missing {channels_path.relative_to(root)}")
+            return err(f"missing {channels_path.relative_to(root)}", path=channels_path)
 
         try:
             channels_doc = read_json(channels_path)
         except ValueError as e:
-            return err(str(e))
+            return err(str(e), path=channels_path)
+        report.count_files(1)
 
         if not isinstance(channels_doc, dict):
-            return err(f"{channels_path.relative_to(root)} must be a JSON object")
+            return err(f"{channels_path.relative_to(root)} must be a JSON object", path=channels_path, pointer="")
         channels = channels_doc.get("channels")
         toolchains = channels_doc.get("toolchains")
         x07up_versions = channels_doc.get("x07up")
         if not isinstance(channels, dict):
-            return err(f"{channels_path.relative_to(root)} channels must be an object")
+            return err(
+                f"{channels_path.relative_to(root)} channels must be an object",
+                path=channels_path,
+                pointer="/channels",
+            )
         if not isinstance(toolchains, dict):
-            return err(f"{channels_path.relative_to(root)} toolchains must be an object")
+            return err(
+                f"{channels_path.relative_to(root)} toolchains must be an object",
+                path=channels_path,
+                pointer="/toolchains",
+            )
         if not isinstance(x07up_versions, dict):
-            return err(f"{channels_path.relative_to(root)} x07up must be an object")
+            return err(
+                f"{channels_path.relative_to(root)} x07up must be an object",
+                path=channels_path,
+                pointer="/x07up",
+            )
 
         for channel_name, channel_entry in sorted(channels.items()):
             if not isinstance(channel_name, str) or not channel_name:
-                return err(f"{channels_path.relative_to(root)} channel names must be non-empty strings")
+                return err(
+                    f"{channels_path.relative_to(root)} channel names must be non-empty strings",
+                    path=channels_path,
+                    pointer="/channels",
+                )
             if not isinstance(channel_entry, dict):
                 return err(
-                    f"{channels_path.relative_to(root)} channels.{channel_name} must be a JSON object"
+                    f"{channels_path.relative_to(root)} channels.{channel_name} must be a JSON object",
+                    path=channels_path,
+                    pointer=f"/channels/{channel_name}",
                 )
 
             toolchain_tag = channel_entry.get("toolchain")
             x07up_tag = channel_entry.get("x07up")
             if not isinstance(toolchain_tag, str) or not toolchain_tag:
                 return err(
-                    f"{channels_path.relative_to(root)} channels.{channel_name}.toolchain must be a non-empty string"
+                    f"{channels_path.relative_to(root)} channels.{channel_name}.toolchain must be a non-empty string",
+                    path=channels_path,
+                    pointer=f"/channels/{channel_name}/toolchain",
                 )
             if not isinstance(x07up_tag, str) or not x07up_tag:
                 return err(
-                    f"{channels_path.relative_to(root)} channels.{channel_name}.x07up must be a non-empty string"
+                    f"{channels_path.relative_to(root)} channels.{channel_name}.x07up must be a non-empty string",
+                    path=channels_path,
+                    pointer=f"/channels/{channel_name}/x07up",
                 )
             if toolchain_tag not in toolchains:
                 return err(
-                    f"{channels_path.relative_to(root)} channels.{channel_name}.toolchain {toolchain_tag!r} is missing from toolchains"
+                    f"{channels_path.relative_to(root)} channels.{channel_name}.toolchain {toolchain_tag!r} is missing from toolchains",
+                    path=channels_path,
+                    pointer=f"/channels/{channel_name}/toolchain",
                 )
             if x07up_tag not in x07up_versions:
                 return err(
-                    f"{channels_path.relative_to(root)} channels.{channel_name}.x07up {x07up_tag!r} is missing from x07up"
+                    f"{channels_path.relative_to(root)} channels.{channel_name}.x07up {x07up_tag!r} is missing from x07up",
+                    path=channels_path,
+                    pointer=f"/channels/{channel_name}/x07up",
                 )
 
             channel_path = install_root / "channels" / f"{channel_name}.json"
             if not channel_path.is_file():
-                return err(f"missing {channel_path.relative_to(root)}")
+                return err(f"missing {channel_path.relative_to(root)}", path=channel_path)
             try:
                 channel_doc = read_json(channel_path)
             except ValueError as e:
-                return err(str(e))
+                return err(str(e), path=channel_path)
+            report.count_files(1)
             if not isinstance(channel_doc, dict):
-                return err(f"{channel_path.relative_to(root)} must be a JSON object")
+                return err(f"{channel_path.relative_to(root)} must be a JSON object", path=channel_path, pointer="")
             if channel_doc.get("channel") != channel_name:
-                return err(f"{channel_path.relative_to(root)} channel mismatch")
+                return err(f"{channel_path.relative_to(root)} channel mismatch", path=channel_path, pointer="/channel")
 
             toolchain_version = normalize_version(toolchain_tag)
             if toolchain_version is None:
                 return err(
-                    f"{channels_path.relative_to(root)} channels.{channel_name}.toolchain must be a semver tag"
+                    f"{channels_path.relative_to(root)} channels.{channel_name}.toolchain must be a semver tag",
+                    path=channels_path,
+                    pointer=f"/channels/{channel_name}/toolchain",
                 )
             x07up_version = normalize_version(x07up_tag)
             if x07up_version is None:
                 return err(
-                    f"{channels_path.relative_to(root)} channels.{channel_name}.x07up must be a semver tag"
+                    f"{channels_path.relative_to(root)} channels.{channel_name}.x07up must be a semver tag",
+                    path=channels_path,
+                    pointer=f"/channels/{channel_name}/x07up",
                 )
 
             x07_core = channel_doc.get("x07_core")
             if not isinstance(x07_core, dict):
-                return err(f"{channel_path.relative_to(root)} x07_core must be an object")
+                return err(
+                    f"{channel_path.relative_to(root)} x07_core must be an object",
+                    path=channel_path,
+                    pointer="/x07_core",
+                )
             if x07_core.get("tag") != toolchain_tag:
                 return err(
-                    f"{channel_path.relative_to(root)} x07_core.tag must match channels.json ({toolchain_tag})"
+                    f"{channel_path.relative_to(root)} x07_core.tag must match channels.json ({toolchain_tag})",
+                    path=channel_path,
+                    pointer="/x07_core/tag",
                 )
             if x07_core.get("version") != toolchain_version:
                 return err(
-                    f"{channel_path.relative_to(root)} x07_core.version must match channels.json ({toolchain_version})"
+                    f"{channel_path.relative_to(root)} x07_core.version must match channels.json ({toolchain_version})",
+                    path=channel_path,
+                    pointer="/x07_core/version",
                 )
             release_manifest_url = x07_core.get("release_manifest_url")
             expected_release_name = f"x07-{toolchain_version}-release.json"
             if not isinstance(release_manifest_url, str) or not release_manifest_url:
-                return err(f"{channel_path.relative_to(root)} x07_core.release_manifest_url must be a string")
+                return err(
+                    f"{channel_path.relative_to(root)} x07_core.release_manifest_url must be a string",
+                    path=channel_path,
+                    pointer="/x07_core/release_manifest_url",
+                )
             if f"/download/{toolchain_tag}/" not in release_manifest_url:
                 return err(
-                    f"{channel_path.relative_to(root)} x07_core.release_manifest_url must use {toolchain_tag}"
+                    f"{channel_path.relative_to(root)} x07_core.release_manifest_url must use {toolchain_tag}",
+                    path=channel_path,
+                    pointer="/x07_core/release_manifest_url",
                 )
             if not release_manifest_url.endswith(f"/{expected_release_name}"):
                 return err(
-                    f"{channel_path.relative_to(root)} x07_core.release_manifest_url must end with /{expected_release_name}"
+                    f"{channel_path.relative_to(root)} x07_core.release_manifest_url must end with /{expected_release_name}",
+                    path=channel_path,
+                    pointer="/x07_core/release_manifest_url",
                 )
 
             min_x07up_version = normalize_version(channel_doc.get("min_x07up_version"))
             if min_x07up_version is None:
-                return err(f"{channel_path.relative_to(root)} min_x07up_version must be a semver string")
+                return err(
+                    f"{channel_path.relative_to(root)} min_x07up_version must be a semver string",
+                    path=channel_path,
+                    pointer="/min_x07up_version",
+                )
             if min_x07up_version != x07up_version:
                 return err(
-                    f"{channel_path.relative_to(root)} min_x07up_version must match channels.json ({x07up_version})"
+                    f"{channel_path.relative_to(root)} min_x07up_version must match channels.json ({x07up_version})",
+                    path=channel_path,
+                    pointer="/min_x07up_version",
                 )
 
         return 0
 
-    def check_agent_dir(agent_dir: Path) -> int:
-        index_path = agent_dir / "index.json"
-        if not index_path.is_file():
-            return err(f"missing {index_path.relative_to(root)}")
-
+    def check_manifest_views(view: _index_rules.AgentDirView) -> int:
+        # Shards and deltas are built at site build time from the manifests (build_manifest_views.py).
+        report.rule = "agent.manifest-views"
+        committed = [n for name, n in sorted(view.tree.children.items()) if _manifest_views.is_view_path(name)]
+        for node in committed:
+            rc = err(
+                f"unexpected {node.path.relative_to(root)}: manifest views are built at site build time"
+                " (rerun scripts/generate_agent_indexes.py)",
+                path=node.path,
+            )
+            if not keep_going:
+                return rc
+        return 1 if committed else 0
+
+    def check_symbol_index(view: _index_rules.AgentDirView) -> int:
+        # symbols/* is built at site build time from stdlib/index.json and the per-package indexes.
+        report.rule = "agent.symbols-index"
+        agent_dir = view.agent_dir
+        if view.tree.get("symbols") is not None:
+            return err(
+                f"unexpected {agent_dir.relative_to(root)}/symbols: the symbol index is built at site build time"
+                " (rerun scripts/generate_agent_indexes.py)",
+                path=agent_dir / "symbols",
+            )
         try:
-            index = read_json(index_path)
+            stdlib_index, package_indexes = _symbol_index.load_sources(view.tree, view.load_json)
         except ValueError as e:
-            return err(str(e))
+            return err(f"{agent_dir.relative_to(root)} invalid stdlib/package index JSON: {e}", path=agent_dir)
+        _symbol_index.build_files(stdlib_index, package_indexes)
+        return 0
 
-        if not isinstance(index, dict):
-            return err(f"{index_path.relative_to(root)} must be a JSON object")
-
-        def req_str_field(name: str) -> str | None:
-            v = index.get(name)
-            if not isinstance(v, str) or not v:
-                print(
-                    f"ERROR: {index_path.relative_to(root)} {name} must be non-empty string",
-                    file=sys.stderr,
-                )
-                return None
-            return v
+    def check_pack(view: _index_rules.AgentDirView) -> int:
+        # pack/* (TOC and archives) is built at site build time from the committed agent dir.
+        report.rule = "agent.pack"
+        agent_dir = view.agent_dir
+        if view.tree.get("pack") is not None:
+            return err(
+                f"unexpected {agent_dir.relative_to(root)}/pack: the agent pack is built at site build time"
+                " (rerun scripts/generate_agent_indexes.py)",
+                path=agent_dir / "pack",
+            )
+        return 0
 
-        def opt_str_field(name: str) -> str | None:
-            v = index.get(name)
-            if v is None:
-                return None
-            if not isinstance(v, str) or not v:
-                print(
-                    f"ERROR: {index_path.relative_to(root)} {name} must be non-empty string when present",
-                    file=sys.stderr,
-                )
-                return ""
-            return v
-
-        manifest_url = req_str_field("manifest_url")
-        schemas_dir = req_str_field("schemas_dir")
-        skills_dir = req_str_field("skills_dir")
-        stdlib_index_url = req_str_field("stdlib_index_url")
-        examples_dir = req_str_field("examples_dir")
-        packages_dir = opt_str_field("packages_dir")
-        schemas_index_url = req_str_field("schemas_index_url")
-        skills_index_url = req_str_field("skills_index_url")
-        examples_index_url = req_str_field("examples_index_url")
-        examples_catalog_index_url = opt_str_field("examples_catalog_index_url")
-        packages_index_url = opt_str_field("packages_index_url")
-        catalog_index_url = opt_str_field("catalog_index_url")
-        if None in (
-            manifest_url,
-            schemas_dir,
-            skills_dir,
-            stdlib_index_url,
-            examples_dir,
-            schemas_index_url,
-            skills_index_url,
-            examples_index_url,
-        ):
-            return 1
-        if "" in (packages_dir, examples_catalog_index_url, packages_index_url, catalog_index_url):
-            return 1
+    def check_skill_descriptors(view: _index_rules.AgentDirView) -> int:
+        # skills/<id>.json repeats the skills index entry; run after the skills index rule passed.
+        report.rule = "agent.skill-descriptors"
+        skill_items = view.load_json(view.agent_dir / view.index["skills_index_url"])["items"]
+        skills_root = view.agent_dir / view.index["skills_dir"]
+        expected_skill_json = {"index.json"} | {f"{it['id']}.json" for it in skill_items}
+        actual_skill_json = sorted(n.name for n in view.tree.get(view.index["skills_dir"]).files(".json"))
+        if actual_skill_json != sorted(expected_skill_json):
+            return err(f"{skills_root.relative_to(root)} JSON files mismatch", path=skills_root)
 
-        if not (agent_dir / manifest_url).is_file():
-            return err(f"missing {agent_dir.relative_to(root)}/{manifest_url}")
-        if not (agent_dir / schemas_dir).is_dir():
-            return err(f"missing {agent_dir.relative_to(root)}/{schemas_dir}")
-        if not (agent_dir / skills_dir).is_dir():
-            return err(f"missing {agent_dir.relative_to(root)}/{skills_dir}")
-        if not (agent_dir / examples_dir).is_dir():
-            return err(f"missing {agent_dir.relative_to(root)}/{examples_dir}")
-        if packages_dir and not (agent_dir / packages_dir).is_dir():
-            return err(f"missing {agent_dir.relative_to(root)}/{packages_dir}")
-        if not (agent_dir / stdlib_index_url).is_file():
-            return err(f"missing {agent_dir.relative_to(root)}/{stdlib_index_url}")
-        if not (agent_dir / schemas_index_url).is_file():
-            return err(f"missing {agent_dir.relative_to(root)}/{schemas_index_url}")
-        if not (agent_dir / skills_index_url).is_file():
-            return err(f"missing {agent_dir.relative_to(root)}/{skills_index_url}")
-        if not (agent_dir / examples_index_url).is_file():
-            return err(f"missing {agent_dir.relative_to(root)}/{examples_index_url}")
-        if examples_catalog_index_url and not (agent_dir / examples_catalog_index_url).is_file():
-            return err(f"missing {agent_dir.relative_to(root)}/{examples_catalog_index_url}")
-        if packages_index_url and not (agent_dir / packages_index_url).is_file():
-            return err(f"missing {agent_dir.relative_to(root)}/{packages_index_url}")
-        if catalog_index_url and not (agent_dir / catalog_index_url).is_file():
-            return err(f"missing {agent_dir.relative_to(root)}/{catalog_index_url}")
-
-        hidden_dirs = []
-        for hidden_dir in (".agent", ".codex"):
-            hidden_dirs.extend(agent_dir.rglob(hidden_dir))
-        if hidden_dirs:
-            rel = hidden_dirs[0].relative_to(root)
-            return err(f"hidden directory {hidden_dirs[0].name} must not be published: {rel}")
-
-        schema_files = list((agent_dir / schemas_dir).glob("*.schema.json"))
-        if not schema_files:
-            return err(f"no schemas found under {agent_dir.relative_to(root)}/{schemas_dir}")
-
-        agent_rel = agent_dir.relative_to(root).as_posix()
-        agent_url_prefix = f"/{agent_rel}"
-
-        def check_index_common(
-            *, index_path: Path, expected_schema_version: str, required_item_keys: list[str]
-        ) -> tuple[int, dict] | tuple[int, None]:
+        for it in skill_items:
+            descriptor_path = skills_root / f"{it['id']}.json"
             try:
-                doc = read_json(index_path)
+                descriptor = view.load_json(descriptor_path)
             except ValueError as e:
-                return err(str(e)), None
-            if not isinstance(doc, dict):
-                return err(f"{index_path.relative_to(root)} must be a JSON object"), None
-            if doc.get("schema_version") != expected_schema_version:
-                return err(f"{index_path.relative_to(root)} schema_version mismatch"), None
-            items = doc.get("items")
-            if not isinstance(items, list):
-                return err(f"{index_path.relative_to(root)} items must be an array"), None
-            for it in items:
-                if not isinstance(it, dict):
-                    return err(f"{index_path.relative_to(root)} items must be objects"), None
-                for k in required_item_keys:
-                    if k not in it:
-                        return err(f"{index_path.relative_to(root)} items[*] missing key: {k}"), None
-            return 0, doc
-
-        # ---- schemas index ----
-        rc, schemas_index = check_index_common(
-            index_path=agent_dir / schemas_index_url,
-            expected_schema_version="x07.website.agent.schemas_index@v1",
-            required_item_keys=["id", "url"],
-        )
-        if rc != 0 or schemas_index is None:
-            return 1
-        schema_items = schemas_index.get("items", [])
-        schema_ids: list[str] = []
-        for it in schema_items:
-            sid = it.get("id")
-            url = it.get("url")
-            if not isinstance(sid, str) or not sid:
-                return err(f"{(agent_dir / schemas_index_url).relative_to(root)} item.id must be non-empty string")
-            if not isinstance(url, str) or not url:
-                return err(f"{(agent_dir / schemas_index_url).relative_to(root)} item.url must be non-empty string")
-            if not url.startswith(f"{agent_url_prefix}/schemas/"):
+                return err(str(e), path=descriptor_path)
+            if not isinstance(descriptor, dict):
                 return err(
-                    f"{(agent_dir / schemas_index_url).relative_to(root)} item.url must start with {agent_url_prefix}/schemas/"
+                    f"{descriptor_path.relative_to(root)} must be a JSON object",
+                    path=descriptor_path,
+                    pointer="",
                 )
-            if not (root / url.lstrip("/")).is_file():
-                return err(f"{(agent_dir / schemas_index_url).relative_to(root)} missing file for url: {url}")
-            schema_ids.append(sid)
-        if schema_ids != sorted(schema_ids):
-            return err(f"{(agent_dir / schemas_index_url).relative_to(root)} items must be sorted by id")
-        expected_schema_ids = sorted(p.name for p in (agent_dir / schemas_dir).glob("*.schema.json"))
-        if schema_ids != expected_schema_ids:
-            return err(f"{(agent_dir / schemas_index_url).relative_to(root)} items do not match schemas_dir")
-
-        # ---- examples index ----
-        rc, examples_index = check_index_common(
-            index_path=agent_dir / examples_index_url,
-            expected_schema_version="x07.website.agent.examples_index@v1",
-            required_item_keys=["id", "url"],
-        )
-        if rc != 0 or examples_index is None:
-            return 1
-        example_items = examples_index.get("items", [])
-        example_ids: list[str] = []
-        for it in example_items:
-            eid = it.get("id")
-            url = it.get("url")
-            purpose = it.get("purpose")
-            if not isinstance(eid, str) or not eid:
-                return err(f"{(agent_dir / examples_index_url).relative_to(root)} item.id must be non-empty string")
-            if purpose is not None and not isinstance(purpose, str):
-                return err(f"{(agent_dir / examples_index_url).relative_to(root)} item.purpose must be string|null")
-            if not isinstance(url, str) or not url:
-                return err(f"{(agent_dir / examples_index_url).relative_to(root)} item.url must be non-empty string")
-            if not url.startswith(f"{agent_url_prefix}/examples/"):
+            if descriptor.get("schema_version") != "x07.website.agent.skill@v1":
                 return err(
-                    f"{(agent_dir / examples_index_url).relative_to(root)} item.url must start with {agent_url_prefix}/examples/"
+                    f"{descriptor_path.relative_to(root)} schema_version mismatch",
+                    path=descriptor_path,
+                    pointer="/schema_version",
                 )
-            if not (root / url.lstrip("/")).is_file():
-                return err(f"{(agent_dir / examples_index_url).relative_to(root)} missing file for url: {url}")
-            example_ids.append(eid)
-        if example_ids != sorted(example_ids):
-            return err(f"{(agent_dir / examples_index_url).relative_to(root)} items must be sorted by id")
-        expected_example_ids = sorted(
-            p.name.removesuffix(".x07.json")
-            for p in (agent_dir / examples_dir).glob("*.x07.json")
-        )
-        if example_ids != expected_example_ids:
-            return err(f"{(agent_dir / examples_index_url).relative_to(root)} items do not match examples_dir")
-
-        # ---- examples catalog index (optional) ----
-        if examples_catalog_index_url:
-            rc, examples_catalog_index = check_index_common(
-                index_path=agent_dir / examples_catalog_index_url,
-                expected_schema_version="x07.website.agent.examples_catalog_index@v1",
-                required_item_keys=["id", "url", "path"],
-            )
-            if rc != 0 or examples_catalog_index is None:
-                return 1
-
-            if agent_rel == "agent/latest":
-                docs_examples_root = root / "docs" / "latest" / "examples"
-            elif agent_rel.startswith("agent/v"):
-                version = agent_rel.removeprefix("agent/v")
-                docs_examples_root = root / "docs" / f"v{version}" / "examples"
-            else:
-                return err(f"unsupported agent dir for examples catalog: {agent_rel}")
-
-            if not docs_examples_root.is_dir():
-                return err(f"missing docs examples root for catalog: {docs_examples_root.relative_to(root)}")
-            catalog_files_root = agent_dir / "examples" / "catalog-files"
-            if not catalog_files_root.is_dir():
-                return err(f"missing catalog files dir: {catalog_files_root.relative_to(root)}")
-
-            cat_items = examples_catalog_index.get("items", [])
-            cat_ids: list[str] = []
-            for it in cat_items:
-                eid = it.get("id")
-                url = it.get("url")
-                rel_path = it.get("path")
-                purpose = it.get("purpose")
-                scope = it.get("scope")
-                if not isinstance(eid, str) or not eid:
-                    return err(
-                        f"{(agent_dir / examples_catalog_index_url).relative_to(root)} item.id must be non-empty string"
-                    )
-                if not isinstance(url, str) or not url:
-                    return err(
-                        f"{(agent_dir / examples_catalog_index_url).relative_to(root)} item.url must be non-empty string"
-                    )
-                if not isinstance(rel_path, str) or not rel_path:
-                    return err(
-                        f"{(agent_dir / examples_catalog_index_url).relative_to(root)} item.path must be non-empty string"
-                    )
-                if purpose is not None and not isinstance(purpose, str):
-                    return err(
-                        f"{(agent_dir / examples_catalog_index_url).relative_to(root)} item.purpose must be string|null"
-                    )
-                if scope is not None and scope not in ("top_level", "nested"):
+            for k in ("id", "docs_url", "report_schema_url"):
+                if descriptor.get(k) != it.get(k):
                     return err(
-                        f"{(agent_dir / examples_catalog_index_url).relative_to(root)} item.scope must be top_level|nested|null"
+                        f"{descriptor_path.relative_to(root)} {k} mismatch",
+                        path=descriptor_path,
+                        pointer=f"/{k}",
                     )
-                if not rel_path.endswith(".x07.json"):
-                    return err(
-                        f"{(agent_dir / examples_catalog_index_url).relative_to(root)} item.path must end with .x07.json"
-                    )
-                expected_url = f"{agent_url_prefix}/examples/catalog-files/{rel_path}"
-                if url != expected_url:
-                    return err(
-                        f"{(agent_dir / examples_catalog_index_url).relative_to(root)} item.url mismatch: expected {expected_url}"
-                    )
-                target = catalog_files_root / rel_path
-                if not target.is_file():
-                    return err(
-                        f"{(agent_dir / examples_catalog_index_url).relative_to(root)} missing catalog file: {target.relative_to(root)}"
-                    )
-                source = docs_examples_root / rel_path
-                if not source.is_file():
-                    return err(
-                        f"{(agent_dir / examples_catalog_index_url).relative_to(root)} missing source docs example file: {source.relative_to(root)}"
-                    )
-                if source.read_bytes() != target.read_bytes():
-                    return err(
-                        f"{(agent_dir / examples_catalog_index_url).relative_to(root)} catalog file differs from docs source: {target.relative_to(root)}"
-                    )
-                expected_scope = "top_level" if len(Path(rel_path).parts) == 1 else "nested"
-                if scope is not None and scope != expected_scope:
-                    return err(
-                        f"{(agent_dir / examples_catalog_index_url).relative_to(root)} item.scope mismatch for {rel_path}"
-                    )
-                cat_ids.append(eid)
-
-            if cat_ids != sorted(cat_ids):
-                return err(f"{(agent_dir / examples_catalog_index_url).relative_to(root)} items must be sorted by id")
-
-            expected_cat_ids = sorted(
-                p.relative_to(docs_examples_root).as_posix().removesuffix(".x07.json")
-                for p in docs_examples_root.rglob("*.x07.json")
-            )
-            if cat_ids != expected_cat_ids:
-                return err(
-                    f"{(agent_dir / examples_catalog_index_url).relative_to(root)} items do not match docs examples"
-                )
-            actual_catalog_paths = sorted(
-                p.relative_to(catalog_files_root).as_posix().removesuffix(".x07.json")
-                for p in catalog_files_root.rglob("*.x07.json")
-            )
-            if actual_catalog_paths != expected_cat_ids:
+            if not isinstance(descriptor.get("summary"), str):
                 return err(
-                    f"{(agent_dir / examples_catalog_index_url).relative_to(root)} catalog-files tree does not match docs examples"
+                    f"{descriptor_path.relative_to(root)} summary must be a string",
+                    path=descriptor_path,
+                    pointer="/summary",
                 )
+        return 0
 
-        # ---- packages index (optional for older toolchains) ----
-        if packages_index_url:
-            rc, packages_index = check_index_common(
-                index_path=agent_dir / packages_index_url,
-                expected_schema_version="x07.website.agent.packages_index@v1",
-                required_item_keys=["name", "version", "url"],
-            )
-            if rc != 0 or packages_index is None:
-                return 1
+    def check_agent_dir(agent_dir: Path) -> int:
+        # One scan and one JSON parse per file; the index rules in _index_rules.py work from these.
+        report.rule = "agent.index"
+        tree = scans.get(agent_dir)
+        report.count_files(len(tree.walk_files()))
+        view = _index_rules.AgentDirView(root, agent_dir, tree)
 
-            def parse_semver(v: str) -> tuple[int, int, int] | None:
-                parts = v.split(".")
-                if len(parts) != 3:
-                    return None
-                try:
-                    major = int(parts[0])
-                    minor = int(parts[1])
-                    patch = int(parts[2])
-                except ValueError:
-                    return None
-                if major < 0 or minor < 0 or patch < 0:
-                    return None
-                return (major, minor, patch)
-
-            pkg_items = packages_index.get("items", [])
-            pkg_tuples: list[tuple[str, str]] = []
-            for it in pkg_items:
-                name = it.get("name")
-                version = it.get("version")
-                url = it.get("url")
-                if not isinstance(name, str) or not name:
-                    return err(
-                        f"{(agent_dir / packages_index_url).relative_to(root)} item.name must be non-empty string"
-                    )
-                if not isinstance(version, str) or not version:
-                    return err(
-                        f"{(agent_dir / packages_index_url).relative_to(root)} item.version must be non-empty string"
-                    )
-                if not isinstance(url, str) or not url:
-                    return err(
-                        f"{(agent_dir / packages_index_url).relative_to(root)} item.url must be non-empty string"
-                    )
-                if not url.startswith(f"{agent_url_prefix}/packages/"):
-                    return err(
-                        f"{(agent_dir / packages_index_url).relative_to(root)} item.url must start with {agent_url_prefix}/packages/"
-                    )
-                if not (root / url.lstrip("/")).is_file():
-                    return err(
-                        f"{(agent_dir / packages_index_url).relative_to(root)} missing file for url: {url}"
-                    )
-                pkg_tuples.append((name, version))
+        index_path = agent_dir / "index.json"
+        if not tree.is_file_at("index.json"):
+            return err(f"missing {index_path.relative_to(root)}", path=index_path)
+        try:
+            index = view.load_json(index_path)
+        except ValueError as e:
+            return err(str(e), path=index_path)
+        if not isinstance(index, dict):
+            return err(f"{index_path.relative_to(root)} must be a JSON object", path=index_path, pointer="")
+        view.index = index
 
-            expected_sorted = sorted(
-                pkg_tuples, key=lambda t: (t[0], parse_semver(t[1]) or (0, 0, 0), t[1])
-            )
-            if pkg_tuples != expected_sorted:
-                return err(f"{(agent_dir / packages_index_url).relative_to(root)} items must be sorted")
-
-            packages_root = agent_dir / (packages_dir or "packages")
-            expected: list[tuple[str, str]] = []
-            if packages_root.is_dir():
-                for pkg_dir in sorted(packages_root.iterdir(), key=lambda p: p.name):
-                    if not pkg_dir.is_dir():
-                        continue
-                    for ver_dir in sorted(pkg_dir.iterdir(), key=lambda p: p.name):
-                        if not ver_dir.is_dir():
-                            continue
-                        if not (ver_dir / "index.json").is_file():
-                            continue
-                        expected.append((pkg_dir.name, ver_dir.name))
-            expected = sorted(expected, key=lambda t: (t[0], parse_semver(t[1]) or (0, 0, 0), t[1]))
-            if pkg_tuples != expected:
-                return err(f"{(agent_dir / packages_index_url).relative_to(root)} items do not match packages dir")
-
-        # ---- catalog index (optional for older toolchains) ----
-        if catalog_index_url:
-            rc, catalog_index = check_index_common(
-                index_path=agent_dir / catalog_index_url,
-                expected_schema_version="x07.website.agent.catalog_index@v1",
-                required_item_keys=["id", "url"],
-            )
-            if rc != 0 or catalog_index is None:
+        def report_problems(problems: list[_index_rules.Problem], rule: str) -> int:
+            for p in problems:
+                err(p.message, rule=rule, path=p.path, pointer=p.pointer)
+            return 1 if problems else 0
+
+        # Fail-fast by default; with keep_going every check below runs and the dir fails at the end.
+        failed = False
+
+        def stop(rc: int) -> bool:
+            nonlocal failed
+            failed = failed or rc != 0
+            return rc != 0 and not keep_going
+
+        fields_ok = not report_problems(_index_rules.check_index_fields(view), "agent.index")
+        if stop(0 if fields_ok else 1):
+            return 1
+        if stop(check_manifest_views(view)):
+            return 1
+        if not fields_ok:
+            # The remaining checks follow the dirs and URLs named in index.json.
+            return 1
+        if index.get("symbols_index_url") and stop(check_symbol_index(view)):
+            return 1
+
+        report.rule = "agent.index"
+        hidden_dirs = view.dirs_named({".agent", ".codex"})
+        for hidden in hidden_dirs:
+            rel = hidden.path.relative_to(root)
+            if stop(err(f"hidden directory {hidden.name} must not be published: {rel}", path=hidden.path)):
+                return 1
+        if not tree.get(index["schemas_dir"]).files(".schema.json"):
+            schemas_dir = agent_dir / index["schemas_dir"]
+            if stop(err(f"no schemas found under {schemas_dir.relative_to(root)}", path=schemas_dir)):
                 return 1
 
-            cat_items = catalog_index.get("items", [])
-            cat_ids: list[str] = []
-            for it in cat_items:
-                cid = it.get("id")
-                url = it.get("url")
-                if not isinstance(cid, str) or not cid:
-                    return err(
-                        f"{(agent_dir / catalog_index_url).relative_to(root)} item.id must be non-empty string"
-                    )
-                if not isinstance(url, str) or not url:
-                    return err(
-                        f"{(agent_dir / catalog_index_url).relative_to(root)} item.url must be non-empty string"
-                    )
-                if not url.startswith(f"{agent_url_prefix}/catalog/"):
-                    return err(
-                        f"{(agent_dir / catalog_index_url).relative_to(root)} item.url must start with {agent_url_prefix}/catalog/"
-                    )
-                if not (root / url.lstrip("/")).is_file():
-                    return err(f"{(agent_dir / catalog_index_url).relative_to(root)} missing file for url: {url}")
-                cat_ids.append(cid)
+        skills_ok = True
+        for rule in _index_rules.AGENT_INDEX_RULES:
+            # Optional indexes are absent from older toolchains' index.json.
+            if index.get(rule.url_field) is None:
+                continue
+            rc = report_problems(_index_rules.check_index(view, rule), rule.rule_id)
+            if rule.url_field == "skills_index_url":
+                skills_ok = rc == 0
+            if stop(rc):
+                return 1
 
-            if cat_ids != sorted(cat_ids):
-                return err(f"{(agent_dir / catalog_index_url).relative_to(root)} items must be sorted by id")
+        # The descriptors are checked against the skills index items.
+        if skills_ok and stop(check_skill_descriptors(view)):
+            return 1
 
-            expected_cat_ids = sorted(
-                p.name.removesuffix(".json")
-                for p in (agent_dir / "catalog").glob("*.json")
-                if p.name != "index.json"
-            )
-            if cat_ids != expected_cat_ids:
-                return err(f"{(agent_dir / catalog_index_url).relative_to(root)} items do not match catalog dir")
-
-        # ---- skills index ----
-        rc, skills_index = check_index_common(
-            index_path=agent_dir / skills_index_url,
-            expected_schema_version="x07.website.agent.skills_index@v1",
-            required_item_keys=["id", "docs_url", "report_schema_url"],
-        )
-        if rc != 0 or skills_index is None:
+        if index.get("pack_toc_url") and stop(check_pack(view)):
             return 1
-        skill_items = skills_index.get("items", [])
-        skill_ids: list[str] = []
-        for it in skill_items:
-            sid = it.get("id")
-            docs_url = it.get("docs_url")
-            report_schema_url = it.get("report_schema_url")
-            if not isinstance(sid, str) or not sid:
-                return err(f"{(agent_dir / skills_index_url).relative_to(root)} item.id must be non-empty string")
-            if not isinstance(docs_url, str) or not docs_url:
-                return err(f"{(agent_dir / skills_index_url).relative_to(root)} item.docs_url must be non-empty string")
-            if any(x in docs_url for x in ("/.agent/", "/.codex/")):
+
+        return 1 if failed else 0
+
+    def check_entrypoints(agent_dir: Path) -> int:
+        # Only agent/latest publishes entrypoints.json.
+        report.rule = "agent.entrypoints"
+        entrypoints_path = agent_dir / "entrypoints.json"
+        if not entrypoints_path.is_file():
+            return err(f"missing {entrypoints_path.relative_to(root)}", path=entrypoints_path)
+        try:
+            entrypoints = read_json(entrypoints_path)
+        except ValueError as e:
+            return err(str(e), path=entrypoints_path)
+        if not isinstance(entrypoints, dict):
+            return err(f"{entrypoints_path.relative_to(root)} must be a JSON object", path=entrypoints_path, pointer="")
+        if entrypoints.get("schema_version") != "x07.agent.entrypoints@v1":
+            return err(
+                f"{entrypoints_path.relative_to(root)} schema_version mismatch",
+                path=entrypoints_path,
+                pointer="/schema_version",
+            )
+        latest_obj = entrypoints.get("latest")
+        if not isinstance(latest_obj, dict):
+            return err(
+                f"{entrypoints_path.relative_to(root)} latest must be an object",
+                path=entrypoints_path,
+                pointer="/latest",
+            )
+        expected_latest = {
+            "manifest": "/agent/latest/manifest.json",
+            "index": "/agent/latest/index.json",
+            "skills_index": "/agent/latest/skills/index.json",
+            "schemas_index": "/agent/latest/schemas/index.json",
+            "examples_index": "/agent/latest/examples/index.json",
+            "examples_catalog_index": "/agent/latest/examples/catalog.json",
+            "packages_index": "/agent/latest/packages/index.json",
+            "stdlib_index": "/agent/latest/stdlib/index.json",
+            "symbols_index": "/agent/latest/symbols/index.json",
+            "catalog_index": "/agent/latest/catalog/index.json",
+            "capabilities": "/agent/latest/catalog/capabilities.json",
+            "capabilities_index": "/agent/latest/capabilities/index.json",
+            "pack_toc": "/agent/latest/pack/toc.json",
+            "pack_archive": f"/agent/latest/{_agent_pack.ARCHIVE_PATH}",
+            "pack_archive_gz": f"/agent/latest/{_agent_pack.ARCHIVE_GZ_PATH}",
+        }
+        # Written at site build time (build_symbol_indexes.py, build_agent_packs.py).
+        built = {"symbols_index", "pack_toc", "pack_archive", "pack_archive_gz"}
+        report.count_files(1 + len(expected_latest))
+        for k, v in expected_latest.items():
+            if latest_obj.get(k) != v:
                 return err(
-                    f"{(agent_dir / skills_index_url).relative_to(root)} item.docs_url must not contain hidden paths: {docs_url}"
+                    f"{entrypoints_path.relative_to(root)} latest.{k} must be {v!r}",
+                    path=entrypoints_path,
+                    pointer=f"/latest/{k}",
                 )
-            if not docs_url.startswith(f"{agent_url_prefix}/skills/"):
+            if k not in built and not (root / v.lstrip("/")).is_file():
                 return err(
-                    f"{(agent_dir / skills_index_url).relative_to(root)} item.docs_url must start with {agent_url_prefix}/skills/"
+                    f"{entrypoints_path.relative_to(root)} missing file for latest.{k}: {v}",
+                    path=entrypoints_path,
+                    pointer=f"/latest/{k}",
                 )
-            if not (root / docs_url.lstrip("/")).is_file():
-                return err(f"{(agent_dir / skills_index_url).relative_to(root)} missing file for docs_url: {docs_url}")
-            if report_schema_url is not None:
-                if not isinstance(report_schema_url, str) or not report_schema_url:
-                    return err(
-                        f"{(agent_dir / skills_index_url).relative_to(root)} item.report_schema_url must be string|null"
-                    )
-                if not report_schema_url.startswith(f"{agent_url_prefix}/schemas/"):
-                    return err(
-                        f"{(agent_dir / skills_index_url).relative_to(root)} item.report_schema_url must start with {agent_url_prefix}/schemas/"
-                    )
-                if not (root / report_schema_url.lstrip("/")).is_file():
-                    return err(
-                        f"{(agent_dir / skills_index_url).relative_to(root)} missing file for report_schema_url: {report_schema_url}"
-                    )
-            skill_ids.append(sid)
-        if skill_ids != sorted(skill_ids):
-            return err(f"{(agent_dir / skills_index_url).relative_to(root)} items must be sorted by id")
+        return 0
 
-        skills_root = agent_dir / skills_dir
-        expected_skill_json = {"index.json"} | {f"{sid}.json" for sid in skill_ids}
-        actual_skill_json = sorted(p.name for p in skills_root.glob("*.json"))
-        if actual_skill_json != sorted(expected_skill_json):
-            return err(f"{skills_root.relative_to(root)} JSON files mismatch")
+    # Layout and versions file; returns (toolchain versions, latest) or None. Always fail-fast.
+    def check_structure() -> tuple[list[str], str | None] | None:
+        report.rule = "site.structure"
+        for d in ["docs", "agent", "scripts", "site", "versions"]:
+            if not (root / d).is_dir():
+                err(f"missing directory: {d}/", path=root / d)
+                return None
 
-        for it in skill_items:
-            sid = it.get("id")
-            docs_url = it.get("docs_url")
-            report_schema_url = it.get("report_schema_url")
-            if not isinstance(sid, str) or not sid:
-                return err(f"{(agent_dir / skills_index_url).relative_to(root)} item.id must be non-empty string")
-
-            descriptor_path = skills_root / f"{sid}.json"
-            if not descriptor_path.is_file():
-                return err(f"missing {descriptor_path.relative_to(root)}")
-            try:
-                descriptor = read_json(descriptor_path)
-            except ValueError as e:
-                return err(str(e))
-            if not isinstance(descriptor, dict):
-                return err(f"{descriptor_path.relative_to(root)} must be a JSON object")
-            if descriptor.get("schema_version") != "x07.website.agent.skill@v1":
-                return err(f"{descriptor_path.relative_to(root)} schema_version mismatch")
-            if descriptor.get("id") != sid:
-                return err(f"{descriptor_path.relative_to(root)} id mismatch")
-            if descriptor.get("docs_url") != docs_url:
-                return err(f"{descriptor_path.relative_to(root)} docs_url mismatch")
-            if descriptor.get("report_schema_url") != report_schema_url:
-                return err(f"{descriptor_path.relative_to(root)} report_schema_url mismatch")
-            if not isinstance(descriptor.get("summary"), str):
-                return err(f"{descriptor_path.relative_to(root)} summary must be a string")
+        agent_contract = root / "docs" / "latest" / "site" / "agent-portal-contract.md"
+        if not agent_contract.is_file():
+            err(f"missing {agent_contract.relative_to(root)}", path=agent_contract)
+            return None
 
-        # ---- entrypoints (latest only) ----
-        if agent_rel == "agent/latest":
-            entrypoints_path = agent_dir / "entrypoints.json"
-            if not entrypoints_path.is_file():
-                return err(f"missing {entrypoints_path.relative_to(root)}")
-            try:
-                entrypoints = read_json(entrypoints_path)
-            except ValueError as e:
-                return err(str(e))
-            if not isinstance(entrypoints, dict):
-                return err(f"{entrypoints_path.relative_to(root)} must be a JSON object")
-            if entrypoints.get("schema_version") != "x07.agent.entrypoints@v1":
-                return err(f"{entrypoints_path.relative_to(root)} schema_version mismatch")
-            latest_obj = entrypoints.get("latest")
-            if not isinstance(latest_obj, dict):
-                return err(f"{entrypoints_path.relative_to(root)} latest must be an object")
-            expected_latest = {
-                "manifest": "/agent/latest/manifest.json",
-                "index": "/agent/latest/index.json",
-                "skills_index": "/agent/latest/skills/index.json",
-                "schemas_index": "/agent/latest/schemas/index.json",
-                "examples_index": "/agent/latest/examples/index.json",
-                "examples_catalog_index": "/agent/latest/examples/catalog.json",
-                "packages_index": "/agent/latest/packages/index.json",
-                "stdlib_index": "/agent/latest/stdlib/index.json",
-                "catalog_index": "/agent/latest/catalog/index.json",
-                "capabilities": "/agent/latest/catalog/capabilities.json",
-            }
-            for k, v in expected_latest.items():
-                if latest_obj.get(k) != v:
-                    return err(f"{entrypoints_path.relative_to(root)} latest.{k} must be {v!r}")
-                if not (root / v.lstrip("/")).is_file():
-                    return err(f"{entrypoints_path.relative_to(root)} missing file for latest.{k}: {v}")
+        versions_path = root / "versions" / "toolchain_versions.json"
+        if not versions_path.is_file():
+            err("missing versions/toolchain_versions.json", path=versions_path)
+            return None
 
-        return 0
+        static_versions_path = root / "site" / "static" / "versions" / "toolchain_versions.json"
+        if not static_versions_path.is_file():
+            err("missing site/static/versions/toolchain_versions.json", path=static_versions_path)
+            return None
 
-    for d in ["docs", "agent", "scripts", "site", "versions"]:
-        if not (root / d).is_dir():
-            return err(f"missing directory: {d}/")
+        try:
+            versions = read_json(versions_path)
+        except ValueError as e:
+            err(str(e), path=versions_path)
+            return None
+        try:
+            static_versions = read_json(static_versions_path)
+        except ValueError as e:
+            err(str(e), path=static_versions_path)
+            return None
+        report.count_files(2)
 
-    agent_contract = root / "docs" / "latest" / "site" / "agent-portal-contract.md"
-    if not agent_contract.is_file():
-        return err(f"missing {agent_contract.relative_to(root)}")
+        report.rule = "site.versions"
+        if not isinstance(versions, dict):
+            err("versions/toolchain_versions.json must be a JSON object", path=versions_path, pointer="")
+            return None
+        if versions != static_versions:
+            err(
+                "site/static/versions/toolchain_versions.json must match versions/toolchain_versions.json",
+                path=static_versions_path,
+            )
+            return None
+        if versions.get("schema_version") != "x07.website.toolchain-versions@0.1.0":
+            err(
+                "versions/toolchain_versions.json schema_version mismatch",
+                path=versions_path,
+                pointer="/schema_version",
+            )
+            return None
+        if versions.get("latest_toolchain_version") is not None and not isinstance(
+            versions.get("latest_toolchain_version"), str
+        ):
+            err(
+                "versions/toolchain_versions.json latest_toolchain_version must be string|null",
+                path=versions_path,
+                pointer="/latest_toolchain_version",
+            )
+            return None
+        if not isinstance(versions.get("versions"), list):
+            err("versions/toolchain_versions.json versions must be an array", path=versions_path, pointer="/versions")
+            return None
 
-    versions_path = root / "versions" / "toolchain_versions.json"
-    if not versions_path.is_file():
-        return err("missing versions/toolchain_versions.json")
+        toolchain_versions: list[str] = []
+        for i, entry in enumerate(versions["versions"]):
+            if not isinstance(entry, dict):
+                err("versions entry must be an object", path=versions_path, pointer=f"/versions/{i}")
+                return None
+            toolchain_version = entry.get("toolchain_version")
+            if not isinstance(toolchain_version, str) or not toolchain_version:
+                err(
+                    "versions entry toolchain_version must be non-empty string",
+                    path=versions_path,
+                    pointer=f"/versions/{i}/toolchain_version",
+                )
+                return None
+            if toolchain_version in toolchain_versions:
+                err(
+                    f"duplicate toolchain_version: {toolchain_version}",
+                    path=versions_path,
+                    pointer=f"/versions/{i}/toolchain_version",
+                )
+                return None
+            toolchain_versions.append(toolchain_version)
 
-    static_versions_path = root / "site" / "static" / "versions" / "toolchain_versions.json"
-    if not static_versions_path.is_file():
-        return err("missing site/static/versions/toolchain_versions.json")
+            docs_dir = root / "docs" / f"v{toolchain_version}"
+            agent_dir = root / "agent" / f"v{toolchain_version}"
+            if not docs_dir.is_dir():
+                err(f"missing docs for toolchain_version {toolchain_version}: {docs_dir}", path=docs_dir)
+                return None
+            if not agent_dir.is_dir():
+                err(f"missing agent for toolchain_version {toolchain_version}: {agent_dir}", path=agent_dir)
+                return None
 
-    try:
-        versions = read_json(versions_path)
-    except ValueError as e:
-        return err(str(e))
+        latest = versions.get("latest_toolchain_version")
+        if latest:
+            if latest not in toolchain_versions:
+                err(
+                    f"latest_toolchain_version not in versions: {latest}",
+                    path=versions_path,
+                    pointer="/latest_toolchain_version",
+                )
+                return None
+            for d in ["docs/latest", "agent/latest"]:
+                if not (root / d).is_dir():
+                    err(f"missing directory: {d}/", path=root / d)
+                    return None
+        return toolchain_versions, latest
 
-    try:
-        static_versions = read_json(static_versions_path)
-    except ValueError as e:
-        return err(str(e))
-
-    if not isinstance(versions, dict):
-        return err("versions/toolchain_versions.json must be a JSON object")
-    if versions != static_versions:
-        return err("site/static/versions/toolchain_versions.json must match versions/toolchain_versions.json")
-    if versions.get("schema_version") != "x07.website.toolchain-versions@0.1.0":
-        return err("versions/toolchain_versions.json schema_version mismatch")
-    if versions.get("latest_toolchain_version") is not None and not isinstance(
-        versions.get("latest_toolchain_version"), str
-    ):
-        return err("versions/toolchain_versions.json latest_toolchain_version must be string|null")
-    if not isinstance(versions.get("versions"), list):
-        return err("versions/toolchain_versions.json versions must be an array")
-
-    rc = check_install_manifests()
-    if rc != 0:
-        return rc
-
-    seen_versions: set[str] = set()
-    for entry in versions["versions"]:
-        if not isinstance(entry, dict):
-            return err("versions entry must be an object")
-        toolchain_version = entry.get("toolchain_version")
-        if not isinstance(toolchain_version, str) or not toolchain_version:
-            return err("versions entry toolchain_version must be non-empty string")
-        if toolchain_version in seen_versions:
-            return err(f"duplicate toolchain_version: {toolchain_version}")
-        seen_versions.add(toolchain_version)
-
-        docs_dir = root / "docs" / f"v{toolchain_version}"
-        agent_dir = root / "agent" / f"v{toolchain_version}"
-        if not docs_dir.is_dir():
-            return err(f"missing docs for toolchain_version {toolchain_version}: {docs_dir}")
-        if not agent_dir.is_dir():
-            return err(f"missing agent for toolchain_version {toolchain_version}: {agent_dir}")
+    with report.phase("structure"):
+        structure = check_structure()
+    if structure is None:
+        return 1
+    toolchain_versions, latest = structure
 
-        rc = check_agent_dir(agent_dir)
-        if rc != 0:
-            return rc
+    failed = 0
 
-    latest = versions.get("latest_toolchain_version")
-    if latest:
-        if latest not in seen_versions:
-            return err(f"latest_toolchain_version not in versions: {latest}")
-        for d in ["docs/latest", "agent/latest"]:
-            if not (root / d).is_dir():
-                return err(f"missing directory: {d}/")
-        rc = compare_trees(
-            a=root / "docs" / "latest",
-            b=root / "docs" / f"v{latest}",
-            label="docs/latest",
-        )
-        if rc != 0:
-            return rc
-        rc = compare_agent_payload(
-            latest_dir=root / "agent" / "latest",
-            version_dir=root / "agent" / f"v{latest}",
-        )
-        if rc != 0:
-            return rc
-        rc = check_agent_dir(root / "agent" / "latest")
+    # Returns False when the phase failed and the run must stop.
+    def run_phase(name: str, check) -> bool:
+        nonlocal failed
+        with report.phase(name):
+            rc = check()
         if rc != 0:
-            return rc
+            failed += 1
+        return rc == 0 or keep_going
 
+    if scope is None or scope.covers_install():
+        if not run_phase("install-manifests", check_install_manifests):
+            return 1
+    for toolchain_version in toolchain_versions:
+        if scope is not None and not scope.covers_version(toolchain_version):
+            continue
+        agent_dir = root / "agent" / f"v{toolchain_version}"
+        if not run_phase(f"agent-dir:agent/v{toolchain_version}", lambda: check_agent_dir(agent_dir)):
+            return 1
+
+    if latest and (scope is None or scope.covers_latest(latest)):
+        if not run_phase(
+            "tree:docs/latest",
+            lambda: compare_trees(a=root / "docs" / "latest", b=root / "docs" / f"v{latest}", label="docs/latest"),
+        ):
+            return 1
+        if not run_phase(
+            "tree:agent/latest-payload",
+            lambda: compare_agent_payload(
+                latest_dir=root / "agent" / "latest", version_dir=root / "agent" / f"v{latest}"
+            ),
+        ):
+            return 1
+        if not run_phase("agent-dir:agent/latest", lambda: check_agent_dir(root / "agent" / "latest")):
+            return 1
+        if not run_phase("entrypoints", lambda: check_entrypoints(root / "agent" / "latest")):
+            return 1
+
+    if failed:
+        print(f"ERROR: {len(report.violations)} violations in {failed} failed phases", file=sys.stderr)
+        return 1
     print("ok: website repo structure")
     return 0
 
 
 if __name__ == "__main__":
-    raise SystemExit(main(sys.argv[1:]))
+    try:
+        raise SystemExit(main(sys.argv[1:]))
+    finally:
+        _hash_cache.save()
@@ -50,6 +50,7 @@ curl -fsSL "${BASE}/agent/latest/packages/index.json" >/dev/null
 curl -fsSL "${BASE}/agent/latest/catalog/index.json" >/dev/null
 curl -fsSL "${BASE}/agent/latest/catalog/capabilities.json" >/dev/null
 curl -fsSL "${BASE}/agent/latest/stdlib/index.json" >/dev/null
+curl -fsSL "${BASE}/agent/latest/symbols/index.json" >/dev/null
 curl -fsSL "${BASE}/agent/latest/skills/x07-run/SKILL.md" >/dev/null
 
 python3 - "${BASE}" <<'PY'
@@ -3,17 +3,32 @@ set -euo pipefail
 
 ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
 
+# X07_CHECK_SINCE=<git-rev> limits the Python checks to what changed since that revision.
+SINCE_ARGS=()
+if [[ -n "${X07_CHECK_SINCE:-}" ]]; then
+  SINCE_ARGS=(--since "${X07_CHECK_SINCE}")
+fi
+
 bash "${ROOT}/scripts/ci/check_site_generated.sh"
 "${ROOT}/scripts/site/build.sh"
 
 echo "[check] website repo structure"
-python3 "${ROOT}/scripts/check_site.py" --check
+python3 "${ROOT}/scripts/check_site.py" --check ${SINCE_ARGS[@]+"${SINCE_ARGS[@]}"}
 
 echo "[check] agent indexes are up to date"
-python3 "${ROOT}/scripts/generate_agent_indexes.py" --check --agent-dir agent/latest
+python3 "${ROOT}/scripts/generate_agent_indexes.py" --check --all ${SINCE_ARGS[@]+"${SINCE_ARGS[@]}"}
 
 echo "[check] agent package indexes validate"
-python3 "${ROOT}/scripts/ci/validate_agent_package_indexes.py" --check --agent-dir agent/latest
+python3 "${ROOT}/scripts/ci/validate_agent_package_indexes.py" --check --agent-dir agent/latest ${SINCE_ARGS[@]+"${SINCE_ARGS[@]}"}
+
+echo "[check] built symbol indexes match their sources"
+python3 "${ROOT}/scripts/build_symbol_indexes.py" --check
+
+echo "[check] built manifest views match the manifests"
+python3 "${ROOT}/scripts/build_manifest_views.py" --check
+
+echo "[check] built agent packs match the agent dirs"
+python3 "${ROOT}/scripts/build_agent_packs.py" --check
 
 echo "[check] built agent endpoints exist"
 BUILD_DIR="${ROOT}/site/build"
@@ -21,6 +36,7 @@ for rel in \
   "agent/latest/entrypoints.json" \
   "agent/latest/index.json" \
   "agent/latest/manifest.json" \
+  "agent/latest/manifest/index.json" \
   "agent/latest/skills/index.json" \
   "agent/latest/schemas/index.json" \
   "agent/latest/examples/index.json" \
@@ -30,6 +46,9 @@ for rel in \
   "agent/latest/catalog/index.json" \
   "agent/latest/catalog/capabilities.json" \
   "agent/latest/stdlib/index.json" \
+  "agent/latest/pack/toc.json" \
+  "agent/latest/pack/agent-pack.tar.gz" \
+  "agent/latest/symbols/index.json" \
   "agent/latest/skills/x07-io-streams.json" \
   "agent/latest/skills/x07-run/SKILL.md" \
 ; do
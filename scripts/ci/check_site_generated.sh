@@ -3,11 +3,17 @@ set -euo pipefail
 
 ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
 
+# X07_CHECK_SINCE=<git-rev> limits the Python checks to what changed since that revision.
+SINCE_ARGS=()
+if [[ -n "${X07_CHECK_SINCE:-}" ]]; then
+  SINCE_ARGS=(--since "${X07_CHECK_SINCE}")
+fi
+
 echo "[check] generate site docusaurus inputs"
 python3 "$ROOT/scripts/site/gen_docusaurus_inputs.py" --repo-root "$ROOT"
 
 echo "[check] verify site docusaurus inputs are idempotent"
-python3 "$ROOT/scripts/site/gen_docusaurus_inputs.py" --repo-root "$ROOT" --check
+python3 "$ROOT/scripts/site/gen_docusaurus_inputs.py" --repo-root "$ROOT" --check ${SINCE_ARGS[@]+"${SINCE_ARGS[@]}"}
 
 echo "[ok] site generated inputs"
 
@@ -3,6 +3,12 @@ set -euo pipefail
 
 ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)"
 
-python3 "${ROOT}/scripts/check_site.py" --check
+# X07_CHECK_SINCE=<git-rev> limits the Python checks to what changed since that revision.
+SINCE_ARGS=()
+if [[ -n "${X07_CHECK_SINCE:-}" ]]; then
+  SINCE_ARGS=(--since "${X07_CHECK_SINCE}")
+fi
+
+python3 "${ROOT}/scripts/check_site.py" --check ${SINCE_ARGS[@]+"${SINCE_ARGS[@]}"}
 printf 'OK %s\n' "$(basename "$0")"
 
@@ -8,6 +8,9 @@ import sys
 from pathlib import Path
 from typing import Any, Iterable
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import _change_scope  # noqa: E402  (scripts/_change_scope.py)
+
 
 _EXPECTED_INSTANCE_SCHEMA_VERSION = "x07.website.package-index@0.2.0"
 
@@ -73,6 +76,7 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         default=None,
         help="optional: write a machine-readable report JSON to this path",
     )
+    _change_scope.add_argument(ap)
     return ap.parse_args(argv)
 
 
@@ -436,6 +440,8 @@ def main(argv: list[str]) -> int:
     repo_root = repo_root.resolve()
 
     agent_dirs = args.agent_dir or ["agent/latest"]
+    # Each index is validated on its own, so a scoped run only needs the changed files.
+    scope = _change_scope.from_args(repo_root, args.since)
 
     errors_out: list[dict] = []
     checked_files = 0
@@ -462,6 +468,8 @@ def main(argv: list[str]) -> int:
                 }
             )
             continue
+        if scope is not None:
+            idx_files = [p for p in idx_files if scope.covers_path(_rel(repo_root, p))]
 
         for idx_path in idx_files:
             if len(errors_out) >= args.max_errors:
@@ -482,6 +490,7 @@ def main(argv: list[str]) -> int:
             "expected_instance_schema_version": args.expected_schema_version,
             "agent_dirs": agent_dirs,
             "glob": args.glob,
+            "since": args.since,
             "scanned_files": scanned_files,
             "checked_files": checked_files,
             "errors": errors_out,
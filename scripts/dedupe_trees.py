@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+
+import _content_store
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    ap = argparse.ArgumentParser(
+        description="Hardlink identical files under docs/ and agent/ through a shared object store."
+    )
+    ap.add_argument("--object-store", required=True, type=Path)
+    ap.add_argument(
+        "--tree",
+        action="append",
+        default=[],
+        help="tree to dedupe, relative to the repo root (repeatable). Default: docs, agent",
+    )
+    return ap.parse_args(argv)
+
+
+def main(argv: list[str]) -> int:
+    args = parse_args(argv)
+    root = Path(__file__).resolve().parents[1]
+    store = args.object_store.resolve()
+
+    trees = args.tree or ["docs", "agent"]
+    for rel in trees:
+        tree = root / rel
+        if not tree.is_dir():
+            print(f"ERROR: tree not found: {rel}", file=sys.stderr)
+            return 2
+        relinked = _content_store.dedupe_tree(store, tree)
+        print(f"ok: {rel}: relinked {relinked} files into {store}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -1,17 +1,62 @@
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
+import contextlib
+import io
 import json
+import os
 import re
 import shutil
 import sys
+import time
 from pathlib import Path
 
+import _agent_pack
+import _canonical_output
+import _change_scope
+import _content_store
+import _hash_cache
+import _manifest_views
+import _symbol_index
+import _tree_model
+from _tree_model import Node
+
 
 def parse_args(argv: list[str]) -> argparse.Namespace:
     ap = argparse.ArgumentParser()
-    ap.add_argument("--agent-dir", required=True, type=Path)
+    ap.add_argument(
+        "--agent-dir",
+        action="append",
+        default=[],
+        type=Path,
+        help="agent dir to generate/check (repeatable)",
+    )
+    ap.add_argument(
+        "--all",
+        action="store_true",
+        help="every agent/vX.Y.Z listed in versions/toolchain_versions.json, plus agent/latest",
+    )
     ap.add_argument("--check", action="store_true")
+    ap.add_argument("--jobs", type=int, default=None, help="parallel workers (default: CPU count)")
+    ap.add_argument(
+        "--json-report",
+        type=Path,
+        default=None,
+        help="optional: write a machine-readable report JSON to this path",
+    )
+    ap.add_argument(
+        "--object-store",
+        type=Path,
+        default=None,
+        help="share copied file contents through a sha256-keyed object store (hardlinks)",
+    )
+    ap.add_argument(
+        "--link-examples",
+        action="store_true",
+        help="hardlink examples/catalog-files to docs/*/examples instead of copying",
+    )
+    _change_scope.add_argument(ap)
     return ap.parse_args(argv)
 
 
@@ -22,40 +67,21 @@ def _read_text(path: Path) -> str:
     return path.read_text(encoding="utf-8")
 
 
-def _write_text_if_changed(*, path: Path, content: str, check: bool) -> None:
-    content = content.replace("\r\n", "\n").replace("\r", "\n")
-    if not content.endswith("\n"):
-        content += "\n"
-
-    if check:
-        if not path.is_file():
-            raise SystemExit(f"[CHECK] missing {path}")
-        existing = _read_text(path).replace("\r\n", "\n").replace("\r", "\n")
-        if existing != content:
-            raise SystemExit(f"[CHECK] out of date: {path}")
+def _write_if_changed(*, path: Path, render, check: bool) -> None:
+    state = _canonical_output.status(path, render)
+    if state == "same":
         return
-
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
+    if check:
+        raise SystemExit(f"[CHECK] {'missing' if state == 'missing' else 'out of date:'} {path}")
+    _canonical_output.write(path, render)
 
 
-def _write_json_if_changed(*, path: Path, obj: object, check: bool) -> None:
-    content = json.dumps(obj, indent=2)
-    _write_text_if_changed(path=path, content=content, check=check)
+def _write_text_if_changed(*, path: Path, content: str, check: bool) -> None:
+    _write_if_changed(path=path, render=lambda: _canonical_output.text_chunks(content), check=check)
 
 
-def _iter_files_sorted(root: Path) -> list[Path]:
-    out: list[Path] = []
-    for p in root.rglob("*"):
-        if not p.is_file():
-            continue
-        rel = p.relative_to(root)
-        if rel.name == ".DS_Store":
-            continue
-        if any(part.startswith("._") for part in rel.parts):
-            continue
-        out.append(rel)
-    return sorted(out, key=lambda p: p.as_posix())
+def _write_json_if_changed(*, path: Path, obj: object, check: bool) -> None:
+    _write_if_changed(path=path, render=lambda: _canonical_output.json_chunks(obj), check=check)
 
 
 def _ignore_macos_metadata(_: str, names: list[str]) -> set[str]:
@@ -100,11 +126,15 @@ def _parse_skill_summary(skill_md: Path) -> str:
     return ""
 
 
-def _generate_schemas_index(*, agent_dir: Path, rel_agent_dir: Path, url_prefix: str) -> dict:
-    schemas_dir = agent_dir / "schemas"
+def _digest_fields(node: Node) -> dict:
+    """Item fields that let a client revalidate its cached copy of the file without fetching it."""
+    return {"sha256": node.sha256, "size": node.size}
+
+
+def _generate_schemas_index(*, tree: Node, rel_agent_dir: Path, url_prefix: str) -> dict:
     items: list[dict] = []
-    for p in sorted(schemas_dir.glob("*.schema.json"), key=lambda x: x.name):
-        items.append({"id": p.name, "url": f"{url_prefix}/schemas/{p.name}"})
+    for p in tree.get("schemas").files(".schema.json"):
+        items.append({"id": p.name, "url": f"{url_prefix}/schemas/{p.name}", **_digest_fields(p)})
     return {
         "schema_version": "x07.website.agent.schemas_index@v1",
         "generated_from": f"{rel_agent_dir.as_posix()}/schemas/*.schema.json",
@@ -112,16 +142,16 @@ def _generate_schemas_index(*, agent_dir: Path, rel_agent_dir: Path, url_prefix:
     }
 
 
-def _generate_examples_index(*, agent_dir: Path, rel_agent_dir: Path, url_prefix: str) -> dict:
-    examples_dir = agent_dir / "examples"
+def _generate_examples_index(*, tree: Node, rel_agent_dir: Path, url_prefix: str) -> dict:
     items: list[dict] = []
-    for p in sorted(examples_dir.glob("*.x07.json"), key=lambda x: x.name):
+    for p in tree.get("examples").files(".x07.json"):
         example_id = _strip_suffix(p.name, ".x07.json")
         items.append(
             {
                 "id": example_id,
                 "purpose": _infer_example_purpose(example_id),
                 "url": f"{url_prefix}/examples/{p.name}",
+                **_digest_fields(p),
             }
         )
     return {
@@ -148,50 +178,65 @@ def _resolve_docs_examples_source(*, repo_root: Path, rel_agent_dir: Path) -> tu
     return (docs_dir, generated_from)
 
 
-def _iter_examples_catalog_rel_paths(docs_examples_dir: Path) -> list[Path]:
-    rel_paths: list[Path] = []
-    for p in docs_examples_dir.rglob("*.x07.json"):
-        rel = p.relative_to(docs_examples_dir)
-        if rel.name == ".DS_Store":
-            continue
-        if any(part.startswith("._") for part in rel.parts):
-            continue
-        rel_paths.append(rel)
-    return sorted(rel_paths, key=lambda p: p.as_posix())
-
-
-def _sync_examples_catalog_files(*, agent_dir: Path, docs_examples_dir: Path, check: bool) -> list[Path]:
-    rel_paths = _iter_examples_catalog_rel_paths(docs_examples_dir)
+def _sync_examples_catalog_files(
+    *,
+    tree: Node,
+    agent_dir: Path,
+    docs_examples: Node,
+    check: bool,
+    store: Path | None,
+    link: bool = False,
+) -> list[Path]:
+    sources = {docs_examples.rel_of(n): n for n in docs_examples.walk_files(".x07.json")}
+    rel_paths = [Path(rel) for rel in sources]
     catalog_files_dir = agent_dir / "examples" / "catalog-files"
 
     if check:
-        if not catalog_files_dir.is_dir():
+        catalog_files = tree.get("examples/catalog-files")
+        if catalog_files is None or not catalog_files.is_dir:
             raise SystemExit(f"[CHECK] missing {catalog_files_dir}")
-        actual = sorted(catalog_files_dir.rglob("*.x07.json"), key=lambda p: p.relative_to(catalog_files_dir).as_posix())
-        actual_rel = [p.relative_to(catalog_files_dir) for p in actual]
-        if actual_rel != rel_paths:
+        actual = {catalog_files.rel_of(n): n for n in catalog_files.walk_files(".x07.json")}
+        if list(actual) != list(sources):
             raise SystemExit(f"[CHECK] examples catalog files out of date: {catalog_files_dir}")
-        for rel in rel_paths:
-            src = docs_examples_dir / rel
-            dst = catalog_files_dir / rel
-            if src.read_bytes() != dst.read_bytes():
-                raise SystemExit(f"[CHECK] examples catalog file differs: {dst}")
+        for rel, src in sources.items():
+            if not _tree_model.same_content(src, actual[rel]):
+                raise SystemExit(f"[CHECK] examples catalog file differs: {catalog_files_dir / rel}")
         return rel_paths
 
-    if catalog_files_dir.exists():
-        shutil.rmtree(catalog_files_dir)
+    # Mirror incrementally: copy changed files, drop orphans, leave identical files alone
+    # (or, with `link`, turn them into hardlinks of the docs copy).
+    catalog_files = tree.get("examples/catalog-files")
+    if catalog_files is not None and not catalog_files.is_dir:
+        catalog_files_dir.unlink()
+        catalog_files = None
+    existing = {} if catalog_files is None else {catalog_files.rel_of(n): n for n in catalog_files.walk_files()}
+
     catalog_files_dir.mkdir(parents=True, exist_ok=True)
-    for rel in rel_paths:
-        src = docs_examples_dir / rel
-        dst = catalog_files_dir / rel
-        dst.parent.mkdir(parents=True, exist_ok=True)
-        dst.write_bytes(src.read_bytes())
+    for rel, src in sources.items():
+        dst = existing.get(rel)
+        if dst is not None and _tree_model.same_content(src, dst):
+            if link and (src.dev, src.ino) != (dst.dev, dst.ino):
+                _content_store.link_or_copy(src.path, dst.path)
+            continue
+        if link:
+            _content_store.link_or_copy(src.path, catalog_files_dir / rel)
+        else:
+            _content_store.copy_file(src.path, catalog_files_dir / rel, store=store)
+
+    orphans = sorted(existing.keys() - sources.keys())
+    for rel in orphans:
+        (catalog_files_dir / rel).unlink()
+    if orphans:
+        for dirpath, _, _ in sorted(os.walk(catalog_files_dir), reverse=True):
+            if dirpath != str(catalog_files_dir) and not os.listdir(dirpath):
+                os.rmdir(dirpath)
     return rel_paths
 
 
 def _generate_examples_catalog_index(
     *,
     rel_paths: list[Path],
+    docs_examples: Node,
     generated_from: str,
     url_prefix: str,
 ) -> dict:
@@ -208,6 +253,8 @@ def _generate_examples_catalog_index(
                 "scope": "top_level" if len(rel.parts) == 1 else "nested",
                 "path": rel_posix,
                 "url": f"{url_prefix}/examples/catalog-files/{rel_posix}",
+                # catalog-files/ mirrors docs/*/examples, so the source digest is the published one.
+                **_digest_fields(docs_examples.get(rel_posix)),
             }
         )
     items.sort(key=lambda it: it["id"])
@@ -234,20 +281,17 @@ def _parse_semver(v: str) -> tuple[int, int, int] | None:
     return (major, minor, patch)
 
 
-def _generate_packages_index(*, agent_dir: Path, rel_agent_dir: Path, url_prefix: str) -> dict:
-    packages_dir = agent_dir / "packages"
+def _generate_packages_index(*, tree: Node, rel_agent_dir: Path, url_prefix: str) -> dict:
     items: list[dict] = []
-    for pkg_dir in sorted(packages_dir.iterdir(), key=lambda p: p.name):
-        if not pkg_dir.is_dir():
-            continue
+    for pkg_dir in tree.get("packages").dirs():
         for ver_dir in sorted(
-            [p for p in pkg_dir.iterdir() if p.is_dir() and _parse_semver(p.name) is not None],
+            [p for p in pkg_dir.dirs() if _parse_semver(p.name) is not None],
             key=lambda p: _parse_semver(p.name) or (0, 0, 0),
         ):
-            idx_path = ver_dir / "index.json"
-            if not idx_path.is_file():
+            idx_node = ver_dir.get("index.json")
+            if idx_node is None or idx_node.is_dir:
                 continue
-            idx = json.loads(_read_text(idx_path))
+            idx = json.loads(_read_text(idx_node.path))
             desc = idx.get("description")
             docs = idx.get("docs")
             items.append(
@@ -255,6 +299,7 @@ def _generate_packages_index(*, agent_dir: Path, rel_agent_dir: Path, url_prefix
                     "name": pkg_dir.name,
                     "version": ver_dir.name,
                     "url": f"{url_prefix}/packages/{pkg_dir.name}/{ver_dir.name}/index.json",
+                    **_digest_fields(idx_node),
                     **({"description": desc} if isinstance(desc, str) else {}),
                     **(
                         {
@@ -273,17 +318,17 @@ def _generate_packages_index(*, agent_dir: Path, rel_agent_dir: Path, url_prefix
     }
 
 
-def _generate_catalog_index(*, agent_dir: Path, rel_agent_dir: Path, url_prefix: str) -> dict | None:
-    catalog_dir = agent_dir / "catalog"
-    if not catalog_dir.is_dir():
+def _generate_catalog_index(*, tree: Node, rel_agent_dir: Path, url_prefix: str) -> dict | None:
+    catalog_dir = tree.get("catalog")
+    if catalog_dir is None or not catalog_dir.is_dir:
         return None
 
     items: list[dict] = []
-    for p in sorted(catalog_dir.glob("*.json"), key=lambda x: x.name):
+    for p in catalog_dir.files(".json"):
         if p.name == "index.json":
             continue
         item_id = _strip_suffix(p.name, ".json")
-        items.append({"id": item_id, "url": f"{url_prefix}/catalog/{p.name}"})
+        items.append({"id": item_id, "url": f"{url_prefix}/catalog/{p.name}", **_digest_fields(p)})
 
     if not items:
         return None
@@ -295,66 +340,118 @@ def _generate_catalog_index(*, agent_dir: Path, rel_agent_dir: Path, url_prefix:
     }
 
 
-def _compare_trees(*, a: Path, b: Path, label: str) -> None:
-    a_files = _iter_files_sorted(a)
-    b_files = _iter_files_sorted(b)
-    if a_files != b_files:
-        raise SystemExit(f"[CHECK] tree mismatch ({label}): {a} vs {b}")
-    for rel in a_files:
-        if (a / rel).read_bytes() != (b / rel).read_bytes():
-            raise SystemExit(f"[CHECK] file differs ({label}): {rel}")
+def _generate_capabilities_index(
+    *, tree: Node, rel_agent_dir: Path, packages_index: dict
+) -> dict | None:
+    """Resolve catalog/capabilities.json to the canonical package's index, modules and exports."""
+    caps_node = tree.get("catalog/capabilities.json")
+    if caps_node is None or caps_node.is_dir:
+        return None
+    caps = json.loads(_read_text(caps_node.path))
 
+    package_urls = {(it["name"], it["version"]): it["url"] for it in packages_index.get("items", [])}
+    items: list[dict] = []
+    for cap in caps.get("capabilities", []):
+        if not isinstance(cap, dict) or not isinstance(cap.get("id"), str):
+            continue
+        canonical = cap.get("canonical") if isinstance(cap.get("canonical"), dict) else {}
+        name = canonical.get("name")
+        version = canonical.get("version")
+        idx_node = tree.get(f"packages/{name}/{version}/index.json") if name and version else None
+
+        package = None
+        modules: list[dict] = []
+        if idx_node is not None and not idx_node.is_dir and (name, version) in package_urls:
+            package = {
+                "name": name,
+                "version": version,
+                "url": package_urls[(name, version)],
+                "index_sha256": idx_node.sha256,
+                "index_size": idx_node.size,
+            }
+            idx = json.loads(_read_text(idx_node.path))
+            for m in idx.get("modules", []):
+                if isinstance(m, dict):
+                    modules.append(
+                        {"module_id": m.get("module_id"), "path": m.get("path"), "exports": m.get("exports", [])}
+                    )
 
-def _export_skills_pack(*, agent_dir: Path, check: bool) -> list[str]:
-    skills_dir = agent_dir / "skills"
-    skills_pack = skills_dir / "pack" / "skills"
-    if not skills_pack.is_dir():
-        return []
+        items.append(
+            {
+                "id": cap["id"],
+                **({"summary": cap["summary"]} if isinstance(cap.get("summary"), str) else {}),
+                **({"status": cap["status"]} if isinstance(cap.get("status"), str) else {}),
+                **({"worlds": cap["worlds"]} if isinstance(cap.get("worlds"), list) else {}),
+                "package": package,
+                "modules": modules,
+            }
+        )
 
-    expected_skill_ids: list[str] = []
-    for child in sorted(skills_pack.iterdir(), key=lambda p: p.name):
-        if not child.is_dir():
-            continue
-        if not (child / "SKILL.md").is_file():
-            continue
-        expected_skill_ids.append(child.name)
+    return {
+        "schema_version": "x07.website.agent.capabilities_index@v1",
+        "generated_from": f"{rel_agent_dir.as_posix()}/catalog/capabilities.json",
+        "items": items,
+    }
+
+
+def _compare_trees(*, a: Node, b: Node, label: str) -> None:
+    only_a, only_b, differ = _tree_model.diff_files(a, b)
+    if only_a or only_b:
+        raise SystemExit(f"[CHECK] tree mismatch ({label}): {a.path} vs {b.path}")
+    if differ:
+        raise SystemExit(f"[CHECK] file differs ({label}): {differ[0]}")
 
-    exported_skill_ids: list[str] = []
-    for child in sorted(skills_dir.iterdir(), key=lambda p: p.name):
-        if not child.is_dir():
-            continue
-        if child.name in ("dev-scripts", "pack"):
-            continue
-        exported_skill_ids.append(child.name)
+
+def _export_skills_pack(*, tree: Node, agent_dir: Path, check: bool, store: Path | None) -> dict[str, str]:
+    """Export skills/pack/skills/<id> to skills/<id>; returns {skill_id: tree digest}.
+
+    Skills are compared by Merkle tree digest, so unchanged skills are neither
+    rewritten (write mode) nor byte-compared (check mode).
+    """
+    skills_dir = agent_dir / "skills"
+    skills_pack = tree.get("skills/pack/skills")
+    if skills_pack is None or not skills_pack.is_dir:
+        return {}
+
+    expected = {child.name: child for child in skills_pack.dirs() if child.is_file_at("SKILL.md")}
+    exported = {
+        child.name: child for child in tree.get("skills").dirs() if child.name not in ("dev-scripts", "pack")
+    }
 
     if check:
-        if exported_skill_ids != expected_skill_ids:
+        if list(exported) != list(expected):
             raise SystemExit(
-                f"[CHECK] exported skills mismatch: expected={expected_skill_ids} actual={exported_skill_ids}"
-            )
-        for skill_id in expected_skill_ids:
-            _compare_trees(
-                a=skills_pack / skill_id,
-                b=skills_dir / skill_id,
-                label=f"skill:{skill_id}",
+                f"[CHECK] exported skills mismatch: expected={list(expected)} actual={list(exported)}"
             )
-        return expected_skill_ids
-
-    for skill_id in exported_skill_ids:
-        shutil.rmtree(skills_dir / skill_id)
+        for skill_id, src in expected.items():
+            if src.sha256 != exported[skill_id].sha256:
+                # Digests differ; name the offending file.
+                _compare_trees(a=src, b=exported[skill_id], label=f"skill:{skill_id}")
+                raise SystemExit(f"[CHECK] tree digest differs (skill:{skill_id})")
+        return {skill_id: src.sha256 for skill_id, src in expected.items()}
+
+    for skill_id, dst in exported.items():
+        src = expected.get(skill_id)
+        if src is not None and src.sha256 == dst.sha256:
+            continue
+        shutil.rmtree(dst.path)
 
-    for skill_id in expected_skill_ids:
-        shutil.copytree(
-            skills_pack / skill_id,
+    for skill_id, src in expected.items():
+        dst = exported.get(skill_id)
+        if dst is not None and src.sha256 == dst.sha256:
+            continue
+        _content_store.copy_tree(
+            src.path,
             skills_dir / skill_id,
+            store=store,
             ignore=_ignore_macos_metadata,
         )
 
-    return expected_skill_ids
+    return {skill_id: src.sha256 for skill_id, src in expected.items()}
 
 
 def _generate_skills_index(
-    *, agent_dir: Path, rel_agent_dir: Path, url_prefix: str, skill_ids: list[str]
+    *, tree: Node, agent_dir: Path, rel_agent_dir: Path, url_prefix: str, skill_digests: dict[str, str]
 ) -> dict:
     report_schema_by_skill_id: dict[str, str] = {
         "x07-build-run": "x07-host-runner.report.schema.json",
@@ -365,17 +462,14 @@ def _generate_skills_index(
     }
 
     items: list[dict] = []
-    for skill_id in sorted(skill_ids):
+    for skill_id in sorted(skill_digests):
         skill_md = agent_dir / "skills" / skill_id / "SKILL.md"
         report_schema = report_schema_by_skill_id.get(skill_id)
         if report_schema is None:
             report_schema_url = None
         else:
-            schema_path = agent_dir / "schemas" / report_schema
-            if not schema_path.is_file():
-                raise SystemExit(
-                    f"missing report schema for skill {skill_id}: {schema_path.relative_to(agent_dir)}"
-                )
+            if not tree.is_file_at(f"schemas/{report_schema}"):
+                raise SystemExit(f"missing report schema for skill {skill_id}: schemas/{report_schema}")
             report_schema_url = f"{url_prefix}/schemas/{report_schema}"
         items.append(
             {
@@ -383,6 +477,7 @@ def _generate_skills_index(
                 "summary": _parse_skill_summary(skill_md),
                 "docs_url": f"{url_prefix}/skills/{skill_id}/SKILL.md",
                 "report_schema_url": report_schema_url,
+                "tree_sha256": skill_digests[skill_id],
             }
         )
     return {
@@ -399,6 +494,7 @@ def _generate_skill_descriptor(
     summary: str,
     docs_url: str,
     report_schema_url: str | None,
+    tree_sha256: str,
 ) -> dict:
     return {
         "schema_version": "x07.website.agent.skill@v1",
@@ -407,10 +503,13 @@ def _generate_skill_descriptor(
         "summary": summary,
         "docs_url": docs_url,
         "report_schema_url": report_schema_url,
+        "tree_sha256": tree_sha256,
     }
 
 
-def _sync_skill_descriptors(*, agent_dir: Path, rel_agent_dir: Path, skills_index: dict, check: bool) -> None:
+def _sync_skill_descriptors(
+    *, tree: Node, agent_dir: Path, rel_agent_dir: Path, skills_index: dict, check: bool
+) -> None:
     skills_dir = agent_dir / "skills"
     items = skills_index.get("items", [])
     if not isinstance(items, list):
@@ -424,6 +523,7 @@ def _sync_skill_descriptors(*, agent_dir: Path, rel_agent_dir: Path, skills_inde
         summary = it.get("summary")
         docs_url = it.get("docs_url")
         report_schema_url = it.get("report_schema_url")
+        tree_sha256 = it.get("tree_sha256")
         if not isinstance(skill_id, str) or not skill_id:
             raise SystemExit(f"invalid skills index item.id: {skills_dir.relative_to(agent_dir)}/index.json")
         if not isinstance(summary, str):
@@ -434,6 +534,8 @@ def _sync_skill_descriptors(*, agent_dir: Path, rel_agent_dir: Path, skills_inde
             raise SystemExit(
                 f"invalid skills index item.report_schema_url: {skills_dir.relative_to(agent_dir)}/index.json"
             )
+        if not isinstance(tree_sha256, str) or not tree_sha256:
+            raise SystemExit(f"invalid skills index item.tree_sha256: {skills_dir.relative_to(agent_dir)}/index.json")
 
         descriptor_name = f"{skill_id}.json"
         expected_names.add(descriptor_name)
@@ -445,21 +547,39 @@ def _sync_skill_descriptors(*, agent_dir: Path, rel_agent_dir: Path, skills_inde
                 summary=summary,
                 docs_url=docs_url,
                 report_schema_url=report_schema_url,
+                tree_sha256=tree_sha256,
             ),
             check=check,
         )
 
-    for p in sorted(skills_dir.glob("*.json"), key=lambda x: x.name):
+    # Names come from the scan taken before this run wrote any descriptor.
+    for p in tree.get("skills").files(".json"):
         if p.name == "index.json":
             continue
         if p.name in expected_names:
             continue
         if check:
-            raise SystemExit(f"[CHECK] unexpected skill descriptor: {p.relative_to(agent_dir)}")
-        p.unlink()
-
-
-def _update_agent_index_json(*, agent_dir: Path, check: bool, has_examples_catalog: bool) -> None:
+            raise SystemExit(f"[CHECK] unexpected skill descriptor: skills/{p.name}")
+        p.path.unlink()
+
+
+# index.json fields _update_agent_index_json() adds, and removes once they no longer apply.
+INDEX_URL_FIELDS = (
+    "schemas_index_url",
+    "skills_index_url",
+    "examples_index_url",
+    "examples_catalog_index_url",
+    "packages_index_url",
+    "catalog_index_url",
+    "symbols_index_url",
+    "pack_toc_url",
+    "pack_archive_url",
+    "pack_archive_gz_url",
+    "capabilities_index_url",
+)
+
+
+def _update_agent_index_json(*, tree: Node, agent_dir: Path, check: bool, has_examples_catalog: bool) -> None:
     index_path = agent_dir / "index.json"
     if not index_path.is_file():
         raise SystemExit(f"missing agent index: {index_path}")
@@ -478,57 +598,116 @@ def _update_agent_index_json(*, agent_dir: Path, check: bool, has_examples_catal
     }
     if has_examples_catalog:
         expected["examples_catalog_index_url"] = "examples/catalog.json"
-    if (agent_dir / "packages").is_dir():
+    if tree.is_dir_at("packages"):
         expected["packages_index_url"] = "packages/index.json"
-    if (agent_dir / "catalog").is_dir():
+    if tree.is_dir_at("catalog"):
         expected["catalog_index_url"] = "catalog/index.json"
+    expected["symbols_index_url"] = _symbol_index.INDEX_PATH
+    expected["pack_toc_url"] = _agent_pack.TOC_PATH
+    expected["pack_archive_url"] = _agent_pack.ARCHIVE_PATH
+    expected["pack_archive_gz_url"] = _agent_pack.ARCHIVE_GZ_PATH
+    if tree.is_file_at("catalog/capabilities.json"):
+        expected["capabilities_index_url"] = "capabilities/index.json"
+    stale = [k for k in INDEX_URL_FIELDS if k in index and k not in expected]
     if check:
         for k, v in expected.items():
             if index.get(k) != v:
                 raise SystemExit(f"[CHECK] {index_path} {k} must be {v!r}")
+        if stale:
+            raise SystemExit(f"[CHECK] {index_path} unexpected {stale[0]}")
         return
 
-    changed = False
+    changed = bool(stale)
+    for k in stale:
+        del index[k]
     for k, v in expected.items():
         if index.get(k) != v:
             index[k] = v
             changed = True
     if changed:
-        index_path.write_text(json.dumps(index, indent=2) + "\n", encoding="utf-8")
-
+        _content_store.atomic_write_text(index_path, json.dumps(index, indent=2) + "\n")
+
+
+# Per-page chunks for site/src/pages/agent: index file -> fields the page renders.
+_SITE_AGENT_DATA_CHUNKS = {
+    "skills": ("skills/index.json", ("id", "summary", "docs_url", "report_schema_url")),
+    "schemas": ("schemas/index.json", ("id", "url")),
+    "examples": ("examples/index.json", ("id", "purpose", "url")),
+    "packages": ("packages/index.json", ("name", "version", "url")),
+}
+
+_SITE_AGENT_DATA_TYPES = (
+    "export type SkillItem = {\n"
+    "  id: string;\n"
+    "  summary: string;\n"
+    "  docs_url: string;\n"
+    "  report_schema_url: string | null;\n"
+    "};\n\n"
+    "export type SchemaItem = {id: string; url: string};\n\n"
+    "export type ExampleItem = {id: string; purpose: string; url: string};\n\n"
+    "export type PackageItem = {name: string; version: string; url: string};\n\n"
+    "export type AgentDataChunk<T> = {source: string; items: T[]};\n\n"
+)
+
+
+def _generate_site_agent_data(*, repo_root: Path, agent_latest: Path, check: bool) -> None:
+    """Write site/src/pages/agent/_agent_data/: a small typed metadata module plus one JSON chunk per page.
+
+    Pages import only the chunk they render, so no page bundle ships the other indexes.
+    """
+    pages_dir = repo_root / "site" / "src" / "pages" / "agent"
+    out_dir = pages_dir / "_agent_data"
+
+    counts: dict[str, int] = {}
+    expected_names = {"index.ts"}
+    for name, (index_rel, fields) in _SITE_AGENT_DATA_CHUNKS.items():
+        index = json.loads((agent_latest / index_rel).read_text(encoding="utf-8"))
+        items = [{f: it.get(f) for f in fields} for it in index.get("items", []) if isinstance(it, dict)]
+        counts[name] = len(items)
+        expected_names.add(f"{name}.json")
+        _write_json_if_changed(
+            path=out_dir / f"{name}.json",
+            obj={"source": f"/agent/latest/{index_rel}", "items": items},
+            check=check,
+        )
 
-def _generate_site_agent_data_ts(*, repo_root: Path, check: bool) -> None:
-    agent_latest = repo_root / "agent" / "latest"
-    skills_index = json.loads((agent_latest / "skills" / "index.json").read_text(encoding="utf-8"))
-    schemas_index = json.loads(
-        (agent_latest / "schemas" / "index.json").read_text(encoding="utf-8")
-    )
-    examples_index = json.loads(
-        (agent_latest / "examples" / "index.json").read_text(encoding="utf-8")
-    )
-    packages_index = json.loads(
-        (agent_latest / "packages" / "index.json").read_text(encoding="utf-8")
-    )
     stdlib_index = json.loads((agent_latest / "stdlib" / "index.json").read_text(encoding="utf-8"))
     stdlib_modules = stdlib_index.get("modules", [])
     module_count = len(stdlib_modules) if isinstance(stdlib_modules, list) else 0
 
-    out = repo_root / "site" / "src" / "pages" / "agent" / "_agent_data.ts"
+    meta_lines = "".join(
+        f"  {name}: {{url: '/agent/latest/{index_rel}', count: {counts[name]}}},\n"
+        for name, (index_rel, _) in _SITE_AGENT_DATA_CHUNKS.items()
+    )
     content = (
         "/**\n"
         " * THIS FILE IS GENERATED by scripts/generate_agent_indexes.py\n"
         " * DO NOT EDIT BY HAND.\n"
+        " *\n"
+        " * Counts and URLs only. Item lists live in the sibling JSON chunks; import the\n"
+        " * one a page renders (e.g. './_agent_data/skills.json') from that page.\n"
         " */\n\n"
-        f"export const latestSkillsIndex = {json.dumps(skills_index, indent=2)} as const;\n\n"
-        f"export const latestSchemasIndex = {json.dumps(schemas_index, indent=2)} as const;\n\n"
-        f"export const latestExamplesIndex = {json.dumps(examples_index, indent=2)} as const;\n\n"
-        f"export const latestPackagesIndex = {json.dumps(packages_index, indent=2)} as const;\n\n"
+        f"{_SITE_AGENT_DATA_TYPES}"
+        "export const latestAgentDataMeta = {\n"
+        f"{meta_lines}"
+        "} as const;\n\n"
         "export const latestStdlibIndexMeta = {\n"
         "  url: '/agent/latest/stdlib/index.json',\n"
         f"  module_count: {module_count},\n"
         "} as const;\n"
     )
-    _write_text_if_changed(path=out, content=content, check=check)
+    _write_text_if_changed(path=out_dir / "index.ts", content=content, check=check)
+
+    # The former single inlined module, and chunks no longer generated.
+    stale = [pages_dir / "_agent_data.ts"]
+    if out_dir.is_dir():
+        stale += [p for p in sorted(out_dir.iterdir()) if p.name not in expected_names]
+    for p in stale:
+        if not p.exists():
+            continue
+        if check:
+            raise SystemExit(f"[CHECK] unexpected file: {p}")
+        p.unlink()
 
 
 def _generate_entrypoints_json(*, url_prefix: str) -> dict:
@@ -543,25 +722,78 @@ def _generate_entrypoints_json(*, url_prefix: str) -> dict:
             "examples_catalog_index": f"{url_prefix}/examples/catalog.json",
             "packages_index": f"{url_prefix}/packages/index.json",
             "stdlib_index": f"{url_prefix}/stdlib/index.json",
+            "symbols_index": f"{url_prefix}/{_symbol_index.INDEX_PATH}",
             "catalog_index": f"{url_prefix}/catalog/index.json",
             "capabilities": f"{url_prefix}/catalog/capabilities.json",
+            "capabilities_index": f"{url_prefix}/capabilities/index.json",
+            "pack_toc": f"{url_prefix}/{_agent_pack.TOC_PATH}",
+            "pack_archive": f"{url_prefix}/{_agent_pack.ARCHIVE_PATH}",
+            "pack_archive_gz": f"{url_prefix}/{_agent_pack.ARCHIVE_GZ_PATH}",
         },
     }
 
 
-def main(argv: list[str]) -> int:
-    args = parse_args(argv)
-    repo_root = Path(__file__).resolve().parents[1]
-
-    agent_dir = args.agent_dir
+_OWNED_FILES = (
+    "entrypoints.json",
+    "schemas/index.json",
+    "examples/index.json",
+    "examples/catalog.json",
+    "packages/index.json",
+    "catalog/index.json",
+    "capabilities/index.json",
+    "skills/index.json",
+)
+
+
+def owns_path(rel: str) -> bool:
+    """True if `generate()` writes (and prunes) the agent-dir-relative path `rel`.
+
+    sync_from_bundle.py leaves these to the generator instead of deleting them as
+    stale bundle output.
+    """
+    parts = rel.split("/")
+    if rel in _OWNED_FILES:
+        return True
+    if parts[:2] == ["examples", "catalog-files"]:
+        return True
+    if parts[0] in ("symbols", "pack"):
+        return True
+    if parts[0] == "skills" and len(parts) == 2 and rel.endswith(".json"):
+        return True
+    if parts[0] == "skills" and len(parts) > 2 and parts[1] not in ("dev-scripts", "pack"):
+        return True
+    return False
+
+
+def generate(
+    *,
+    repo_root: Path,
+    agent_dir: Path,
+    check: bool,
+    store: Path | None = None,
+    publish_as: Path | None = None,
+    link_examples: bool = False,
+    scans: _tree_model.Scans | None = None,
+) -> int:
+    """Generate (or with check=True verify) the indexes of one agent dir.
+
+    Importable entry point used by sync_from_bundle.py and sync_pipeline.py.
+    `publish_as` is the repo-relative dir the tree will be served from (used for
+    URL prefixes) when `agent_dir` is a staging directory. With `link_examples`, the
+    examples catalog mirror hardlinks files from docs/*/examples instead of copying them.
+    With check=True, `scans` lends the models of a caller that reads the same trees.
+    """
     if not agent_dir.is_absolute():
         agent_dir = (repo_root / agent_dir).resolve()
 
-    try:
-        rel_agent_dir = agent_dir.relative_to(repo_root)
-    except ValueError:
-        print(f"ERROR: agent dir must be within repo root: {agent_dir}", file=sys.stderr)
-        return 2
+    if publish_as is not None:
+        rel_agent_dir = publish_as
+    else:
+        try:
+            rel_agent_dir = agent_dir.relative_to(repo_root)
+        except ValueError:
+            print(f"ERROR: agent dir must be within repo root: {agent_dir}", file=sys.stderr)
+            return 2
 
     if not agent_dir.is_dir():
         print(f"ERROR: agent dir not found: {agent_dir}", file=sys.stderr)
@@ -569,108 +801,144 @@ def main(argv: list[str]) -> int:
 
     url_prefix = "/" + rel_agent_dir.as_posix()
 
-    if not (agent_dir / "schemas").is_dir():
+    # One scandir pass over the agent dir; every generator and check below reads this model.
+    tree = scans.get(agent_dir) if check and scans is not None else _tree_model.scan(agent_dir)
+    if not tree.is_dir_at("schemas"):
         print(f"ERROR: missing schemas dir: {rel_agent_dir}/schemas", file=sys.stderr)
         return 2
-    if not (agent_dir / "skills").is_dir():
+    if not tree.is_dir_at("skills"):
         print(f"ERROR: missing skills dir: {rel_agent_dir}/skills", file=sys.stderr)
         return 2
-    if not (agent_dir / "examples").is_dir():
+    if not tree.is_dir_at("examples"):
         print(f"ERROR: missing examples dir: {rel_agent_dir}/examples", file=sys.stderr)
         return 2
-    if not (agent_dir / "packages").is_dir():
+    if not tree.is_dir_at("packages"):
         print(f"ERROR: missing packages dir: {rel_agent_dir}/packages", file=sys.stderr)
         return 2
 
     docs_examples_source = _resolve_docs_examples_source(repo_root=repo_root, rel_agent_dir=rel_agent_dir)
     _update_agent_index_json(
+        tree=tree,
         agent_dir=agent_dir,
-        check=args.check,
+        check=check,
         has_examples_catalog=docs_examples_source is not None,
     )
 
     schemas_index = _generate_schemas_index(
-        agent_dir=agent_dir, rel_agent_dir=rel_agent_dir, url_prefix=url_prefix
+        tree=tree, rel_agent_dir=rel_agent_dir, url_prefix=url_prefix
     )
     _write_json_if_changed(
         path=agent_dir / "schemas" / "index.json",
         obj=schemas_index,
-        check=args.check,
+        check=check,
     )
 
     examples_index = _generate_examples_index(
-        agent_dir=agent_dir, rel_agent_dir=rel_agent_dir, url_prefix=url_prefix
+        tree=tree, rel_agent_dir=rel_agent_dir, url_prefix=url_prefix
     )
     _write_json_if_changed(
         path=agent_dir / "examples" / "index.json",
         obj=examples_index,
-        check=args.check,
+        check=check,
     )
     if docs_examples_source is not None:
         docs_examples_dir, generated_from = docs_examples_source
+        docs_examples = (
+            scans.get(docs_examples_dir) if check and scans is not None else _tree_model.scan(docs_examples_dir)
+        )
         rel_paths = _sync_examples_catalog_files(
+            tree=tree,
             agent_dir=agent_dir,
-            docs_examples_dir=docs_examples_dir,
-            check=args.check,
+            docs_examples=docs_examples,
+            check=check,
+            store=store,
+            link=link_examples,
         )
         examples_catalog_index = _generate_examples_catalog_index(
             rel_paths=rel_paths,
+            docs_examples=docs_examples,
             generated_from=generated_from,
             url_prefix=url_prefix,
         )
         _write_json_if_changed(
             path=agent_dir / "examples" / "catalog.json",
             obj=examples_catalog_index,
-            check=args.check,
+            check=check,
         )
     else:
         catalog_path = agent_dir / "examples" / "catalog.json"
         catalog_files_dir = agent_dir / "examples" / "catalog-files"
-        if args.check and catalog_path.exists():
+        has_catalog = tree.get("examples/catalog.json") is not None
+        has_catalog_files = tree.get("examples/catalog-files") is not None
+        if check and has_catalog:
             raise SystemExit(f"[CHECK] unexpected file: {catalog_path}")
-        if args.check and catalog_files_dir.exists():
+        if check and has_catalog_files:
             raise SystemExit(f"[CHECK] unexpected directory: {catalog_files_dir}")
-        if not args.check and catalog_path.exists():
+        if not check and has_catalog:
             catalog_path.unlink()
-        if not args.check and catalog_files_dir.exists():
+        if not check and has_catalog_files:
             shutil.rmtree(catalog_files_dir)
 
     packages_index = _generate_packages_index(
-        agent_dir=agent_dir, rel_agent_dir=rel_agent_dir, url_prefix=url_prefix
+        tree=tree, rel_agent_dir=rel_agent_dir, url_prefix=url_prefix
     )
     _write_json_if_changed(
         path=agent_dir / "packages" / "index.json",
         obj=packages_index,
-        check=args.check,
+        check=check,
     )
 
+    capabilities_index = _generate_capabilities_index(
+        tree=tree, rel_agent_dir=rel_agent_dir, packages_index=packages_index
+    )
+    if capabilities_index is not None:
+        _write_json_if_changed(
+            path=agent_dir / "capabilities" / "index.json",
+            obj=capabilities_index,
+            check=check,
+        )
+
+    # Built at site build time (build_symbol_indexes.py, build_manifest_views.py,
+    # build_agent_packs.py); drop copies left by older scripts.
+    for name, node in sorted(tree.children.items()):
+        if name not in ("symbols", "pack") and not _manifest_views.is_view_path(name):
+            continue
+        if check:
+            raise SystemExit(f"[CHECK] unexpected {'directory' if node.is_dir else 'file'}: {node.path}")
+        if node.is_dir:
+            shutil.rmtree(node.path)
+        else:
+            node.path.unlink()
+
     catalog_index = _generate_catalog_index(
-        agent_dir=agent_dir, rel_agent_dir=rel_agent_dir, url_prefix=url_prefix
+        tree=tree, rel_agent_dir=rel_agent_dir, url_prefix=url_prefix
     )
     if catalog_index is not None:
         _write_json_if_changed(
             path=agent_dir / "catalog" / "index.json",
             obj=catalog_index,
-            check=args.check,
+            check=check,
         )
 
-    skill_ids = _export_skills_pack(agent_dir=agent_dir, check=args.check)
+    skill_digests = _export_skills_pack(tree=tree, agent_dir=agent_dir, check=check, store=store)
     skills_index = _generate_skills_index(
+        tree=tree,
         agent_dir=agent_dir,
         rel_agent_dir=rel_agent_dir,
         url_prefix=url_prefix,
-        skill_ids=skill_ids,
+        skill_digests=skill_digests,
     )
     _write_json_if_changed(
         path=agent_dir / "skills" / "index.json",
         obj=skills_index,
-        check=args.check,
+        check=check,
     )
     _sync_skill_descriptors(
+        tree=tree,
         agent_dir=agent_dir,
         rel_agent_dir=rel_agent_dir,
         skills_index=skills_index,
-        check=args.check,
+        check=check,
     )
 
     if rel_agent_dir.as_posix() == "agent/latest":
@@ -678,13 +946,156 @@ def main(argv: list[str]) -> int:
         _write_json_if_changed(
             path=agent_dir / "entrypoints.json",
             obj=entrypoints,
-            check=args.check,
+            check=check,
         )
-        _generate_site_agent_data_ts(repo_root=repo_root, check=args.check)
+        _generate_site_agent_data(repo_root=repo_root, agent_latest=agent_dir, check=check)
 
     print(f"ok: generated agent indexes for {rel_agent_dir}")
     return 0
 
 
+def _all_agent_dirs(repo_root: Path) -> list[Path]:
+    versions = json.loads(_read_text(repo_root / "versions" / "toolchain_versions.json"))
+    out = [
+        Path("agent") / f"v{entry['toolchain_version']}"
+        for entry in versions.get("versions", [])
+        if isinstance(entry, dict) and isinstance(entry.get("toolchain_version"), str)
+    ]
+    if versions.get("latest_toolchain_version"):
+        out.append(Path("agent") / "latest")
+    return out
+
+
+def _in_scope(repo_root: Path, scope: _change_scope.Scope, agent_dir: Path) -> bool:
+    name = agent_dir.name
+    if name == "latest":
+        versions = json.loads(_read_text(repo_root / "versions" / "toolchain_versions.json"))
+        return scope.covers_latest(versions.get("latest_toolchain_version"))
+    if name.startswith("v"):
+        return scope.covers_version(name.removeprefix("v"))
+    return True
+
+
+def _generate_one(
+    repo_root: Path, agent_dir: Path, check: bool, store: Path | None, link_examples: bool = False
+) -> dict:
+    """Run generate() for one dir, capturing its output and failure instead of exiting."""
+    buf = io.StringIO()
+    error = None
+    t0 = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(buf):
+            rc = generate(
+                repo_root=repo_root,
+                agent_dir=agent_dir,
+                check=check,
+                store=store,
+                link_examples=link_examples,
+            )
+    except SystemExit as e:
+        rc = e.code if isinstance(e.code, int) else 1
+        error = None if isinstance(e.code, int) else str(e.code)
+    except Exception as e:
+        rc = 1
+        error = f"{type(e).__name__}: {e}"
+    finally:
+        # Pool workers have their own digest cache; merge it back before exiting.
+        _hash_cache.save()
+    output = buf.getvalue()
+    if rc != 0 and error is None:
+        error = output.strip().splitlines()[-1] if output.strip() else f"exit code {rc}"
+    return {
+        "agent_dir": agent_dir.as_posix(),
+        "ok": rc == 0,
+        "rc": rc,
+        "error": error,
+        "output": output,
+        "seconds": round(time.perf_counter() - t0, 3),
+    }
+
+
+def generate_many(
+    *,
+    repo_root: Path,
+    agent_dirs: list[Path],
+    check: bool,
+    store: Path | None = None,
+    jobs: int | None = None,
+    link_examples: bool = False,
+) -> list[dict]:
+    """generate() over several agent dirs in a process pool; one result dict per dir, in input order."""
+    workers = min(jobs or os.cpu_count() or 1, len(agent_dirs))
+    if workers <= 1:
+        return [_generate_one(repo_root, d, check, store, link_examples) for d in agent_dirs]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_generate_one, repo_root, d, check, store, link_examples) for d in agent_dirs]
+        return [f.result() for f in futures]
+
+
+def main(argv: list[str]) -> int:
+    args = parse_args(argv)
+    repo_root = Path(__file__).resolve().parents[1]
+    store = args.object_store.resolve() if args.object_store is not None else None
+
+    agent_dirs = list(args.agent_dir)
+    if args.all:
+        agent_dirs += [d for d in _all_agent_dirs(repo_root) if d not in agent_dirs]
+    if not agent_dirs:
+        print("ERROR: pass --agent-dir (repeatable) or --all", file=sys.stderr)
+        return 2
+    scope = _change_scope.from_args(repo_root, args.since)
+    if scope is not None:
+        agent_dirs = [d for d in agent_dirs if _in_scope(repo_root, scope, d)]
+        if not agent_dirs:
+            print("ok: no agent dirs affected")
+            return 0
+    if len(agent_dirs) == 1 and args.json_report is None:
+        return generate(
+            repo_root=repo_root,
+            agent_dir=agent_dirs[0],
+            check=args.check,
+            store=store,
+            link_examples=args.link_examples,
+        )
+
+    t0 = time.perf_counter()
+    results = generate_many(
+        repo_root=repo_root,
+        agent_dirs=agent_dirs,
+        check=args.check,
+        store=store,
+        jobs=args.jobs,
+        link_examples=args.link_examples,
+    )
+    failed = [r for r in results if not r["ok"]]
+
+    if args.json_report is not None:
+        report_path = args.json_report if args.json_report.is_absolute() else (repo_root / args.json_report)
+        report = {
+            "schema_version": "x07.website.agent-index-generation-report@0.1.0",
+            "mode": "check" if args.check else "generate",
+            "agent_dirs": [r["agent_dir"] for r in results],
+            "results": [{k: v for k, v in r.items() if k != "output"} for r in results],
+            "seconds": round(time.perf_counter() - t0, 3),
+            "ok": not failed,
+        }
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        report_path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    for r in results:
+        if r["ok"]:
+            print(f"ok: {r['agent_dir']} ({r['seconds']:.2f}s)")
+        else:
+            print(f"ERROR: {r['agent_dir']}: {r['error']}", file=sys.stderr)
+    if failed:
+        print(f"ERROR: {len(failed)} of {len(results)} agent dirs failed", file=sys.stderr)
+        return 1
+    print(f"ok: {'checked' if args.check else 'generated'} {len(results)} agent dirs")
+    return 0
+
+
 if __name__ == "__main__":
-    raise SystemExit(main(sys.argv[1:]))
+    try:
+        raise SystemExit(main(sys.argv[1:]))
+    finally:
+        _hash_cache.save()
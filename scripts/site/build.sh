@@ -17,9 +17,22 @@ log "site: generate docusaurus inputs"
 python3 "${ROOT}/scripts/site/gen_docusaurus_inputs.py" --repo-root "${ROOT}"
 
 rm -rf "${STATIC_DIR}/agent" "${STATIC_DIR}/versions"
-cp -R "${ROOT}/agent" "${STATIC_DIR}/agent"
+# Hardlink the agent tree into static/ when the filesystem allows it; fall back to a copy.
+if ! cp -R -l "${ROOT}/agent" "${STATIC_DIR}/agent" 2>/dev/null; then
+  rm -rf "${STATIC_DIR}/agent"
+  cp -R "${ROOT}/agent" "${STATIC_DIR}/agent"
+fi
 cp -R "${ROOT}/versions" "${STATIC_DIR}/versions"
 
+log "site: build symbol indexes"
+python3 "${ROOT}/scripts/build_symbol_indexes.py" --out-dir "${STATIC_DIR}/agent"
+
+log "site: build manifest views"
+python3 "${ROOT}/scripts/build_manifest_views.py" --out-dir "${STATIC_DIR}/agent"
+
+log "site: build agent packs"
+python3 "${ROOT}/scripts/build_agent_packs.py" --out-dir "${STATIC_DIR}/agent"
+
 log "site: npm ci"
 cd "${SITE_DIR}"
 npm ci
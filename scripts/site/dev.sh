@@ -8,8 +8,15 @@ STATIC_DIR="${SITE_DIR}/static"
 python3 "${ROOT}/scripts/site/gen_docusaurus_inputs.py" --repo-root "${ROOT}"
 
 rm -rf "${STATIC_DIR}/agent" "${STATIC_DIR}/versions"
-cp -R "${ROOT}/agent" "${STATIC_DIR}/agent"
+# Hardlink the agent tree into static/ when the filesystem allows it; fall back to a copy.
+if ! cp -R -l "${ROOT}/agent" "${STATIC_DIR}/agent" 2>/dev/null; then
+  rm -rf "${STATIC_DIR}/agent"
+  cp -R "${ROOT}/agent" "${STATIC_DIR}/agent"
+fi
 cp -R "${ROOT}/versions" "${STATIC_DIR}/versions"
+python3 "${ROOT}/scripts/build_symbol_indexes.py" --out-dir "${STATIC_DIR}/agent"
+python3 "${ROOT}/scripts/build_manifest_views.py" --out-dir "${STATIC_DIR}/agent"
+python3 "${ROOT}/scripts/build_agent_packs.py" --out-dir "${STATIC_DIR}/agent"
 
 cd "${SITE_DIR}"
 npm start
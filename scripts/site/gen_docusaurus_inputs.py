@@ -24,6 +24,7 @@ import os
 from pathlib import Path
 import re
 import shutil
+import sys
 from typing import Any, Callable, Dict, Iterable, List, Tuple
 
 from _summary_to_sidebar import (
@@ -32,6 +33,11 @@ from _summary_to_sidebar import (
     summary_nodes_to_sidebar_items,
 )
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import _canonical_output  # noqa: E402  (scripts/_canonical_output.py)
+import _change_scope  # noqa: E402  (scripts/_change_scope.py)
+import _hash_cache  # noqa: E402  (scripts/_hash_cache.py)
+
 
 _SEMVER_RE = re.compile(r"^(?P<maj>0|[1-9]\d*)\.(?P<min>0|[1-9]\d*)\.(?P<pat>0|[1-9]\d*)$")
 
@@ -51,33 +57,25 @@ def _read_text(path: Path) -> str:
     return path.read_text(encoding="utf-8")
 
 
-def _write_text_if_changed(path: Path, content: str, check: bool) -> None:
-    content = content.replace("\r\n", "\n")
-    if not content.endswith("\n"):
-        content += "\n"
-
-    if path.exists():
-        existing = path.read_text(encoding="utf-8").replace("\r\n", "\n")
-        if existing == content:
-            return
-        if check:
-            raise SystemExit(f"[CHECK] {path} is out of date (run gen_docusaurus_inputs.py).")
-    else:
-        if check:
+def _write_if_changed(path: Path, render: Callable[[], Iterable[str]], check: bool) -> None:
+    state = _canonical_output.status(path, render)
+    if state == "same":
+        return
+    if check:
+        if state == "missing":
             raise SystemExit(f"[CHECK] {path} missing (run gen_docusaurus_inputs.py).")
+        raise SystemExit(f"[CHECK] {path} is out of date (run gen_docusaurus_inputs.py).")
+    _canonical_output.write(path, render)
 
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
 
-
-def _write_json_if_changed(path: Path, obj: Any, check: bool) -> None:
-    content = json.dumps(obj, ensure_ascii=False, indent=2, sort_keys=True)
-    _write_text_if_changed(path, content, check)
+def _write_text_if_changed(path: Path, content: str, check: bool) -> None:
+    _write_if_changed(path, lambda: _canonical_output.text_chunks(content), check)
 
 
-def _safe_rmtree(path: Path) -> None:
-    if path.exists():
-        shutil.rmtree(path)
+def _write_json_if_changed(path: Path, obj: Any, check: bool) -> None:
+    _write_if_changed(
+        path, lambda: _canonical_output.json_chunks(obj, sort_keys=True, ensure_ascii=False), check
+    )
 
 
 def _iter_files_sorted(root: Path) -> List[Path]:
@@ -111,17 +109,24 @@ def _sync_tree(
         if actual != expected:
             raise SystemExit(f"[CHECK] directory out of date: {dst}")
         for rel in expected:
-            a = (src / rel).read_bytes()
-            b = (dst / rel).read_bytes()
-            if a != b:
+            if not _hash_cache.files_equal(src / rel, dst / rel):
                 raise SystemExit(f"[CHECK] file differs: {dst / rel}")
         return
 
-    _safe_rmtree(dst)
+    # Only touch files that changed; unchanged files are confirmed via the hash cache.
     dst.mkdir(parents=True, exist_ok=True)
+    expected_set = set(expected)
+    for rel in _iter_files_sorted(dst):
+        if rel not in expected_set:
+            (dst / rel).unlink()
+    for dirpath, dirnames, filenames in os.walk(dst, topdown=False):
+        if not dirnames and not filenames and Path(dirpath) != dst:
+            Path(dirpath).rmdir()
     for rel in expected:
         src_file = src / rel
         dst_file = dst / rel
+        if dst_file.is_file() and _hash_cache.files_equal(src_file, dst_file):
+            continue
         dst_file.parent.mkdir(parents=True, exist_ok=True)
         dst_file.write_bytes(src_file.read_bytes())
 
@@ -320,7 +325,12 @@ def parse_args(argv: List[str]) -> argparse.Namespace:
     ap = argparse.ArgumentParser()
     ap.add_argument("--repo-root", default=".", help="x07-website repo root")
     ap.add_argument("--check", action="store_true", help="fail if outputs are not up to date")
-    return ap.parse_args(argv)
+    _change_scope.add_argument(ap)
+    args = ap.parse_args(argv)
+    # A scoped write would skip regenerating the versions outside the scope; --since only narrows checks.
+    if args.since is not None and not args.check:
+        ap.error("--since requires --check")
+    return args
 
 
 def main(argv: List[str]) -> None:
@@ -340,6 +350,11 @@ def main(argv: List[str]) -> None:
 
     toolchain_versions = _read_toolchain_versions(versions_path)
 
+    # With --since (check mode only), only the versions (and latest) whose docs changed are checked.
+    scope = _change_scope.from_args(repo, args.since)
+    scoped_versions = [v for v in toolchain_versions if scope is None or scope.covers_version(v)]
+    include_latest = scope is None or scope.covers_latest(_read_json(versions_path).get("latest_toolchain_version"))
+
     site_docs = site_root / "docs"
     site_versioned_docs = site_root / "versioned_docs"
     site_versioned_sidebars = site_root / "versioned_sidebars"
@@ -348,15 +363,16 @@ def main(argv: List[str]) -> None:
     site_redirects_ts = site_root / "redirects.generated.ts"
 
     # ---- docs ----
-    _sync_tree(
-        src=src_latest,
-        dst=site_docs,
-        check=args.check,
-        exclude_relpath=_exclude_docs_relpath,
-    )
+    if include_latest:
+        _sync_tree(
+            src=src_latest,
+            dst=site_docs,
+            check=args.check,
+            exclude_relpath=_exclude_docs_relpath,
+        )
 
     # ---- versioned docs ----
-    for v in toolchain_versions:
+    for v in scoped_versions:
         src_ver_dir = docs_root / f"v{v}"
         dst_ver_dir = site_versioned_docs / f"version-{v}"
         _sync_tree(
@@ -383,18 +399,19 @@ def main(argv: List[str]) -> None:
     _write_json_if_changed(site_versions_json, toolchain_versions, check=args.check)
 
     # ---- sidebars ----
-    latest_summary = src_latest / "SUMMARY.md"
-    if not latest_summary.is_file():
-        raise SystemExit(f"missing SUMMARY.md in docs/latest: {latest_summary}")
-    _validate_summary_links_exist(summary_path=latest_summary, docs_root=src_latest)
-    try:
-        latest_items = _generate_sidebar_items(latest_summary)
-    except SummaryParseError as e:
-        raise SystemExit(f"SUMMARY parse error in {latest_summary}: {e}")
-    _maybe_inject_service_architecture_guide(docs_root=src_latest, sidebar_items=latest_items)
-    _write_text_if_changed(site_sidebars_ts, _generate_sidebars_ts(latest_items), check=args.check)
+    if include_latest:
+        latest_summary = src_latest / "SUMMARY.md"
+        if not latest_summary.is_file():
+            raise SystemExit(f"missing SUMMARY.md in docs/latest: {latest_summary}")
+        _validate_summary_links_exist(summary_path=latest_summary, docs_root=src_latest)
+        try:
+            latest_items = _generate_sidebar_items(latest_summary)
+        except SummaryParseError as e:
+            raise SystemExit(f"SUMMARY parse error in {latest_summary}: {e}")
+        _maybe_inject_service_architecture_guide(docs_root=src_latest, sidebar_items=latest_items)
+        _write_text_if_changed(site_sidebars_ts, _generate_sidebars_ts(latest_items), check=args.check)
 
-    for v in toolchain_versions:
+    for v in scoped_versions:
         src_ver_summary = docs_root / f"v{v}" / "SUMMARY.md"
         if not src_ver_summary.is_file():
             raise SystemExit(f"missing SUMMARY.md in docs/v{v}: {src_ver_summary}")
@@ -423,4 +440,7 @@ def main(argv: List[str]) -> None:
 
 
 if __name__ == "__main__":
-    main(os.sys.argv[1:])
+    try:
+        main(os.sys.argv[1:])
+    finally:
+        _hash_cache.save()
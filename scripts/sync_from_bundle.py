@@ -1,22 +1,49 @@
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
+import ctypes
+import errno
 import hashlib
 import json
+import os
 from pathlib import Path
 from pathlib import PurePosixPath
-import subprocess
 import shutil
 import tarfile
-import tempfile
 import sys
 
+import _content_store
+import _hash_cache
+import _manifest_views
+import _module_exports
+import _tree_model
+import check_site
+import generate_agent_indexes
+
 
 def parse_args(argv: list[str]) -> argparse.Namespace:
     ap = argparse.ArgumentParser()
-    ap.add_argument("--toolchain-version", required=True)
-    ap.add_argument("--bundle", required=True, type=Path)
+    ap.add_argument("--toolchain-version", default=None)
+    ap.add_argument("--bundle", default=None, type=Path)
+    ap.add_argument(
+        "--batch",
+        type=Path,
+        default=None,
+        help="JSON array of {toolchain_version, bundle[, toolchain_repo, published_at_utc]} to sync in one run",
+    )
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="parallel workers for --batch (default: CPU count)",
+    )
     ap.add_argument("--check", action="store_true", help="fail if repo outputs are out of date")
+    ap.add_argument(
+        "--verify",
+        action="store_true",
+        help="stream the bundle and report docs files missing/extra/modified in the manifest and docs/vX.Y.Z",
+    )
     ap.add_argument(
         "--toolchain-repo",
         type=Path,
@@ -25,15 +52,44 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
     )
     ap.add_argument("--published-at-utc", default=None)
     ap.add_argument("--set-latest", action="store_true")
+    ap.add_argument(
+        "--incremental",
+        action="store_true",
+        help="reuse agent/vX.Y.Z/manifest.json as a baseline and only rewrite changed files",
+    )
+    ap.add_argument(
+        "--object-store",
+        type=Path,
+        default=None,
+        help="share file contents through a sha256-keyed object store (trees become hardlinks)",
+    )
     return ap.parse_args(argv)
 
 
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+
 def _sha256_path(path: Path) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
-    return h.hexdigest()
+    return _hash_cache.sha256_file(path)
+
+
+class _HashingReader:
+    """Read-only file wrapper that hashes the raw bytes as tarfile consumes them."""
+
+    def __init__(self, f) -> None:
+        self._f = f
+        self._h = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._f.read(size)
+        self._h.update(data)
+        return data
+
+    def hexdigest(self) -> str:
+        # tarfile stops at the end-of-archive marker; hash any trailing padding too.
+        for chunk in iter(lambda: self.read(_COPY_CHUNK_SIZE), b""):
+            pass
+        return self._h.hexdigest()
 
 
 def _parse_semver(v: str) -> tuple[int, int, int] | None:
@@ -76,61 +132,75 @@ def _safe_member_path(member_name: str) -> PurePosixPath | None:
     return path
 
 
-def _extract_human_docs_bundle(bundle_path: Path, out_dir: Path) -> list[dict]:
-    out_dir.mkdir(parents=True, exist_ok=True)
+def _extract_human_docs_bundle(
+    bundle_path: Path, out_dir: Path | None, *, store: Path | None = None
+) -> tuple[list[dict], str]:
+    """Stream the bundle once, writing docs members in chunks and hashing them on the way.
 
-    extracted: list[dict] = []
-    with tarfile.open(bundle_path, mode="r:*") as tf:
-        for member in tf.getmembers():
-            member_path = _safe_member_path(member.name)
-            if member_path is None:
-                continue
-            if member.isdir():
-                continue
-            if not member.isreg():
-                raise ValueError(f"unsupported tar entry type: {member.name}")
-
-            rel: PurePosixPath | None = None
-            if member_path.parts[0] == "docs":
-                rel = PurePosixPath(*member_path.parts[1:])
-            elif member_path.parts[:2] == (".agent", "docs"):
-                rel = PurePosixPath(*member_path.parts[2:])
-            if rel is None:
-                continue
-            if rel == PurePosixPath():
-                continue
+    Members go straight into `out_dir`, or into the store (linked from `out_dir`) when one
+    is configured. With `out_dir=None` nothing is written; members are only hashed (used
+    by --verify). Returns the file entries and the sha256 of the bundle itself.
+    """
+    if out_dir is not None:
+        out_dir.mkdir(parents=True, exist_ok=True)
 
-            # Drop macOS metadata (AppleDouble / Finder files) from bundles to keep
-            # sync outputs deterministic and avoid polluting the docs tree.
-            if any(part.startswith("._") for part in rel.parts):
-                continue
-            if rel.name == ".DS_Store":
-                continue
-
-            out_path = out_dir / Path(str(rel))
-            out_path.parent.mkdir(parents=True, exist_ok=True)
-            file_obj = tf.extractfile(member)
-            if file_obj is None:
-                raise ValueError(f"failed to extract tar entry: {member.name}")
-            data = file_obj.read()
-            out_path.write_bytes(data)
-            extracted.append(
-                {
-                    "path": out_path.relative_to(out_dir).as_posix(),
-                    "sha256": hashlib.sha256(data).hexdigest(),
-                    "size": len(data),
-                }
-            )
+    extracted: list[dict] = []
+    with bundle_path.open("rb") as raw:
+        reader = _HashingReader(raw)
+        # "r|*" reads members sequentially (no member table, no seeking), so compressed
+        # bundles are decompressed exactly once.
+        with tarfile.open(fileobj=reader, mode="r|*") as tf:
+            for member in tf:
+                member_path = _safe_member_path(member.name)
+                if member_path is None:
+                    continue
+                if member.isdir():
+                    continue
+                if not member.isreg():
+                    raise ValueError(f"unsupported tar entry type: {member.name}")
+
+                rel: PurePosixPath | None = None
+                if member_path.parts[0] == "docs":
+                    rel = PurePosixPath(*member_path.parts[1:])
+                elif member_path.parts[:2] == (".agent", "docs"):
+                    rel = PurePosixPath(*member_path.parts[2:])
+                if rel is None:
+                    continue
+                if rel == PurePosixPath():
+                    continue
+
+                # Drop macOS metadata (AppleDouble / Finder files) from bundles to keep
+                # sync outputs deterministic and avoid polluting the docs tree.
+                if any(part.startswith("._") for part in rel.parts):
+                    continue
+                if rel.name == ".DS_Store":
+                    continue
+
+                file_obj = tf.extractfile(member)
+                if file_obj is None:
+                    raise ValueError(f"failed to extract tar entry: {member.name}")
+                if out_dir is None:
+                    h = hashlib.sha256()
+                    size = 0
+                    for chunk in iter(lambda: file_obj.read(_COPY_CHUNK_SIZE), b""):
+                        h.update(chunk)
+                        size += len(chunk)
+                    digest = h.hexdigest()
+                else:
+                    digest, size = _content_store.write_stream(out_dir / Path(str(rel)), file_obj, store=store)
+                extracted.append({"path": rel.as_posix(), "sha256": digest, "size": size})
+        bundle_sha256 = reader.hexdigest()
 
     extracted.sort(key=lambda e: e["path"])
-    return extracted
+    return extracted, bundle_sha256
 
 
-def _apply_docs_overlays(*, repo_root: Path, docs_out: Path) -> None:
+def _iter_docs_overlays(repo_root: Path) -> list[tuple[PurePosixPath, Path]]:
     overlays_root = repo_root / "docs" / "_overlays"
     if not overlays_root.is_dir():
-        return
+        return []
 
+    out: list[tuple[PurePosixPath, Path]] = []
     for src in sorted(overlays_root.rglob("*")):
         if not src.is_file():
             continue
@@ -139,10 +209,13 @@ def _apply_docs_overlays(*, repo_root: Path, docs_out: Path) -> None:
             continue
         if any(part.startswith("._") for part in rel.parts):
             continue
+        out.append((PurePosixPath(rel.as_posix()), src))
+    return out
 
-        dst = docs_out / rel
-        dst.parent.mkdir(parents=True, exist_ok=True)
-        dst.write_bytes(src.read_bytes())
+
+def _apply_docs_overlays(*, repo_root: Path, docs_out: Path, store: Path | None) -> None:
+    for rel, src in _iter_docs_overlays(repo_root):
+        _content_store.copy_file(src, docs_out / Path(str(rel)), store=store)
 
 
 def _ignore_macos_metadata(_: str, names: list[str]) -> set[str]:
@@ -177,67 +250,90 @@ def _detect_stdlib_version(toolchain_repo: Path) -> str:
     return versions[-1][1]
 
 
-def _generate_stdlib_index(toolchain_repo: Path, out_path: Path) -> dict:
+def _generate_stdlib_index(toolchain_repo: Path, *, parse_jobs: int | None = None) -> dict:
     stdlib_version = _detect_stdlib_version(toolchain_repo)
     modules_root = toolchain_repo / "stdlib" / "std" / stdlib_version / "modules"
     module_paths = sorted(modules_root.rglob("*.x07.json"))
+    parsed = _module_exports.module_exports(module_paths, jobs=parse_jobs)
 
     modules: list[dict] = []
     for p in module_paths:
-        doc = json.loads(p.read_text(encoding="utf-8"))
-        module_id = doc.get("module_id")
-        if not isinstance(module_id, str) or not module_id:
+        module_id = parsed[p]["module_id"]
+        if not module_id:
             raise ValueError(f"stdlib module missing module_id: {p}")
-        exports: list[str] = []
-        for decl in doc.get("decls", []):
-            if not isinstance(decl, dict):
-                continue
-            if decl.get("kind") == "export":
-                names = decl.get("names", [])
-                if isinstance(names, list):
-                    exports.extend([n for n in names if isinstance(n, str)])
-        exports = sorted(set(exports))
         modules.append(
             {
                 "module_id": module_id,
                 "path": p.relative_to(modules_root).as_posix(),
-                "exports": exports,
+                "exports": list(parsed[p]["names"]),
             }
         )
 
     modules.sort(key=lambda m: m["module_id"])
-    idx = {
+    return {
         "schema_version": "x07.website.stdlib-index@0.1.0",
         "stdlib_version": stdlib_version,
         "modules": modules,
     }
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(json.dumps(idx, indent=2) + "\n", encoding="utf-8")
-    return idx
 
 
-def _extract_module_exports(doc: dict) -> list[str]:
-    exports: list[str] = []
-    for decl in doc.get("decls", []):
-        if not isinstance(decl, dict):
-            continue
-        if decl.get("kind") != "export":
-            continue
-        names = decl.get("names", [])
-        if not isinstance(names, list):
-            continue
-        exports.extend([n for n in names if isinstance(n, str) and n])
-    return sorted(set(exports))
+def _load_package_manifest(version_dir: Path) -> dict | None:
+    manifest_path = version_dir / "x07-package.json"
+    if not manifest_path.is_file():
+        return None
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    name = manifest.get("name")
+    version = manifest.get("version")
+    description = manifest.get("description")
+    docs = manifest.get("docs")
+    module_root = manifest.get("module_root")
+    modules = manifest.get("modules", [])
+    if not isinstance(name, str) or not name:
+        raise ValueError(f"package manifest missing name: {manifest_path}")
+    if not isinstance(version, str) or not version:
+        raise ValueError(f"package manifest missing version: {manifest_path}")
+    if description is None:
+        description = ""
+    if not isinstance(description, str):
+        raise ValueError(f"package manifest invalid description: {manifest_path}")
+    if docs is None:
+        docs = ""
+    if not isinstance(docs, str):
+        raise ValueError(f"package manifest invalid docs: {manifest_path}")
+    if not isinstance(module_root, str) or not module_root:
+        raise ValueError(f"package manifest missing module_root: {manifest_path}")
+    if not isinstance(modules, list) or not all(isinstance(m, str) for m in modules):
+        raise ValueError(f"package manifest invalid modules list: {manifest_path}")
+    meta = manifest.get("meta")
+    if not isinstance(meta, dict):
+        raise ValueError(f"package manifest missing/invalid meta: {manifest_path}")
+
+    modules_root = version_dir / module_root
+    module_files: list[tuple[str, str, Path]] = []
+    for module_id in sorted(set(modules)):
+        rel = module_id.replace(".", "/") + ".x07.json"
+        module_path = modules_root / rel
+        if not module_path.is_file():
+            raise ValueError(f"missing module file for {name}@{version}: {module_path}")
+        module_files.append((module_id, rel, module_path))
+
+    return {
+        "name": name,
+        "version": version,
+        "description": description,
+        "docs": docs,
+        "module_root": module_root,
+        "meta": meta,
+        "module_files": module_files,
+    }
 
 
-def _generate_external_package_indexes(*, toolchain_repo: Path, out_dir: Path) -> None:
+def _generate_external_package_indexes(*, toolchain_repo: Path, parse_jobs: int | None = None) -> list[dict]:
     packages_root = toolchain_repo / "packages" / "ext"
     if not packages_root.is_dir():
-        return
-
-    out_root = out_dir / "packages"
-    out_root.mkdir(parents=True, exist_ok=True)
+        return []
 
+    manifests: list[dict] = []
     for pkg_dir in sorted(packages_root.iterdir(), key=lambda p: p.name):
         if not pkg_dir.is_dir():
             continue
@@ -250,69 +346,94 @@ def _generate_external_package_indexes(*, toolchain_repo: Path, out_dir: Path) -
             versions.append(child)
 
         for version_dir in sorted(versions, key=lambda p: _parse_semver(p.name) or (0, 0, 0)):
-            manifest_path = version_dir / "x07-package.json"
-            if not manifest_path.is_file():
-                continue
-            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
-            name = manifest.get("name")
-            version = manifest.get("version")
-            description = manifest.get("description")
-            docs = manifest.get("docs")
-            module_root = manifest.get("module_root")
-            modules = manifest.get("modules", [])
-            if not isinstance(name, str) or not name:
-                raise ValueError(f"package manifest missing name: {manifest_path}")
-            if not isinstance(version, str) or not version:
-                raise ValueError(f"package manifest missing version: {manifest_path}")
-            if description is None:
-                description = ""
-            if not isinstance(description, str):
-                raise ValueError(f"package manifest invalid description: {manifest_path}")
-            if docs is None:
-                docs = ""
-            if not isinstance(docs, str):
-                raise ValueError(f"package manifest invalid docs: {manifest_path}")
-            if not isinstance(module_root, str) or not module_root:
-                raise ValueError(f"package manifest missing module_root: {manifest_path}")
-            if not isinstance(modules, list) or not all(isinstance(m, str) for m in modules):
-                raise ValueError(f"package manifest invalid modules list: {manifest_path}")
-            meta = manifest.get("meta")
-            if not isinstance(meta, dict):
-                raise ValueError(f"package manifest missing/invalid meta: {manifest_path}")
-
-            modules_root = version_dir / module_root
-            module_items: list[dict] = []
-            for module_id in sorted(set(modules)):
-                rel = module_id.replace(".", "/") + ".x07.json"
-                module_path = modules_root / rel
-                if not module_path.is_file():
-                    raise ValueError(f"missing module file for {name}@{version}: {module_path}")
-                doc = json.loads(module_path.read_text(encoding="utf-8"))
-                exports = _extract_module_exports(doc)
-                module_items.append({"module_id": module_id, "path": rel, "exports": exports})
-
-            idx = {
+            manifest = _load_package_manifest(version_dir)
+            if manifest is not None:
+                manifests.append(manifest)
+
+    # Parse every module of every package version in one batch (cached + pooled).
+    parsed = _module_exports.module_exports(
+        [module_path for m in manifests for _, _, module_path in m["module_files"]], jobs=parse_jobs
+    )
+
+    out: list[dict] = []
+    for m in manifests:
+        module_items = [
+            {
+                "module_id": module_id,
+                "path": rel,
+                "exports": [n for n in parsed[module_path]["names"] if n],
+            }
+            for module_id, rel, module_path in m["module_files"]
+        ]
+        out.append(
+            {
                 "schema_version": "x07.website.package-index@0.2.0",
-                "name": name,
-                "version": version,
-                "description": description,
-                "docs": docs,
-                "module_root": module_root,
-                "meta": meta,
+                "name": m["name"],
+                "version": m["version"],
+                "description": m["description"],
+                "docs": m["docs"],
+                "module_root": m["module_root"],
+                "meta": m["meta"],
                 "modules": module_items,
             }
-            out_path = out_root / name / version / "index.json"
-            out_path.parent.mkdir(parents=True, exist_ok=True)
-            out_path.write_text(json.dumps(idx, indent=2) + "\n", encoding="utf-8")
+        )
+
+    return out
+
+
+_RENAME_EXCHANGE = 2
+_AT_FDCWD = -100
 
 
-def _copy_tree(src: Path, dst: Path) -> None:
-    if dst.exists():
-        shutil.rmtree(dst)
-    shutil.copytree(src, dst)
+def _exchange_dirs(a: Path, b: Path) -> bool:
+    """Atomically swap two directory entries (Linux renameat2); False when unsupported."""
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        renameat2 = ctypes.CDLL(None, use_errno=True).renameat2
+    except (OSError, AttributeError):
+        return False
+    renameat2.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_uint]
+    renameat2.restype = ctypes.c_int
+    if renameat2(_AT_FDCWD, os.fsencode(a), _AT_FDCWD, os.fsencode(b), _RENAME_EXCHANGE) == 0:
+        return True
+    err = ctypes.get_errno()
+    if err in (errno.ENOSYS, errno.EINVAL, errno.EPERM, errno.EOPNOTSUPP):
+        return False
+    raise OSError(err, os.strerror(err), str(a))
+
+
+def _staging_dir(target: Path) -> Path:
+    staging = target.with_name(f".{target.name}.staging")
+    if staging.exists():
+        # Left over from an interrupted run.
+        shutil.rmtree(staging)
+    return staging
+
+
+def _promote_staged_dir(staging: Path, target: Path) -> None:
+    """Replace `target` with the fully built `staging` tree in one step."""
+    if target.exists() and _exchange_dirs(staging, target):
+        shutil.rmtree(staging)  # now holds the previous tree
+        return
+
+    retired = target.with_name(f".{target.name}.retired")
+    if retired.exists():
+        shutil.rmtree(retired)
+    if target.exists():
+        os.rename(target, retired)
+    os.rename(staging, target)
+    if retired.exists():
+        shutil.rmtree(retired)
 
 
-def _snapshot_tree(root: Path) -> list[dict]:
+def _snapshot_tree(root: Path, *, known: dict[str, tuple[str, int, int]] | None = None) -> list[dict]:
+    """List files under `root` with digests.
+
+    `known` maps paths to (sha256, size, mtime_ns) recorded while writing; those
+    digests are reused as long as the file on disk still has the same size and mtime.
+    """
+    known = known or {}
     files: list[dict] = []
     for p in sorted(root.rglob("*")):
         if not p.is_file():
@@ -322,34 +443,124 @@ def _snapshot_tree(root: Path) -> list[dict]:
             continue
         if any(part.startswith("._") for part in rel.parts):
             continue
+        rel_posix = rel.as_posix()
+        if rel_posix == "manifest.json" or _manifest_views.is_view_path(rel_posix):
+            continue
 
-        files.append(
-            {
-                "path": rel.as_posix(),
-                "sha256": _sha256_path(p),
-                "size": p.stat().st_size,
-            }
-        )
+        st = p.stat()
+        prev = known.get(rel_posix)
+        if prev is not None and prev[1:] == (st.st_size, st.st_mtime_ns):
+            digest = prev[0]
+        else:
+            digest = _sha256_path(p)
+        files.append({"path": rel_posix, "sha256": digest, "size": st.st_size})
 
     files.sort(key=lambda e: e["path"])
     return files
 
 
+def _generate_agent_indexes(
+    *,
+    repo_root: Path,
+    agent_dir: Path,
+    check: bool,
+    store: Path | None = None,
+    publish_as: Path | None = None,
+    scans: _tree_model.Scans | None = None,
+) -> None:
+    rc = generate_agent_indexes.generate(
+        repo_root=repo_root,
+        agent_dir=agent_dir,
+        check=check,
+        store=store,
+        publish_as=publish_as,
+        scans=scans,
+    )
+    if rc != 0:
+        raise SystemExit(rc)
+
+
+def _load_manifest_baseline(agent_dir: Path) -> dict[str, dict]:
+    manifest_path = agent_dir / "manifest.json"
+    if not manifest_path.is_file():
+        return {}
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    entries = manifest.get("agent", []) if isinstance(manifest, dict) else []
+    if not isinstance(entries, list):
+        raise ValueError(f"manifest agent must be array: {manifest_path}")
+    baseline: dict[str, dict] = {}
+    for e in entries:
+        if isinstance(e, dict) and isinstance(e.get("path"), str):
+            baseline[e["path"]] = e
+    return baseline
+
+
+def _iter_source_files(src: Path, ignore) -> list[tuple[str, Path]]:
+    # Same file selection as shutil.copytree(src, ..., ignore=ignore).
+    out: list[tuple[str, Path]] = []
+    for dirpath, dirnames, filenames in os.walk(src):
+        ignored = ignore(dirpath, dirnames + filenames)
+        dirnames[:] = sorted(d for d in dirnames if d not in ignored)
+        for name in sorted(filenames):
+            if name in ignored:
+                continue
+            p = Path(dirpath) / name
+            out.append((p.relative_to(src).as_posix(), p))
+    return out
+
+
 def _sync_agent_portal(
     toolchain_version: str,
     docs_bundle_sha256: str,
     toolchain_repo: Path,
     out_dir: Path,
     repo_root: Path,
+    store: Path | None,
+    incremental: bool,
+    parse_jobs: int | None = None,
 ) -> list[dict]:
-    if out_dir.exists():
-        shutil.rmtree(out_dir)
-    (out_dir / "catalog").mkdir(parents=True, exist_ok=True)
-    (out_dir / "schemas").mkdir(parents=True, exist_ok=True)
-    (out_dir / "skills").mkdir(parents=True, exist_ok=True)
-    (out_dir / "stdlib").mkdir(parents=True, exist_ok=True)
-    (out_dir / "examples").mkdir(parents=True, exist_ok=True)
-    (out_dir / "packages").mkdir(parents=True, exist_ok=True)
+    if incremental:
+        baseline = _load_manifest_baseline(out_dir)
+    else:
+        baseline = {}
+        if out_dir.exists():
+            shutil.rmtree(out_dir)
+    for sub in ("catalog", "schemas", "skills", "stdlib", "examples", "packages"):
+        (out_dir / sub).mkdir(parents=True, exist_ok=True)
+
+    written: dict[str, tuple[str, int, int]] = {}
+    rewritten = 0
+
+    def put(rel: str, *, src: Path | None = None, data: bytes | None = None) -> None:
+        nonlocal rewritten
+        if src is not None:
+            digest = _sha256_path(src)
+            size = src.stat().st_size
+        else:
+            assert data is not None
+            digest = hashlib.sha256(data).hexdigest()
+            size = len(data)
+
+        # Compare with the file on disk rather than the baseline manifest, so hand-edited or
+        # corrupted files are repaired; the digest cache keeps unchanged files cheap.
+        dst = out_dir / rel
+        try:
+            st = dst.stat()
+        except FileNotFoundError:
+            st = None
+        if st is not None and (st.st_size != size or _sha256_path(dst) != digest):
+            st = None
+        if st is None:
+            if src is not None:
+                _content_store.copy_file(src, dst, store=store)
+            else:
+                _content_store.atomic_write_bytes(dst, data)
+            st = dst.stat()
+            rewritten += 1
+        written[rel] = (digest, size, st.st_mtime_ns)
+
+    def put_json(rel: str, obj: object) -> None:
+        put(rel, data=(json.dumps(obj, indent=2) + "\n").encode("utf-8"))
 
     # Schemas
     schema_srcs = [
@@ -360,46 +571,36 @@ def _sync_agent_portal(
         if not src.is_dir():
             continue
         for p in sorted(src.glob("*.schema.json")):
-            dst = out_dir / "schemas" / p.name
-            dst.write_bytes(p.read_bytes())
+            put(f"schemas/{p.name}", src=p)
 
     # Skills (raw folder sync)
     skills_src = toolchain_repo / "skills"
     if skills_src.is_dir():
-        shutil.copytree(
-            skills_src,
-            out_dir / "skills",
-            dirs_exist_ok=True,
-            ignore=_ignore_skills_copy,
-        )
+        for rel, p in _iter_source_files(skills_src, _ignore_skills_copy):
+            put(f"skills/{rel}", src=p)
 
         skills_pack = skills_src / "pack" / ".agent" / "skills"
         if skills_pack.is_dir():
-            shutil.copytree(
-                skills_pack,
-                out_dir / "skills" / "pack" / "skills",
-                dirs_exist_ok=True,
-                ignore=_ignore_macos_metadata,
-            )
+            for rel, p in _iter_source_files(skills_pack, _ignore_macos_metadata):
+                put(f"skills/pack/skills/{rel}", src=p)
 
     # Stdlib index
-    stdlib_index_path = out_dir / "stdlib" / "index.json"
-    _generate_stdlib_index(toolchain_repo, stdlib_index_path)
+    put_json("stdlib/index.json", _generate_stdlib_index(toolchain_repo, parse_jobs=parse_jobs))
 
     # External packages index (official packages/ext)
-    _generate_external_package_indexes(toolchain_repo=toolchain_repo, out_dir=out_dir)
+    for idx in _generate_external_package_indexes(toolchain_repo=toolchain_repo, parse_jobs=parse_jobs):
+        put_json(f"packages/{idx['name']}/{idx['version']}/index.json", idx)
 
     # Agent catalog (capabilities map, etc.)
     capabilities_src = toolchain_repo / "catalog" / "capabilities.json"
     if capabilities_src.is_file():
-        (out_dir / "catalog" / "capabilities.json").write_bytes(capabilities_src.read_bytes())
+        put("catalog/capabilities.json", src=capabilities_src)
 
     # Examples (a small, stable subset)
     examples_src = toolchain_repo / "docs" / "examples"
     if examples_src.is_dir():
         for p in sorted(examples_src.glob("*.x07.json")):
-            dst = out_dir / "examples" / p.name
-            dst.write_bytes(p.read_bytes())
+            put(f"examples/{p.name}", src=p)
 
     agent_index = {
         "schema_version": "x07.website.agent-index@0.1.0",
@@ -411,139 +612,281 @@ def _sync_agent_portal(
         "examples_dir": "examples/",
         "packages_dir": "packages/",
         "manifest_url": "manifest.json",
+        "manifest_index_url": _manifest_views.INDEX_PATH,
     }
-    index_path = out_dir / "index.json"
-    index_path.write_text(json.dumps(agent_index, indent=2) + "\n", encoding="utf-8")
-
-    subprocess.check_call(
-        [
-            sys.executable,
-            str(repo_root / "scripts" / "generate_agent_indexes.py"),
-            "--agent-dir",
-            str(out_dir.relative_to(repo_root)),
-        ]
-    )
+    # Keep the fields the generator adds below, so an unchanged bundle leaves index.json as is;
+    # the generator drops any that no longer apply.
+    try:
+        previous_index = json.loads((out_dir / "index.json").read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        previous_index = None
+    if isinstance(previous_index, dict):
+        agent_index.update(
+            (k, v) for k, v in previous_index.items() if k in generate_agent_indexes.INDEX_URL_FIELDS
+        )
+    put_json("index.json", agent_index)
 
-    return _snapshot_tree(out_dir)
+    # Files from the previous sync whose source disappeared.
+    removed = 0
+    for rel in sorted(baseline):
+        if rel in written or generate_agent_indexes.owns_path(rel):
+            continue
+        p = out_dir / rel
+        if p.is_file():
+            p.unlink()
+            removed += 1
+            # Drop the directories the removal left empty.
+            for d in p.parents:
+                if d == out_dir or any(d.iterdir()):
+                    break
+                d.rmdir()
+
+    _generate_agent_indexes(repo_root=repo_root, agent_dir=out_dir, check=False, store=store)
+
+    if incremental:
+        print(
+            f"ok: incremental sync {out_dir.relative_to(repo_root)}: "
+            f"{rewritten} written, {len(written) - rewritten} unchanged, {removed} removed"
+        )
+    return _snapshot_tree(out_dir, known=written)
 
 
-def main(argv: list[str]) -> int:
-    args = parse_args(argv)
-    toolchain_version = args.toolchain_version
-    if _parse_semver(toolchain_version) is None:
-        print(f"ERROR: invalid toolchain version: {toolchain_version}", file=sys.stderr)
-        return 2
+def _load_batch(batch_path: Path, *, toolchain_repo: Path | None) -> list[dict]:
+    """Read a batch file: a JSON array of {toolchain_version, bundle[, toolchain_repo, published_at_utc]}.
+
+    Relative paths are resolved against the batch file's directory.
+    """
+    doc = json.loads(batch_path.read_text(encoding="utf-8"))
+    if not isinstance(doc, list) or not doc:
+        raise SystemExit(f"ERROR: batch file must be a non-empty JSON array: {batch_path}")
+    base = batch_path.resolve().parent
+    jobs: list[dict] = []
+    seen: set[str] = set()
+    for i, entry in enumerate(doc):
+        if not isinstance(entry, dict):
+            raise SystemExit(f"ERROR: batch entry {i} must be an object")
+        version = entry.get("toolchain_version")
+        bundle = entry.get("bundle")
+        if not isinstance(version, str) or not isinstance(bundle, str):
+            raise SystemExit(f"ERROR: batch entry {i} needs string toolchain_version and bundle")
+        if version in seen:
+            raise SystemExit(f"ERROR: duplicate toolchain_version in batch: {version}")
+        seen.add(version)
+        repo = entry.get("toolchain_repo")
+        jobs.append(
+            {
+                "toolchain_version": version,
+                "bundle": base / bundle,
+                "toolchain_repo": base / repo if isinstance(repo, str) else toolchain_repo,
+                "published_at_utc": entry.get("published_at_utc"),
+            }
+        )
+    return jobs
 
-    root = Path(__file__).resolve().parents[1]
-    bundle_path = args.bundle
-    if not bundle_path.is_file():
-        print(f"ERROR: bundle not found: {bundle_path}", file=sys.stderr)
-        return 2
-    docs_bundle_sha256 = _sha256_path(bundle_path)
 
-    toolchain_repo = args.toolchain_repo
+def _validate_job(job: dict, *, root: Path, need_toolchain_repo: bool) -> str | None:
+    version = job["toolchain_version"]
+    if _parse_semver(version) is None:
+        return f"invalid toolchain version: {version}"
+    if not job["bundle"].is_file():
+        return f"bundle not found: {job['bundle']}"
+    if not need_toolchain_repo:
+        return None
+    toolchain_repo = job["toolchain_repo"]
     if toolchain_repo is None:
         toolchain_repo = root.parent / "x07"
-    toolchain_repo = toolchain_repo.resolve()
-    if not toolchain_repo.is_dir():
-        print(f"ERROR: toolchain repo not found: {toolchain_repo}", file=sys.stderr)
+    job["toolchain_repo"] = toolchain_repo.resolve()
+    if not job["toolchain_repo"].is_dir():
+        return f"toolchain repo not found: {job['toolchain_repo']}"
+    return None
+
+
+def _diff_entries(expected: dict[str, dict], actual: dict[str, dict]) -> dict[str, list[str]]:
+    return {
+        "missing": sorted(set(expected) - set(actual)),
+        "extra": sorted(set(actual) - set(expected)),
+        "modified": sorted(
+            rel
+            for rel in set(expected) & set(actual)
+            if (expected[rel]["sha256"], expected[rel]["size"]) != (actual[rel]["sha256"], actual[rel]["size"])
+        ),
+    }
+
+
+def _verify_version(*, root: Path, toolchain_version: str, bundle_path: Path) -> int:
+    """Compare the bundle's docs members with the manifest and with docs/vX.Y.Z, without extracting.
+
+    Overlay files (docs/_overlays) are not part of the bundle and are ignored on the docs side.
+    """
+    version_dir = f"v{toolchain_version}"
+    manifest_path = root / "agent" / version_dir / "manifest.json"
+    docs_dir = root / "docs" / version_dir
+    if not manifest_path.is_file():
+        print(f"ERROR: missing {manifest_path.relative_to(root)}", file=sys.stderr)
+        return 2
+    if not docs_dir.is_dir():
+        print(f"ERROR: missing {docs_dir.relative_to(root)}", file=sys.stderr)
         return 2
 
-    if args.check:
-        versions_path = root / "versions" / "toolchain_versions.json"
-        versions = json.loads(versions_path.read_text(encoding="utf-8"))
-        versions_list = versions.get("versions", [])
-        if not isinstance(versions_list, list):
-            raise ValueError("versions.versions must be array")
-
-        found = False
-        for entry in versions_list:
-            if not isinstance(entry, dict):
-                continue
-            if entry.get("toolchain_version") != toolchain_version:
-                continue
-            if entry.get("docs_bundle_sha256") != docs_bundle_sha256:
-                raise SystemExit(
-                    f"[CHECK] versions/toolchain_versions.json sha mismatch for {toolchain_version}"
-                )
-            found = True
-            break
-        if not found:
+    bundle_entries, bundle_sha256 = _extract_human_docs_bundle(bundle_path, None)
+    bundle = {e["path"]: e for e in bundle_entries}
+
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    recorded = {
+        e["path"]: e
+        for e in manifest.get("human_docs", [])
+        if isinstance(e, dict) and isinstance(e.get("path"), str)
+    }
+
+    overlays = {rel.as_posix() for rel, _ in _iter_docs_overlays(root)}
+    on_disk: dict[str, dict] = {}
+    for p in sorted(docs_dir.rglob("*")):
+        if not p.is_file():
+            continue
+        rel = p.relative_to(docs_dir).as_posix()
+        if rel in overlays:
+            continue
+        on_disk[rel] = {"sha256": _sha256_path(p), "size": p.stat().st_size}
+    bundle_without_overlays = {rel: e for rel, e in bundle.items() if rel not in overlays}
+
+    problems = 0
+    if manifest.get("docs_bundle_sha256") != bundle_sha256:
+        print(f"[VERIFY] {version_dir}: manifest docs_bundle_sha256 does not match bundle")
+        problems += 1
+    for label, diff in (
+        (f"agent/{version_dir}/manifest.json", _diff_entries(bundle, recorded)),
+        (f"docs/{version_dir}", _diff_entries(bundle_without_overlays, on_disk)),
+    ):
+        for kind in ("missing", "extra", "modified"):
+            for rel in diff[kind]:
+                print(f"[VERIFY] {label}: {kind}: {rel}")
+                problems += 1
+
+    if problems:
+        print(f"ERROR: {toolchain_version}: {problems} differences against {bundle_path.name}", file=sys.stderr)
+        return 1
+    print(f"ok: {toolchain_version}: {len(bundle)} docs files match {bundle_path.name}")
+    return 0
+
+
+def _check_version(*, root: Path, toolchain_version: str, bundle_path: Path, scans: _tree_model.Scans) -> None:
+    docs_bundle_sha256 = _sha256_path(bundle_path)
+    versions_path = root / "versions" / "toolchain_versions.json"
+    versions = json.loads(versions_path.read_text(encoding="utf-8"))
+    versions_list = versions.get("versions", [])
+    if not isinstance(versions_list, list):
+        raise ValueError("versions.versions must be array")
+
+    found = False
+    for entry in versions_list:
+        if not isinstance(entry, dict):
+            continue
+        if entry.get("toolchain_version") != toolchain_version:
+            continue
+        if entry.get("docs_bundle_sha256") != docs_bundle_sha256:
             raise SystemExit(
-                f"[CHECK] versions/toolchain_versions.json missing toolchain_version {toolchain_version}"
+                f"[CHECK] versions/toolchain_versions.json sha mismatch for {toolchain_version}"
             )
-
-        subprocess.check_call(
-            [
-                sys.executable,
-                str(root / "scripts" / "generate_agent_indexes.py"),
-                "--check",
-                "--agent-dir",
-                f"agent/v{toolchain_version}",
-            ]
-        )
-        subprocess.check_call(
-            [
-                sys.executable,
-                str(root / "scripts" / "generate_agent_indexes.py"),
-                "--check",
-                "--agent-dir",
-                "agent/latest",
-            ]
+        found = True
+        break
+    if not found:
+        raise SystemExit(
+            f"[CHECK] versions/toolchain_versions.json missing toolchain_version {toolchain_version}"
         )
-        subprocess.check_call([sys.executable, str(root / "scripts" / "check_site.py"), "--check"])
 
-        print(f"ok: sync outputs up to date for {toolchain_version}")
-        return 0
+    _generate_agent_indexes(
+        repo_root=root, agent_dir=root / "agent" / f"v{toolchain_version}", check=True, scans=scans
+    )
+
 
+def _sync_version(
+    *,
+    root: Path,
+    toolchain_version: str,
+    bundle_path: Path,
+    toolchain_repo: Path,
+    store: Path | None,
+    incremental: bool,
+    parse_jobs: int | None = None,
+) -> str:
+    """Write docs/vX.Y.Z and agent/vX.Y.Z (including manifest.json); return the bundle digest.
+
+    Touches nothing shared between versions, so several versions can run in parallel;
+    pool workers pass parse_jobs=1 so module parsing does not start a nested pool.
+    """
     version_dir = f"v{toolchain_version}"
     docs_out = root / "docs" / version_dir
     agent_out = root / "agent" / version_dir
 
-    with tempfile.TemporaryDirectory() as tmp:
-        tmp_path = Path(tmp)
-        tmp_docs = tmp_path / "docs"
-        extracted_docs = _extract_human_docs_bundle(bundle_path, tmp_docs)
-        if docs_out.exists():
-            shutil.rmtree(docs_out)
-        shutil.copytree(tmp_docs, docs_out)
-        _apply_docs_overlays(repo_root=root, docs_out=docs_out)
-
-    synced_agent_files = _sync_agent_portal(
-        toolchain_version=toolchain_version,
-        docs_bundle_sha256=docs_bundle_sha256,
-        toolchain_repo=toolchain_repo,
-        out_dir=agent_out,
-        repo_root=root,
-    )
+    try:
+        # Members are written once, straight into the staging tree (or the store); the bundle
+        # digest is computed during extraction, so there is no separate hashing pass.
+        docs_staging = _staging_dir(docs_out)
+        extracted_docs, docs_bundle_sha256 = _extract_human_docs_bundle(bundle_path, docs_staging, store=store)
+        _apply_docs_overlays(repo_root=root, docs_out=docs_staging, store=store)
+        _promote_staged_dir(docs_staging, docs_out)
+
+        synced_agent_files = _sync_agent_portal(
+            toolchain_version=toolchain_version,
+            docs_bundle_sha256=docs_bundle_sha256,
+            toolchain_repo=toolchain_repo,
+            out_dir=agent_out,
+            repo_root=root,
+            store=store,
+            incremental=incremental,
+            parse_jobs=parse_jobs,
+        )
 
-    # Copy latest pointers
-    _copy_tree(docs_out, root / "docs" / "latest")
-    _copy_tree(agent_out, root / "agent" / "latest")
+        # Persist manifests (machine-first)
+        manifest = {
+            "schema_version": "x07.website.docs-bundle-manifest@0.1.0",
+            "toolchain_version": toolchain_version,
+            "docs_bundle_sha256": docs_bundle_sha256,
+            "human_docs": extracted_docs,
+            "agent": synced_agent_files,
+        }
+        _content_store.atomic_write_text(agent_out / "manifest.json", json.dumps(manifest, indent=2) + "\n")
+
+        if store is not None:
+            # Generated index files are written fresh; fold them into the store as well.
+            for tree in (docs_out, agent_out):
+                _content_store.dedupe_tree(store, tree)
+    finally:
+        # Pool workers have their own caches; merge them back before exiting.
+        _hash_cache.save()
+        _module_exports.save()
 
-    # Persist manifests (machine-first)
-    manifest = {
-        "schema_version": "x07.website.docs-bundle-manifest@0.1.0",
-        "toolchain_version": toolchain_version,
-        "docs_bundle_sha256": docs_bundle_sha256,
-        "human_docs": extracted_docs,
-        "agent": synced_agent_files,
-    }
-    (root / "agent" / version_dir / "manifest.json").write_text(
-        json.dumps(manifest, indent=2) + "\n", encoding="utf-8"
-    )
-    _copy_tree(agent_out, root / "agent" / "latest")
-
-    subprocess.check_call(
-        [
-            sys.executable,
-            str(root / "scripts" / "generate_agent_indexes.py"),
-            "--agent-dir",
-            "agent/latest",
-        ]
+    print(f"ok: synced docs+agent for {toolchain_version}")
+    return docs_bundle_sha256
+
+
+def _publish_latest(*, root: Path, toolchain_version: str, store: Path | None) -> None:
+    # Build each tree next to its target and swap it in, so readers
+    # (dev server, rsync) never see a half-written latest.
+    version_dir = f"v{toolchain_version}"
+    docs_latest = root / "docs" / "latest"
+    docs_staging = _staging_dir(docs_latest)
+    _content_store.copy_tree(root / "docs" / version_dir, docs_staging, store=store)
+    _promote_staged_dir(docs_staging, docs_latest)
+
+    agent_latest = root / "agent" / "latest"
+    agent_staging = _staging_dir(agent_latest)
+    _content_store.copy_tree(root / "agent" / version_dir, agent_staging, store=store)
+    _generate_agent_indexes(
+        repo_root=root,
+        agent_dir=agent_staging,
+        check=False,
+        store=store,
+        publish_as=Path("agent") / "latest",
     )
+    if store is not None:
+        _content_store.dedupe_tree(store, agent_staging)
+    _promote_staged_dir(agent_staging, agent_latest)
+    print(f"ok: published latest as {toolchain_version}")
+
 
-    # Update versions map
+def _update_versions_map(*, root: Path, synced: list[dict], latest: str | None) -> None:
+    """Record each synced {toolchain_version, docs_bundle_sha256, published_at_utc} in one write."""
     versions_path = root / "versions" / "toolchain_versions.json"
     versions = json.loads(versions_path.read_text(encoding="utf-8"))
     if versions.get("schema_version") != "x07.website.toolchain-versions@0.1.0":
@@ -552,36 +895,140 @@ def main(argv: list[str]) -> int:
     if not isinstance(versions_list, list):
         raise ValueError("versions.versions must be array")
 
-    updated = False
-    for entry in versions_list:
-        if not isinstance(entry, dict):
+    by_version = {
+        entry.get("toolchain_version"): entry for entry in versions_list if isinstance(entry, dict)
+    }
+    for item in synced:
+        entry = by_version.get(item["toolchain_version"])
+        if entry is None:
+            versions_list.append(dict(item))
             continue
-        if entry.get("toolchain_version") == toolchain_version:
-            entry["docs_bundle_sha256"] = docs_bundle_sha256
-            if args.published_at_utc is not None:
-                entry["published_at_utc"] = args.published_at_utc
-            updated = True
-            break
-    if not updated:
-        versions_list.append(
-            {
-                "toolchain_version": toolchain_version,
-                "docs_bundle_sha256": docs_bundle_sha256,
-                "published_at_utc": args.published_at_utc,
-            }
-        )
+        entry["docs_bundle_sha256"] = item["docs_bundle_sha256"]
+        if item["published_at_utc"] is not None:
+            entry["published_at_utc"] = item["published_at_utc"]
+
     versions["versions"] = _sort_toolchain_versions_desc(versions_list)
-    if args.set_latest or versions.get("latest_toolchain_version") is None:
-        versions["latest_toolchain_version"] = toolchain_version
+    if latest is not None:
+        versions["latest_toolchain_version"] = latest
     versions_path.write_text(json.dumps(versions, indent=2) + "\n", encoding="utf-8")
 
     static_versions_path = root / "site" / "static" / "versions" / "toolchain_versions.json"
     static_versions_path.parent.mkdir(parents=True, exist_ok=True)
     static_versions_path.write_text(json.dumps(versions, indent=2) + "\n", encoding="utf-8")
 
-    print(f"ok: synced docs+agent for {toolchain_version}")
+
+def main(argv: list[str], *, scans: _tree_model.Scans | None = None) -> int:
+    """Entry point; `scans` lets --check share tree models with the caller (sync_pipeline.py)."""
+    args = parse_args(argv)
+    root = Path(__file__).resolve().parents[1]
+
+    if args.batch is not None:
+        if args.toolchain_version is not None or args.bundle is not None:
+            print("ERROR: --batch cannot be combined with --toolchain-version/--bundle", file=sys.stderr)
+            return 2
+        if not args.batch.is_file():
+            print(f"ERROR: batch file not found: {args.batch}", file=sys.stderr)
+            return 2
+        jobs = _load_batch(args.batch, toolchain_repo=args.toolchain_repo)
+    else:
+        if args.toolchain_version is None or args.bundle is None:
+            print("ERROR: --toolchain-version and --bundle are required (or use --batch)", file=sys.stderr)
+            return 2
+        jobs = [
+            {
+                "toolchain_version": args.toolchain_version,
+                "bundle": args.bundle,
+                "toolchain_repo": args.toolchain_repo,
+                "published_at_utc": args.published_at_utc,
+            }
+        ]
+
+    for job in jobs:
+        err = _validate_job(job, root=root, need_toolchain_repo=not args.verify)
+        if err is not None:
+            print(f"ERROR: {err}", file=sys.stderr)
+            return 2
+
+    store = args.object_store.resolve() if args.object_store is not None else None
+
+    if args.verify:
+        rc = 0
+        for job in jobs:
+            job_rc = _verify_version(root=root, toolchain_version=job["toolchain_version"], bundle_path=job["bundle"])
+            rc = max(rc, job_rc)
+        return rc
+
+    if args.check:
+        # Nothing is written below, so the index checks and check_site.py read one scan per tree.
+        scans = scans if scans is not None else _tree_model.Scans()
+        for job in jobs:
+            _check_version(
+                root=root, toolchain_version=job["toolchain_version"], bundle_path=job["bundle"], scans=scans
+            )
+        _generate_agent_indexes(repo_root=root, agent_dir=root / "agent" / "latest", check=True, scans=scans)
+        rc = check_site.check_repo(root, scans=scans)
+        if rc != 0:
+            return rc
+
+        print(f"ok: sync outputs up to date for {', '.join(job['toolchain_version'] for job in jobs)}")
+        return 0
+
+    work = [
+        dict(
+            root=root,
+            toolchain_version=job["toolchain_version"],
+            bundle_path=job["bundle"],
+            toolchain_repo=job["toolchain_repo"],
+            store=store,
+            incremental=args.incremental,
+        )
+        for job in jobs
+    ]
+    digests: dict[str, str] = {}
+    workers = min(args.jobs or os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        for kwargs in work:
+            digests[kwargs["toolchain_version"]] = _sync_version(**kwargs)
+    else:
+        # Versions write disjoint trees; everything shared (latest, versions map) happens below, once.
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(_sync_version, **kwargs, parse_jobs=1): kwargs["toolchain_version"] for kwargs in work
+            }
+            for fut in concurrent.futures.as_completed(futures):
+                digests[futures[fut]] = fut.result()
+
+    # The newest version in the run becomes latest only with --set-latest or when there is
+    # no latest yet; the latest trees are republished when that version changed or was resynced.
+    versions_path = root / "versions" / "toolchain_versions.json"
+    current_latest = json.loads(versions_path.read_text(encoding="utf-8")).get("latest_toolchain_version")
+    newest = max((job["toolchain_version"] for job in jobs), key=lambda v: _parse_semver(v) or (0, 0, 0))
+    latest = newest if args.set_latest or current_latest is None else current_latest
+
+    if latest != current_latest or latest in digests:
+        _publish_latest(root=root, toolchain_version=latest, store=store)
+
+    _update_versions_map(
+        root=root,
+        synced=[
+            {
+                "toolchain_version": job["toolchain_version"],
+                "docs_bundle_sha256": digests[job["toolchain_version"]],
+                "published_at_utc": job["published_at_utc"],
+            }
+            for job in jobs
+        ],
+        latest=latest,
+    )
+
+    if len(jobs) > 1:
+        print(f"ok: synced {len(jobs)} versions with {workers} workers")
     return 0
 
 
 if __name__ == "__main__":
-    raise SystemExit(main(sys.argv[1:]))
+    try:
+        raise SystemExit(main(sys.argv[1:]))
+    finally:
+        _hash_cache.save()
+        _module_exports.save()
@@ -0,0 +1,139 @@
+"""
+Run the whole release sync in one interpreter.
+
+Stages (each one is the importable entry point of the corresponding script):
+  1. sync_from_bundle.py            (docs/vX.Y.Z, agent/vX.Y.Z, latest, versions map)
+  2. site/gen_docusaurus_inputs.py  (site/ inputs)
+  3. sync_from_bundle.py --check    (agent index checks + check_site.py)
+  4. site/gen_docusaurus_inputs.py --check
+  5. ci/validate_agent_package_indexes.py --check
+
+All stages share the process-wide digest cache (scripts/_hash_cache.py), so a
+file hashed by one stage is not reread by the next, and the interpreter and
+cache are loaded once instead of once per child process. The read-only stages
+also share one _tree_model scan per tree: the sync check hands it to the
+agent index checks and to check_site.py. Every stage is timed and reported,
+and the run ends with a summary, even when a stage fails or exits.
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+import time
+
+_SCRIPTS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(_SCRIPTS_DIR / "site"))
+sys.path.insert(0, str(_SCRIPTS_DIR / "ci"))
+
+import _hash_cache  # noqa: E402
+import _module_exports  # noqa: E402
+import _tree_model  # noqa: E402
+import gen_docusaurus_inputs  # noqa: E402
+import sync_from_bundle  # noqa: E402
+import validate_agent_package_indexes  # noqa: E402
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--toolchain-version", default=None)
+    ap.add_argument("--bundle", default=None, type=Path)
+    ap.add_argument("--batch", type=Path, default=None)
+    ap.add_argument("--jobs", type=int, default=None)
+    ap.add_argument("--toolchain-repo", type=Path, default=None)
+    ap.add_argument("--published-at-utc", default=None)
+    ap.add_argument("--set-latest", action="store_true")
+    ap.add_argument("--incremental", action="store_true")
+    ap.add_argument("--object-store", type=Path, default=None)
+    ap.add_argument("--check", action="store_true", help="only run the verification stages")
+    return ap.parse_args(argv)
+
+
+def _sync_argv(args: argparse.Namespace) -> list[str]:
+    argv = []
+    if args.batch is not None:
+        argv += ["--batch", str(args.batch)]
+    else:
+        argv += ["--toolchain-version", str(args.toolchain_version), "--bundle", str(args.bundle)]
+    if args.toolchain_repo is not None:
+        argv += ["--toolchain-repo", str(args.toolchain_repo)]
+    if args.published_at_utc is not None:
+        argv += ["--published-at-utc", args.published_at_utc]
+    if args.set_latest:
+        argv.append("--set-latest")
+    if args.incremental:
+        argv.append("--incremental")
+    if args.object_store is not None:
+        argv += ["--object-store", str(args.object_store)]
+    if args.jobs is not None:
+        argv += ["--jobs", str(args.jobs)]
+    return argv
+
+
+def _run_stage(name: str, fn, timings: list[tuple[str, str, float]]) -> int:
+    t0 = time.perf_counter()
+    status = "raised"
+    try:
+        rc = fn()
+        rc = 0 if rc is None else rc
+        status = f"rc={rc}"
+        return rc
+    except SystemExit as e:
+        # SystemExit("message") exits with status 1; the message itself is printed by the interpreter.
+        status = f"exit={e.code if isinstance(e.code, int) or e.code is None else 1}"
+        raise
+    finally:
+        elapsed = time.perf_counter() - t0
+        timings.append((name, status, elapsed))
+        print(f"[pipeline] {name}: {status} ({elapsed:.2f}s)")
+
+
+def main(argv: list[str]) -> int:
+    args = parse_args(argv)
+    if args.batch is None and (args.toolchain_version is None or args.bundle is None):
+        print("ERROR: --toolchain-version and --bundle are required (or use --batch)", file=sys.stderr)
+        return 2
+    root = _SCRIPTS_DIR.parent
+    sync_argv = _sync_argv(args)
+
+    stages = []
+    if not args.check:
+        stages += [
+            ("sync", lambda: sync_from_bundle.main(sync_argv)),
+            ("docusaurus inputs", lambda: gen_docusaurus_inputs.main(["--repo-root", str(root)])),
+        ]
+    # Nothing writes after the sync stages, so the checks can share tree scans.
+    scans = _tree_model.Scans()
+    stages += [
+        ("sync check", lambda: sync_from_bundle.main([*sync_argv, "--check"], scans=scans)),
+        ("docusaurus inputs check", lambda: gen_docusaurus_inputs.main(["--repo-root", str(root), "--check"])),
+        (
+            "package indexes check",
+            lambda: validate_agent_package_indexes.main(["--check", "--repo-root", str(root)]),
+        ),
+    ]
+
+    timings: list[tuple[str, str, float]] = []
+    try:
+        for name, fn in stages:
+            rc = _run_stage(name, fn, timings)
+            if rc != 0:
+                return rc
+    finally:
+        failed = [f"{name} ({status})" for name, status, _ in timings if status != "rc=0"]
+        print(
+            f"[pipeline] {len(timings)}/{len(stages)} stages ran in {sum(t for _, _, t in timings):.2f}s"
+            + (f"; failed: {', '.join(failed)}" if failed else "")
+        )
+
+    print(f"ok: sync pipeline for {args.toolchain_version or args.batch}")
+    return 0
+
+
+if __name__ == "__main__":
+    try:
+        raise SystemExit(main(sys.argv[1:]))
+    finally:
+        _hash_cache.save()
+        _module_exports.save()
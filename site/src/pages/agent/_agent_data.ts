@@ -1,4108 +0,0 @@
-/**
- * THIS FILE IS GENERATED by scripts/generate_agent_indexes.py
- * DO NOT EDIT BY HAND.
- */
-
-export const latestSkillsIndex = {
-  "schema_version": "x07.website.agent.skills_index@v1",
-  "generated_from": "agent/latest/skills/*/SKILL.md",
-  "items": [
-    {
-      "id": "x07-agent-context",
-      "summary": "Produce deterministic, token-efficient context packs (`x07 agent context`) that agents can use to repair a failing X07 project.",
-      "docs_url": "/agent/latest/skills/x07-agent-context/SKILL.md",
-      "report_schema_url": null
-    },
-    {
-      "id": "x07-agent-playbook",
-      "summary": "Agent-first workflow and design rails for building X07 programs with the released toolchain (no repo-only dependencies). Canonical execution is via `x07 run`.",
-      "docs_url": "/agent/latest/skills/x07-agent-playbook/SKILL.md",
-      "report_schema_url": null
-    },
-    {
-      "id": "x07-bundle",
-      "summary": "Produce distributable native executables (normal CLI ABI) via `x07 bundle`.",
-      "docs_url": "/agent/latest/skills/x07-bundle/SKILL.md",
-      "report_schema_url": null
-    },
-    {
-      "id": "x07-concurrency",
-      "summary": "Canonical concurrency patterns in X07 (defasync + task.* + chan.bytes.*), including sandbox constraints.",
-      "docs_url": "/agent/latest/skills/x07-concurrency/SKILL.md",
-      "report_schema_url": null
-    },
-    {
-      "id": "x07-ffi-c",
-      "summary": "Emit C output and a C header for embedding X07 in C/C++ via `x07 build --emit-c-header`.",
-      "docs_url": "/agent/latest/skills/x07-ffi-c/SKILL.md",
-      "report_schema_url": null
-    },
-    {
-      "id": "x07-format",
-      "summary": "Canonically format X07 x07AST JSON files using `x07 fmt` (check/write).",
-      "docs_url": "/agent/latest/skills/x07-format/SKILL.md",
-      "report_schema_url": "/agent/latest/schemas/x07c.report.schema.json"
-    },
-    {
-      "id": "x07-io-streams",
-      "summary": "Canonical streaming I/O patterns in X07 using std.io / std.io.bufread and world adapters.",
-      "docs_url": "/agent/latest/skills/x07-io-streams/SKILL.md",
-      "report_schema_url": null
-    },
-    {
-      "id": "x07-language-guide",
-      "summary": "Canonical X07 language + stdlib reference (mirrors `x07 guide` output) for end-user skill packs.",
-      "docs_url": "/agent/latest/skills/x07-language-guide/SKILL.md",
-      "report_schema_url": null
-    },
-    {
-      "id": "x07-lint-repair",
-      "summary": "Lint X07 x07AST JSON and converge via quickfixes (`x07 fix`) or explicit JSON Patch (`x07 ast apply-patch`).",
-      "docs_url": "/agent/latest/skills/x07-lint-repair/SKILL.md",
-      "report_schema_url": "/agent/latest/schemas/x07c.report.schema.json"
-    },
-    {
-      "id": "x07-os-run",
-      "summary": "Expert backend for run-os / run-os-sandboxed execution via x07-os-runner. Prefer `x07 run --profile os` / `x07 run --profile sandbox`.",
-      "docs_url": "/agent/latest/skills/x07-os-run/SKILL.md",
-      "report_schema_url": "/agent/latest/schemas/x07-os-runner.report.schema.json"
-    },
-    {
-      "id": "x07-package",
-      "summary": "Manage X07 project dependencies and lockfiles for reproducible builds (lock, publish). Designed for autonomous agents.",
-      "docs_url": "/agent/latest/skills/x07-package/SKILL.md",
-      "report_schema_url": null
-    },
-    {
-      "id": "x07-run",
-      "summary": "Canonical execution front door for X07 programs (run-os / run-os-sandboxed), producing runner reports.",
-      "docs_url": "/agent/latest/skills/x07-run/SKILL.md",
-      "report_schema_url": null
-    },
-    {
-      "id": "x07-test",
-      "summary": "Run project tests using the X07 test harness (x07 test), producing a machine-readable JSON report.",
-      "docs_url": "/agent/latest/skills/x07-test/SKILL.md",
-      "report_schema_url": "/agent/latest/schemas/x07test.schema.json"
-    },
-    {
-      "id": "x07-xtal",
-      "summary": "Spec-first workflows and incident improvement via `x07 xtal ...`, producing deterministic artifacts under `target/xtal/`.",
-      "docs_url": "/agent/latest/skills/x07-xtal/SKILL.md",
-      "report_schema_url": null
-    }
-  ]
-} as const;
-
-export const latestSchemasIndex = {
-  "schema_version": "x07.website.agent.schemas_index@v1",
-  "generated_from": "agent/latest/schemas/*.schema.json",
-  "items": [
-    {
-      "id": "run-os-policy.schema.json",
-      "url": "/agent/latest/schemas/run-os-policy.schema.json"
-    },
-    {
-      "id": "x07-agent.context.schema.json",
-      "url": "/agent/latest/schemas/x07-agent.context.schema.json"
-    },
-    {
-      "id": "x07-arch.archive.index.schema.json",
-      "url": "/agent/latest/schemas/x07-arch.archive.index.schema.json"
-    },
-    {
-      "id": "x07-arch.archive.profile.schema.json",
-      "url": "/agent/latest/schemas/x07-arch.archive.profile.schema.json"
-    },
-    {
-      "id": "x07-arch.boundaries.index.schema.json",
-      "url": "/agent/latest/schemas/x07-arch.boundaries.index.schema.json"
-    },
-    {
-      "id": "x07-arch.boundaries.report.schema.json",
-      "url": "/agent/latest/schemas/x07-arch.boundaries.report.schema.json"
-    },
-    {
-      "id": "x07-arch.budgets.index.schema.json",
-      "url": "/agent/latest/schemas/x07-arch.budgets.index.schema.json"
-    },
-    {
-      "id": "x07-arch.cli.index.schema.json",
-      "url": "/agent/latest/schemas/x07-arch.cli.index.schema.json"
-    },
-    {
-      "id": "x07-arch.cli.profile.schema.json",
-      "url": "/agent/latest/schemas/x07-arch.cli.profile.schema.json"
-    },
-    {
-      "id": "x07-arch.contracts.lock.schema.json",
-      "url": "/agent/latest/schemas/x07-arch.contracts.lock.schema.json"
-    },
-    {
-      "id": "x07-arch.crawl.index.schema.json",
-      "url": "/agent/latest/schemas/x07-arch.crawl.index.schema.json"
-    },
-    {
-      "id": "x07-arch.crawl.policy.schema.json",
-      "url": "/agent/latest/schemas/x07-arch.crawl.policy.schema.json"
-    },
-    {
-      "id": "x07-arch.crypto.index.schema.json",
-      "url": "/agent/latest/schemas/x07-arch.crypto.index.schema.json"
-    },
-    {
-      "id": "x07-arch.crypto.jwt_profiles.schema.json",
-      "url": "/agent/latest/schemas/x07-arch.crypto.jwt_profiles.schema.json"
-    },
-    {
-      "id": "x07-arch.db.index.schema.json",
-      "url": "/agent/latest/schemas/x07-arch.db.index.schema.json"
-    },
-    {
-      "id": "x07-arch.db.queries.schema.json",
-      "url": "/agent/latest/schemas/x07-arch.db.queries.schema.json"
-    },
-    {
-      "id": "x07-arch.gen.index.schema.json",
-      "url": "/agent/latest/schemas/x07-arch.gen.index.schema.json"
-    },
-    {
-      "id": "x07-arch.manifest.lock.schema.json",
-      "url": "/agent/latest/schemas/x07-arch.manifest.lock.schema.json"
-    },
-    {
-      "id": "x07-arch.manifest.schema.json",
-      "url": "/agent/latest/schemas/x07-arch.manifest.schema.json"
-    },
-    {
-      "id": "x07-arch.msg.amqp.index.schema.json",
-      "url": "/agent/latest/schemas/x07-arch.msg.amqp.index.schema.json"
-    },
-    {
-      "id": "x07-arch.msg.amqp.profile.schema.json",
-      "url": "/agent/latest/schemas/x07-arch.msg.amqp.profile.schema.json"
-    },
-    {
-      "id": "x07-arch.msg.amqp.topology.schema.json",
-      "url": "/agent/latest/schemas/x07-arch.msg.amqp.topology.schema.json"
-    },
-    {
-      "id": "x07-arch.msg.index.schema.json",
-      "url": "/agent/latest/schemas/x07-arch.msg.index.schema.json"
-    },
-    {
-      "id": "x07-arch.msg.kafka.index.schema.json",
-      "url": "/agent/latest/schemas/x07-arch.msg.kafka.index.schema.json"
-    },
-    {
-      "id": "x07-arch.msg.kafka.profile.schema.json",
-      "url": "/agent/latest/schemas/x07-arch.msg.kafka.profile.schema.json"
-    },
-    {
-      "id": "x07-arch.net.grpc.services.schema.json",
-      "url": "/agent/latest/schemas/x07-arch.net.grpc.services.schema.json"
-    },
-    {
-      "id": "x07-arch.net.index.schema.json",
-      "url": "/agent/latest/schemas/x07-arch.net.index.schema.json"
-    },
-    {
-      "id": "x07-arch.obs.index.schema.json",
-      "url": "/agent/latest/schemas/x07-arch.obs.index.schema.json"
-    },
-    {
-      "id": "x07-arch.patchset.schema.json",
-      "url": "/agent/latest/schemas/x07-arch.patchset.schema.json"
-    },
-    {
-      "id": "x07-arch.report.schema.json",
-      "url": "/agent/latest/schemas/x07-arch.report.schema.json"
-    },
-    {
-      "id": "x07-arch.rr.index.schema.json",
-      "url": "/agent/latest/schemas/x07-arch.rr.index.schema.json"
-    },
-    {
-      "id": "x07-arch.rr.policy.schema.json",
-      "url": "/agent/latest/schemas/x07-arch.rr.policy.schema.json"
-    },
-    {
-      "id": "x07-arch.rr.sanitize.schema.json",
-      "url": "/agent/latest/schemas/x07-arch.rr.sanitize.schema.json"
-    },
-    {
-      "id": "x07-arch.sm.index.schema.json",
-      "url": "/agent/latest/schemas/x07-arch.sm.index.schema.json"
-    },
-    {
-      "id": "x07-arch.stream-plugin.schema.json",
-      "url": "/agent/latest/schemas/x07-arch.stream-plugin.schema.json"
-    },
-    {
-      "id": "x07-arch.stream-plugins.index.schema.json",
-      "url": "/agent/latest/schemas/x07-arch.stream-plugins.index.schema.json"
-    },
-    {
-      "id": "x07-arch.tasks.index.schema.json",
-      "url": "/agent/latest/schemas/x07-arch.tasks.index.schema.json"
-    },
-    {
-      "id": "x07-arch.web.api.schema.json",
-      "url": "/agent/latest/schemas/x07-arch.web.api.schema.json"
-    },
-    {
-      "id": "x07-arch.web.index.schema.json",
-      "url": "/agent/latest/schemas/x07-arch.web.index.schema.json"
-    },
-    {
-      "id": "x07-arch.web.openapi_profile.schema.json",
-      "url": "/agent/latest/schemas/x07-arch.web.openapi_profile.schema.json"
-    },
-    {
-      "id": "x07-bench.instance.schema.json",
-      "url": "/agent/latest/schemas/x07-bench.instance.schema.json"
-    },
-    {
-      "id": "x07-bench.report.schema.json",
-      "url": "/agent/latest/schemas/x07-bench.report.schema.json"
-    },
-    {
-      "id": "x07-bench.suite.schema.json",
-      "url": "/agent/latest/schemas/x07-bench.suite.schema.json"
-    },
-    {
-      "id": "x07-budget.profile.schema.json",
-      "url": "/agent/latest/schemas/x07-budget.profile.schema.json"
-    },
-    {
-      "id": "x07-bundle.report.schema.json",
-      "url": "/agent/latest/schemas/x07-bundle.report.schema.json"
-    },
-    {
-      "id": "x07-capabilities.schema.json",
-      "url": "/agent/latest/schemas/x07-capabilities.schema.json"
-    },
-    {
-      "id": "x07-capsule.attest.schema.json",
-      "url": "/agent/latest/schemas/x07-capsule.attest.schema.json"
-    },
-    {
-      "id": "x07-capsule.contract.schema.json",
-      "url": "/agent/latest/schemas/x07-capsule.contract.schema.json"
-    },
-    {
-      "id": "x07-capsule.index.schema.json",
-      "url": "/agent/latest/schemas/x07-capsule.index.schema.json"
-    },
-    {
-      "id": "x07-compile.attest.schema.json",
-      "url": "/agent/latest/schemas/x07-compile.attest.schema.json"
-    },
-    {
-      "id": "x07-db.migrate.plan.schema.json",
-      "url": "/agent/latest/schemas/x07-db.migrate.plan.schema.json"
-    },
-    {
-      "id": "x07-dep.closure.attest.schema.json",
-      "url": "/agent/latest/schemas/x07-dep.closure.attest.schema.json"
-    },
-    {
-      "id": "x07-deps.capability-policy.schema.json",
-      "url": "/agent/latest/schemas/x07-deps.capability-policy.schema.json"
-    },
-    {
-      "id": "x07-diag.catalog.schema.json",
-      "url": "/agent/latest/schemas/x07-diag.catalog.schema.json"
-    },
-    {
-      "id": "x07-diag.coverage.schema.json",
-      "url": "/agent/latest/schemas/x07-diag.coverage.schema.json"
-    },
-    {
-      "id": "x07-doc.report.schema.json",
-      "url": "/agent/latest/schemas/x07-doc.report.schema.json"
-    },
-    {
-      "id": "x07-effect.log.schema.json",
-      "url": "/agent/latest/schemas/x07-effect.log.schema.json"
-    },
-    {
-      "id": "x07-guest.failure.schema.json",
-      "url": "/agent/latest/schemas/x07-guest.failure.schema.json"
-    },
-    {
-      "id": "x07-guest.request.schema.json",
-      "url": "/agent/latest/schemas/x07-guest.request.schema.json"
-    },
-    {
-      "id": "x07-host-runner.report.schema.json",
-      "url": "/agent/latest/schemas/x07-host-runner.report.schema.json"
-    },
-    {
-      "id": "x07-install.channels.schema.json",
-      "url": "/agent/latest/schemas/x07-install.channels.schema.json"
-    },
-    {
-      "id": "x07-lock.schema.json",
-      "url": "/agent/latest/schemas/x07-lock.schema.json"
-    },
-    {
-      "id": "x07-lock.v0.2.0.schema.json",
-      "url": "/agent/latest/schemas/x07-lock.v0.2.0.schema.json"
-    },
-    {
-      "id": "x07-lock.v0.3.0.schema.json",
-      "url": "/agent/latest/schemas/x07-lock.v0.3.0.schema.json"
-    },
-    {
-      "id": "x07-lock.v0.4.0.schema.json",
-      "url": "/agent/latest/schemas/x07-lock.v0.4.0.schema.json"
-    },
-    {
-      "id": "x07-mem.provenance-graph.schema.json",
-      "url": "/agent/latest/schemas/x07-mem.provenance-graph.schema.json"
-    },
-    {
-      "id": "x07-mono.map.schema.json",
-      "url": "/agent/latest/schemas/x07-mono.map.schema.json"
-    },
-    {
-      "id": "x07-obs.exporter.profile.schema.json",
-      "url": "/agent/latest/schemas/x07-obs.exporter.profile.schema.json"
-    },
-    {
-      "id": "x07-obs.metrics.registry.schema.json",
-      "url": "/agent/latest/schemas/x07-obs.metrics.registry.schema.json"
-    },
-    {
-      "id": "x07-os-runner.report.schema.json",
-      "url": "/agent/latest/schemas/x07-os-runner.report.schema.json"
-    },
-    {
-      "id": "x07-package.schema.json",
-      "url": "/agent/latest/schemas/x07-package.schema.json"
-    },
-    {
-      "id": "x07-peer.policy.schema.json",
-      "url": "/agent/latest/schemas/x07-peer.policy.schema.json"
-    },
-    {
-      "id": "x07-pkg.advisory.schema.json",
-      "url": "/agent/latest/schemas/x07-pkg.advisory.schema.json"
-    },
-    {
-      "id": "x07-policy-init.report.schema.json",
-      "url": "/agent/latest/schemas/x07-policy-init.report.schema.json"
-    },
-    {
-      "id": "x07-project.schema.json",
-      "url": "/agent/latest/schemas/x07-project.schema.json"
-    },
-    {
-      "id": "x07-project.v0.2.0.schema.json",
-      "url": "/agent/latest/schemas/x07-project.v0.2.0.schema.json"
-    },
-    {
-      "id": "x07-project.v0.3.0.schema.json",
-      "url": "/agent/latest/schemas/x07-project.v0.3.0.schema.json"
-    },
-    {
-      "id": "x07-project.v0.4.0.schema.json",
-      "url": "/agent/latest/schemas/x07-project.v0.4.0.schema.json"
-    },
-    {
-      "id": "x07-project.v0.5.0.schema.json",
-      "url": "/agent/latest/schemas/x07-project.v0.5.0.schema.json"
-    },
-    {
-      "id": "x07-review.diff.schema.json",
-      "url": "/agent/latest/schemas/x07-review.diff.schema.json"
-    },
-    {
-      "id": "x07-run.report.schema.json",
-      "url": "/agent/latest/schemas/x07-run.report.schema.json"
-    },
-    {
-      "id": "x07-runtime.attest.schema.json",
-      "url": "/agent/latest/schemas/x07-runtime.attest.schema.json"
-    },
-    {
-      "id": "x07-sm.spec.schema.json",
-      "url": "/agent/latest/schemas/x07-sm.spec.schema.json"
-    },
-    {
-      "id": "x07-spec.index.schema.json",
-      "url": "/agent/latest/schemas/x07-spec.index.schema.json"
-    },
-    {
-      "id": "x07-tool-agent-context.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-agent-context.report.schema.json"
-    },
-    {
-      "id": "x07-tool-agent.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-agent.report.schema.json"
-    },
-    {
-      "id": "x07-tool-arch-check.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-arch-check.report.schema.json"
-    },
-    {
-      "id": "x07-tool-arch.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-arch.report.schema.json"
-    },
-    {
-      "id": "x07-tool-assets-embed-dir.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-assets-embed-dir.report.schema.json"
-    },
-    {
-      "id": "x07-tool-assets.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-assets.report.schema.json"
-    },
-    {
-      "id": "x07-tool-ast-apply-patch.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-ast-apply-patch.report.schema.json"
-    },
-    {
-      "id": "x07-tool-ast-canon.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-ast-canon.report.schema.json"
-    },
-    {
-      "id": "x07-tool-ast-edit-apply-quickfix.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-ast-edit-apply-quickfix.report.schema.json"
-    },
-    {
-      "id": "x07-tool-ast-edit-insert-stmts.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-ast-edit-insert-stmts.report.schema.json"
-    },
-    {
-      "id": "x07-tool-ast-edit.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-ast-edit.report.schema.json"
-    },
-    {
-      "id": "x07-tool-ast-get.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-ast-get.report.schema.json"
-    },
-    {
-      "id": "x07-tool-ast-grammar.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-ast-grammar.report.schema.json"
-    },
-    {
-      "id": "x07-tool-ast-init.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-ast-init.report.schema.json"
-    },
-    {
-      "id": "x07-tool-ast-schema.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-ast-schema.report.schema.json"
-    },
-    {
-      "id": "x07-tool-ast-slice.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-ast-slice.report.schema.json"
-    },
-    {
-      "id": "x07-tool-ast-validate.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-ast-validate.report.schema.json"
-    },
-    {
-      "id": "x07-tool-ast.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-ast.report.schema.json"
-    },
-    {
-      "id": "x07-tool-bench-eval.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-bench-eval.report.schema.json"
-    },
-    {
-      "id": "x07-tool-bench-list.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-bench-list.report.schema.json"
-    },
-    {
-      "id": "x07-tool-bench-validate.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-bench-validate.report.schema.json"
-    },
-    {
-      "id": "x07-tool-bench.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-bench.report.schema.json"
-    },
-    {
-      "id": "x07-tool-build.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-build.report.schema.json"
-    },
-    {
-      "id": "x07-tool-bundle.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-bundle.report.schema.json"
-    },
-    {
-      "id": "x07-tool-check.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-check.report.schema.json"
-    },
-    {
-      "id": "x07-tool-cli-spec-check.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-cli-spec-check.report.schema.json"
-    },
-    {
-      "id": "x07-tool-cli-spec-compile.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-cli-spec-compile.report.schema.json"
-    },
-    {
-      "id": "x07-tool-cli-spec-fmt.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-cli-spec-fmt.report.schema.json"
-    },
-    {
-      "id": "x07-tool-cli-spec.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-cli-spec.report.schema.json"
-    },
-    {
-      "id": "x07-tool-cli.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-cli.report.schema.json"
-    },
-    {
-      "id": "x07-tool-diag-catalog.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-diag-catalog.report.schema.json"
-    },
-    {
-      "id": "x07-tool-diag-check.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-diag-check.report.schema.json"
-    },
-    {
-      "id": "x07-tool-diag-coverage.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-diag-coverage.report.schema.json"
-    },
-    {
-      "id": "x07-tool-diag-explain.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-diag-explain.report.schema.json"
-    },
-    {
-      "id": "x07-tool-diag-init-catalog.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-diag-init-catalog.report.schema.json"
-    },
-    {
-      "id": "x07-tool-diag-sarif.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-diag-sarif.report.schema.json"
-    },
-    {
-      "id": "x07-tool-diag.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-diag.report.schema.json"
-    },
-    {
-      "id": "x07-tool-doctor.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-doctor.report.schema.json"
-    },
-    {
-      "id": "x07-tool-explain.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-explain.report.schema.json"
-    },
-    {
-      "id": "x07-tool-fix.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-fix.report.schema.json"
-    },
-    {
-      "id": "x07-tool-fmt.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-fmt.report.schema.json"
-    },
-    {
-      "id": "x07-tool-gen-verify.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-gen-verify.report.schema.json"
-    },
-    {
-      "id": "x07-tool-gen-write.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-gen-write.report.schema.json"
-    },
-    {
-      "id": "x07-tool-gen.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-gen.report.schema.json"
-    },
-    {
-      "id": "x07-tool-guide.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-guide.report.schema.json"
-    },
-    {
-      "id": "x07-tool-info.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-info.report.schema.json"
-    },
-    {
-      "id": "x07-tool-init.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-init.report.schema.json"
-    },
-    {
-      "id": "x07-tool-lint.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-lint.report.schema.json"
-    },
-    {
-      "id": "x07-tool-mcp.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-mcp.report.schema.json"
-    },
-    {
-      "id": "x07-tool-migrate.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-migrate.report.schema.json"
-    },
-    {
-      "id": "x07-tool-patch-apply.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-patch-apply.report.schema.json"
-    },
-    {
-      "id": "x07-tool-patch.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-patch.report.schema.json"
-    },
-    {
-      "id": "x07-tool-pkg-add.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-pkg-add.report.schema.json"
-    },
-    {
-      "id": "x07-tool-pkg-attest-closure.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-pkg-attest-closure.report.schema.json"
-    },
-    {
-      "id": "x07-tool-pkg-check-semver.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-pkg-check-semver.report.schema.json"
-    },
-    {
-      "id": "x07-tool-pkg-info.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-pkg-info.report.schema.json"
-    },
-    {
-      "id": "x07-tool-pkg-inventory.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-pkg-inventory.report.schema.json"
-    },
-    {
-      "id": "x07-tool-pkg-list.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-pkg-list.report.schema.json"
-    },
-    {
-      "id": "x07-tool-pkg-lock.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-pkg-lock.report.schema.json"
-    },
-    {
-      "id": "x07-tool-pkg-login.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-pkg-login.report.schema.json"
-    },
-    {
-      "id": "x07-tool-pkg-pack.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-pkg-pack.report.schema.json"
-    },
-    {
-      "id": "x07-tool-pkg-provides.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-pkg-provides.report.schema.json"
-    },
-    {
-      "id": "x07-tool-pkg-publish.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-pkg-publish.report.schema.json"
-    },
-    {
-      "id": "x07-tool-pkg-remove.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-pkg-remove.report.schema.json"
-    },
-    {
-      "id": "x07-tool-pkg-repair.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-pkg-repair.report.schema.json"
-    },
-    {
-      "id": "x07-tool-pkg-tree.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-pkg-tree.report.schema.json"
-    },
-    {
-      "id": "x07-tool-pkg-verify.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-pkg-verify.report.schema.json"
-    },
-    {
-      "id": "x07-tool-pkg-versions.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-pkg-versions.report.schema.json"
-    },
-    {
-      "id": "x07-tool-pkg.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-pkg.report.schema.json"
-    },
-    {
-      "id": "x07-tool-policy-init.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-policy-init.report.schema.json"
-    },
-    {
-      "id": "x07-tool-policy.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-policy.report.schema.json"
-    },
-    {
-      "id": "x07-tool-project-migrate.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-project-migrate.report.schema.json"
-    },
-    {
-      "id": "x07-tool-project.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-project.report.schema.json"
-    },
-    {
-      "id": "x07-tool-prove-check.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-prove-check.report.schema.json"
-    },
-    {
-      "id": "x07-tool-prove.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-prove.report.schema.json"
-    },
-    {
-      "id": "x07-tool-repro-compile.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-repro-compile.report.schema.json"
-    },
-    {
-      "id": "x07-tool-repro.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-repro.report.schema.json"
-    },
-    {
-      "id": "x07-tool-review-diff.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-review-diff.report.schema.json"
-    },
-    {
-      "id": "x07-tool-review.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-review.report.schema.json"
-    },
-    {
-      "id": "x07-tool-root.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-root.report.schema.json"
-    },
-    {
-      "id": "x07-tool-rr-record.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-rr-record.report.schema.json"
-    },
-    {
-      "id": "x07-tool-rr.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-rr.report.schema.json"
-    },
-    {
-      "id": "x07-tool-run.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-run.report.schema.json"
-    },
-    {
-      "id": "x07-tool-schema-derive.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-schema-derive.report.schema.json"
-    },
-    {
-      "id": "x07-tool-schema.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-schema.report.schema.json"
-    },
-    {
-      "id": "x07-tool-service-archetypes.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-service-archetypes.report.schema.json"
-    },
-    {
-      "id": "x07-tool-service-genpack-grammar.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-service-genpack-grammar.report.schema.json"
-    },
-    {
-      "id": "x07-tool-service-genpack-schema.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-service-genpack-schema.report.schema.json"
-    },
-    {
-      "id": "x07-tool-service-genpack.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-service-genpack.report.schema.json"
-    },
-    {
-      "id": "x07-tool-service-validate.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-service-validate.report.schema.json"
-    },
-    {
-      "id": "x07-tool-service.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-service.report.schema.json"
-    },
-    {
-      "id": "x07-tool-sm-check.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-sm-check.report.schema.json"
-    },
-    {
-      "id": "x07-tool-sm-gen.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-sm-gen.report.schema.json"
-    },
-    {
-      "id": "x07-tool-sm.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-sm.report.schema.json"
-    },
-    {
-      "id": "x07-tool-test.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-test.report.schema.json"
-    },
-    {
-      "id": "x07-tool-trust-capsule-attest.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-trust-capsule-attest.report.schema.json"
-    },
-    {
-      "id": "x07-tool-trust-capsule-check.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-trust-capsule-check.report.schema.json"
-    },
-    {
-      "id": "x07-tool-trust-capsule.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-trust-capsule.report.schema.json"
-    },
-    {
-      "id": "x07-tool-trust-certify.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-trust-certify.report.schema.json"
-    },
-    {
-      "id": "x07-tool-trust-profile-check.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-trust-profile-check.report.schema.json"
-    },
-    {
-      "id": "x07-tool-trust-profile.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-trust-profile.report.schema.json"
-    },
-    {
-      "id": "x07-tool-trust-report.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-trust-report.report.schema.json"
-    },
-    {
-      "id": "x07-tool-trust.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-trust.report.schema.json"
-    },
-    {
-      "id": "x07-tool-verify.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-verify.report.schema.json"
-    },
-    {
-      "id": "x07-tool-wasm.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-wasm.report.schema.json"
-    },
-    {
-      "id": "x07-tool-xtal-certify.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-xtal-certify.report.schema.json"
-    },
-    {
-      "id": "x07-tool-xtal-dev.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-xtal-dev.report.schema.json"
-    },
-    {
-      "id": "x07-tool-xtal-impl-check.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-xtal-impl-check.report.schema.json"
-    },
-    {
-      "id": "x07-tool-xtal-impl-sync.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-xtal-impl-sync.report.schema.json"
-    },
-    {
-      "id": "x07-tool-xtal-impl.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-xtal-impl.report.schema.json"
-    },
-    {
-      "id": "x07-tool-xtal-improve.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-xtal-improve.report.schema.json"
-    },
-    {
-      "id": "x07-tool-xtal-ingest.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-xtal-ingest.report.schema.json"
-    },
-    {
-      "id": "x07-tool-xtal-repair.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-xtal-repair.report.schema.json"
-    },
-    {
-      "id": "x07-tool-xtal-spec-check.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-xtal-spec-check.report.schema.json"
-    },
-    {
-      "id": "x07-tool-xtal-spec-extract.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-xtal-spec-extract.report.schema.json"
-    },
-    {
-      "id": "x07-tool-xtal-spec-fmt.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-xtal-spec-fmt.report.schema.json"
-    },
-    {
-      "id": "x07-tool-xtal-spec-lint.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-xtal-spec-lint.report.schema.json"
-    },
-    {
-      "id": "x07-tool-xtal-spec-scaffold.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-xtal-spec-scaffold.report.schema.json"
-    },
-    {
-      "id": "x07-tool-xtal-spec.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-xtal-spec.report.schema.json"
-    },
-    {
-      "id": "x07-tool-xtal-tasks-run.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-xtal-tasks-run.report.schema.json"
-    },
-    {
-      "id": "x07-tool-xtal-tasks.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-xtal-tasks.report.schema.json"
-    },
-    {
-      "id": "x07-tool-xtal-tests-gen-from-spec.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-xtal-tests-gen-from-spec.report.schema.json"
-    },
-    {
-      "id": "x07-tool-xtal-tests.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-xtal-tests.report.schema.json"
-    },
-    {
-      "id": "x07-tool-xtal-verify.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-xtal-verify.report.schema.json"
-    },
-    {
-      "id": "x07-tool-xtal.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool-xtal.report.schema.json"
-    },
-    {
-      "id": "x07-tool.events.schema.json",
-      "url": "/agent/latest/schemas/x07-tool.events.schema.json"
-    },
-    {
-      "id": "x07-tool.report.schema.json",
-      "url": "/agent/latest/schemas/x07-tool.report.schema.json"
-    },
-    {
-      "id": "x07-trust.certificate.schema.json",
-      "url": "/agent/latest/schemas/x07-trust.certificate.schema.json"
-    },
-    {
-      "id": "x07-trust.profile.schema.json",
-      "url": "/agent/latest/schemas/x07-trust.profile.schema.json"
-    },
-    {
-      "id": "x07-trust.report.schema.json",
-      "url": "/agent/latest/schemas/x07-trust.report.schema.json"
-    },
-    {
-      "id": "x07-typecheck.diagdata@0.1.0.schema.json",
-      "url": "/agent/latest/schemas/x07-typecheck.diagdata@0.1.0.schema.json"
-    },
-    {
-      "id": "x07-verify.coverage.schema.json",
-      "url": "/agent/latest/schemas/x07-verify.coverage.schema.json"
-    },
-    {
-      "id": "x07-verify.primitives.schema.json",
-      "url": "/agent/latest/schemas/x07-verify.primitives.schema.json"
-    },
-    {
-      "id": "x07-verify.proof-check.report.schema.json",
-      "url": "/agent/latest/schemas/x07-verify.proof-check.report.schema.json"
-    },
-    {
-      "id": "x07-verify.proof-object.schema.json",
-      "url": "/agent/latest/schemas/x07-verify.proof-object.schema.json"
-    },
-    {
-      "id": "x07-verify.proof-summary.schema.json",
-      "url": "/agent/latest/schemas/x07-verify.proof-summary.schema.json"
-    },
-    {
-      "id": "x07-verify.report.schema.json",
-      "url": "/agent/latest/schemas/x07-verify.report.schema.json"
-    },
-    {
-      "id": "x07-verify.summary.schema.json",
-      "url": "/agent/latest/schemas/x07-verify.summary.schema.json"
-    },
-    {
-      "id": "x07-vm.bundle.manifest.schema.json",
-      "url": "/agent/latest/schemas/x07-vm.bundle.manifest.schema.json"
-    },
-    {
-      "id": "x07-website.package-index.schema.json",
-      "url": "/agent/latest/schemas/x07-website.package-index.schema.json"
-    },
-    {
-      "id": "x07.component.release@0.1.0.schema.json",
-      "url": "/agent/latest/schemas/x07.component.release@0.1.0.schema.json"
-    },
-    {
-      "id": "x07.contract.repro@0.1.0.schema.json",
-      "url": "/agent/latest/schemas/x07.contract.repro@0.1.0.schema.json"
-    },
-    {
-      "id": "x07.native-backends.schema.json",
-      "url": "/agent/latest/schemas/x07.native-backends.schema.json"
-    },
-    {
-      "id": "x07.native-requires.schema.json",
-      "url": "/agent/latest/schemas/x07.native-requires.schema.json"
-    },
-    {
-      "id": "x07.patchset.schema.json",
-      "url": "/agent/latest/schemas/x07.patchset.schema.json"
-    },
-    {
-      "id": "x07.pbt.params@0.1.0.schema.json",
-      "url": "/agent/latest/schemas/x07.pbt.params@0.1.0.schema.json"
-    },
-    {
-      "id": "x07.pbt.repro@0.1.0.schema.json",
-      "url": "/agent/latest/schemas/x07.pbt.repro@0.1.0.schema.json"
-    },
-    {
-      "id": "x07.release.bundle@0.1.0.schema.json",
-      "url": "/agent/latest/schemas/x07.release.bundle@0.1.0.schema.json"
-    },
-    {
-      "id": "x07.verify.cex@0.1.0.schema.json",
-      "url": "/agent/latest/schemas/x07.verify.cex@0.1.0.schema.json"
-    },
-    {
-      "id": "x07.verify.cex@0.2.0.schema.json",
-      "url": "/agent/latest/schemas/x07.verify.cex@0.2.0.schema.json"
-    },
-    {
-      "id": "x07.x07spec@0.1.0.schema.json",
-      "url": "/agent/latest/schemas/x07.x07spec@0.1.0.schema.json"
-    },
-    {
-      "id": "x07.x07spec_examples@0.1.0.schema.json",
-      "url": "/agent/latest/schemas/x07.x07spec_examples@0.1.0.schema.json"
-    },
-    {
-      "id": "x07.xtal.cert_bundle@0.1.0.schema.json",
-      "url": "/agent/latest/schemas/x07.xtal.cert_bundle@0.1.0.schema.json"
-    },
-    {
-      "id": "x07.xtal.certify_summary@0.1.0.schema.json",
-      "url": "/agent/latest/schemas/x07.xtal.certify_summary@0.1.0.schema.json"
-    },
-    {
-      "id": "x07.xtal.improve_summary@0.1.0.schema.json",
-      "url": "/agent/latest/schemas/x07.xtal.improve_summary@0.1.0.schema.json"
-    },
-    {
-      "id": "x07.xtal.ingest_summary@0.1.0.schema.json",
-      "url": "/agent/latest/schemas/x07.xtal.ingest_summary@0.1.0.schema.json"
-    },
-    {
-      "id": "x07.xtal.manifest@0.1.0.schema.json",
-      "url": "/agent/latest/schemas/x07.xtal.manifest@0.1.0.schema.json"
-    },
-    {
-      "id": "x07.xtal.recovery_event@0.1.0.schema.json",
-      "url": "/agent/latest/schemas/x07.xtal.recovery_event@0.1.0.schema.json"
-    },
-    {
-      "id": "x07.xtal.repair_summary@0.1.0.schema.json",
-      "url": "/agent/latest/schemas/x07.xtal.repair_summary@0.1.0.schema.json"
-    },
-    {
-      "id": "x07.xtal.verify_summary@0.1.0.schema.json",
-      "url": "/agent/latest/schemas/x07.xtal.verify_summary@0.1.0.schema.json"
-    },
-    {
-      "id": "x07.xtal.violation@0.1.0.schema.json",
-      "url": "/agent/latest/schemas/x07.xtal.violation@0.1.0.schema.json"
-    },
-    {
-      "id": "x07ast.schema.json",
-      "url": "/agent/latest/schemas/x07ast.schema.json"
-    },
-    {
-      "id": "x07ast.semantic.schema.json",
-      "url": "/agent/latest/schemas/x07ast.semantic.schema.json"
-    },
-    {
-      "id": "x07ast.v0.3.0.schema.json",
-      "url": "/agent/latest/schemas/x07ast.v0.3.0.schema.json"
-    },
-    {
-      "id": "x07ast.v0.4.0.schema.json",
-      "url": "/agent/latest/schemas/x07ast.v0.4.0.schema.json"
-    },
-    {
-      "id": "x07ast.v0.5.0.schema.json",
-      "url": "/agent/latest/schemas/x07ast.v0.5.0.schema.json"
-    },
-    {
-      "id": "x07ast.v0.6.0.schema.json",
-      "url": "/agent/latest/schemas/x07ast.v0.6.0.schema.json"
-    },
-    {
-      "id": "x07ast.v0.7.0.schema.json",
-      "url": "/agent/latest/schemas/x07ast.v0.7.0.schema.json"
-    },
-    {
-      "id": "x07ast.v0.8.0.schema.json",
-      "url": "/agent/latest/schemas/x07ast.v0.8.0.schema.json"
-    },
-    {
-      "id": "x07c.report.schema.json",
-      "url": "/agent/latest/schemas/x07c.report.schema.json"
-    },
-    {
-      "id": "x07cli.specrows.schema.json",
-      "url": "/agent/latest/schemas/x07cli.specrows.schema.json"
-    },
-    {
-      "id": "x07diag.schema.json",
-      "url": "/agent/latest/schemas/x07diag.schema.json"
-    },
-    {
-      "id": "x07patch.schema.json",
-      "url": "/agent/latest/schemas/x07patch.schema.json"
-    },
-    {
-      "id": "x07test.schema.json",
-      "url": "/agent/latest/schemas/x07test.schema.json"
-    }
-  ]
-} as const;
-
-export const latestExamplesIndex = {
-  "schema_version": "x07.website.agent.examples_index@v1",
-  "generated_from": "agent/latest/examples/*.x07.json",
-  "items": [
-    {
-      "id": "01_echo",
-      "purpose": "echo",
-      "url": "/agent/latest/examples/01_echo.x07.json"
-    },
-    {
-      "id": "02_length",
-      "purpose": "length",
-      "url": "/agent/latest/examples/02_length.x07.json"
-    },
-    {
-      "id": "03_reverse",
-      "purpose": "reverse",
-      "url": "/agent/latest/examples/03_reverse.x07.json"
-    },
-    {
-      "id": "04_sum_bytes",
-      "purpose": "sum bytes",
-      "url": "/agent/latest/examples/04_sum_bytes.x07.json"
-    },
-    {
-      "id": "05_max_byte",
-      "purpose": "max byte",
-      "url": "/agent/latest/examples/05_max_byte.x07.json"
-    },
-    {
-      "id": "06_count_first",
-      "purpose": "count first",
-      "url": "/agent/latest/examples/06_count_first.x07.json"
-    },
-    {
-      "id": "07_first_line_len",
-      "purpose": "first line len",
-      "url": "/agent/latest/examples/07_first_line_len.x07.json"
-    },
-    {
-      "id": "08_is_palindrome",
-      "purpose": "is palindrome",
-      "url": "/agent/latest/examples/08_is_palindrome.x07.json"
-    },
-    {
-      "id": "09_word_count",
-      "purpose": "word count",
-      "url": "/agent/latest/examples/09_word_count.x07.json"
-    },
-    {
-      "id": "10_rle_encode",
-      "purpose": "rle encode",
-      "url": "/agent/latest/examples/10_rle_encode.x07.json"
-    },
-    {
-      "id": "11_data_analyzer",
-      "purpose": "data analyzer",
-      "url": "/agent/latest/examples/11_data_analyzer.x07.json"
-    },
-    {
-      "id": "12_async_mapreduce",
-      "purpose": "async mapreduce",
-      "url": "/agent/latest/examples/12_async_mapreduce.x07.json"
-    },
-    {
-      "id": "13_stream_pipe_split_lines",
-      "purpose": "stream pipe split lines",
-      "url": "/agent/latest/examples/13_stream_pipe_split_lines.x07.json"
-    },
-    {
-      "id": "14_task_scope_slots",
-      "purpose": "task scope slots",
-      "url": "/agent/latest/examples/14_task_scope_slots.x07.json"
-    },
-    {
-      "id": "15_text_slices_branded",
-      "purpose": "text slices branded",
-      "url": "/agent/latest/examples/15_text_slices_branded.x07.json"
-    },
-    {
-      "id": "16_generics_identity",
-      "purpose": "generics identity",
-      "url": "/agent/latest/examples/16_generics_identity.x07.json"
-    },
-    {
-      "id": "17_generics_containers",
-      "purpose": "generics containers",
-      "url": "/agent/latest/examples/17_generics_containers.x07.json"
-    }
-  ]
-} as const;
-
-export const latestPackagesIndex = {
-  "schema_version": "x07.website.agent.packages_index@v1",
-  "generated_from": "agent/latest/packages/*/*/index.json",
-  "items": [
-    {
-      "name": "ext-aho-corasick-rs",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-aho-corasick-rs/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-aho-corasick-rs/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-aho-corasick-rs",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-aho-corasick-rs/0.1.1/index.json",
-      "description": "Aho\u2013Corasick multi-pattern substring search.",
-      "docs_url": "/agent/latest/packages/ext-aho-corasick-rs/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-aho-corasick-rs",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-aho-corasick-rs/0.1.2/index.json",
-      "description": "Aho\u2013Corasick multi-pattern substring search.",
-      "docs_url": "/agent/latest/packages/ext-aho-corasick-rs/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-aho-corasick-rs",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-aho-corasick-rs/0.1.3/index.json",
-      "description": "Aho\u2013Corasick multi-pattern substring search.",
-      "docs_url": "/agent/latest/packages/ext-aho-corasick-rs/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-aho-corasick-rs",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-aho-corasick-rs/0.1.4/index.json",
-      "description": "Aho\u2013Corasick multi-pattern substring search.",
-      "docs_url": "/agent/latest/packages/ext-aho-corasick-rs/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-archive-c",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-archive-c/0.1.0/index.json",
-      "description": "Archive parsing/extraction helpers + pinned archive policies (tar/tgz v1).",
-      "docs_url": "/agent/latest/packages/ext-archive-c/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-archive-c",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-archive-c/0.1.1/index.json",
-      "description": "Archive parsing/extraction helpers + pinned archive policies (tar/tgz v1).",
-      "docs_url": "/agent/latest/packages/ext-archive-c/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-archive-c",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-archive-c/0.1.2/index.json",
-      "description": "Archive parsing/extraction helpers + pinned archive policies (tar/tgz v1).",
-      "docs_url": "/agent/latest/packages/ext-archive-c/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-archive-c",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-archive-c/0.1.3/index.json",
-      "description": "Archive parsing/extraction helpers + pinned archive policies (tar/tgz v1).",
-      "docs_url": "/agent/latest/packages/ext-archive-c/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-archive-c",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-archive-c/0.1.4/index.json",
-      "description": "Archive parsing/extraction helpers + pinned archive policies (tar/tgz v1).",
-      "docs_url": "/agent/latest/packages/ext-archive-c/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-archive-c",
-      "version": "0.1.5",
-      "url": "/agent/latest/packages/ext-archive-c/0.1.5/index.json",
-      "description": "Safe archive parsing/extraction helpers + pinned archive policies (tar/tgz/zip v1).",
-      "docs_url": "/agent/latest/packages/ext-archive-c/0.1.5/index.json#docs"
-    },
-    {
-      "name": "ext-archive-c",
-      "version": "0.1.6",
-      "url": "/agent/latest/packages/ext-archive-c/0.1.6/index.json",
-      "description": "Safe archive parsing/extraction helpers + pinned archive policies (tar/tgz/zip v1).",
-      "docs_url": "/agent/latest/packages/ext-archive-c/0.1.6/index.json#docs"
-    },
-    {
-      "name": "ext-auth-jwt",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-auth-jwt/0.1.0/index.json",
-      "description": "Ed25519 + JWT (profiles pinned under arch/crypto). Deterministic token generation via canonical JSON payloads.",
-      "docs_url": "/agent/latest/packages/ext-auth-jwt/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-auth-jwt",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-auth-jwt/0.1.1/index.json",
-      "description": "Ed25519 + JWT (profiles pinned under arch/crypto). Deterministic token generation via canonical JSON payloads.",
-      "docs_url": "/agent/latest/packages/ext-auth-jwt/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-auth-jwt",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-auth-jwt/0.1.2/index.json",
-      "description": "JWT helpers pinned under arch/crypto plus JOSE JWS compact verification (RS256/ES256/EdDSA).",
-      "docs_url": "/agent/latest/packages/ext-auth-jwt/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-auth-jwt",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-auth-jwt/0.1.3/index.json",
-      "description": "JWT helpers pinned under arch/crypto plus JOSE JWS compact verification (RS256/ES256/EdDSA).",
-      "docs_url": "/agent/latest/packages/ext-auth-jwt/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-auth-jwt",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-auth-jwt/0.1.4/index.json",
-      "description": "JWT helpers pinned under arch/crypto plus JOSE JWS compact sign/verify and JWK thumbprints (RS256/ES256/Ed25519/EdDSA).",
-      "docs_url": "/agent/latest/packages/ext-auth-jwt/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-auth-jwt",
-      "version": "0.1.5",
-      "url": "/agent/latest/packages/ext-auth-jwt/0.1.5/index.json",
-      "description": "JWT helpers pinned under arch/crypto plus JOSE JWS compact sign/verify and JWK thumbprints (RS256/ES256/Ed25519/EdDSA).",
-      "docs_url": "/agent/latest/packages/ext-auth-jwt/0.1.5/index.json#docs"
-    },
-    {
-      "name": "ext-auth-jwt",
-      "version": "0.1.6",
-      "url": "/agent/latest/packages/ext-auth-jwt/0.1.6/index.json",
-      "description": "JWT helpers pinned under arch/crypto plus JOSE JWS compact sign/verify and JWK thumbprints (RS256/ES256/Ed25519/EdDSA).",
-      "docs_url": "/agent/latest/packages/ext-auth-jwt/0.1.6/index.json#docs"
-    },
-    {
-      "name": "ext-auth-jwt",
-      "version": "0.1.7",
-      "url": "/agent/latest/packages/ext-auth-jwt/0.1.7/index.json",
-      "description": "JWT helpers pinned under arch/crypto plus JOSE JWS compact sign/verify and JWK thumbprints (RS256/ES256/Ed25519/EdDSA).",
-      "docs_url": "/agent/latest/packages/ext-auth-jwt/0.1.7/index.json#docs"
-    },
-    {
-      "name": "ext-base64-rs",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-base64-rs/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-base64-rs/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-base64-rs",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-base64-rs/0.1.1/index.json",
-      "description": "Base64 encoding and decoding.",
-      "docs_url": "/agent/latest/packages/ext-base64-rs/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-base64-rs",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-base64-rs/0.1.2/index.json",
-      "description": "Base64 encoding and decoding.",
-      "docs_url": "/agent/latest/packages/ext-base64-rs/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-base64-rs",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-base64-rs/0.1.3/index.json",
-      "description": "Base64 encoding and decoding.",
-      "docs_url": "/agent/latest/packages/ext-base64-rs/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-base64-rs",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-base64-rs/0.1.4/index.json",
-      "description": "Base64 encoding and decoding.",
-      "docs_url": "/agent/latest/packages/ext-base64-rs/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-bigint-rs",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-bigint-rs/0.1.0/index.json",
-      "description": "Big integer utilities (codec_v1, parse, format, basic ops).",
-      "docs_url": "/agent/latest/packages/ext-bigint-rs/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-bigint-rs",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-bigint-rs/0.1.1/index.json",
-      "description": "Big integer utilities (codec_v1, parse, format, basic ops).",
-      "docs_url": "/agent/latest/packages/ext-bigint-rs/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-bigint-rs",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-bigint-rs/0.1.2/index.json",
-      "description": "Big integer utilities (codec_v1, parse, format, basic ops).",
-      "docs_url": "/agent/latest/packages/ext-bigint-rs/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-byteorder-rs",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-byteorder-rs/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-byteorder-rs/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-byteorder-rs",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-byteorder-rs/0.1.1/index.json",
-      "description": "Endian-aware integer encoding and decoding.",
-      "docs_url": "/agent/latest/packages/ext-byteorder-rs/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-byteorder-rs",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-byteorder-rs/0.1.2/index.json",
-      "description": "Endian-aware integer encoding and decoding.",
-      "docs_url": "/agent/latest/packages/ext-byteorder-rs/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-byteorder-rs",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-byteorder-rs/0.1.3/index.json",
-      "description": "Endian-aware integer encoding and decoding.",
-      "docs_url": "/agent/latest/packages/ext-byteorder-rs/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-byteorder-rs",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-byteorder-rs/0.1.4/index.json",
-      "description": "Endian-aware integer encoding and decoding.",
-      "docs_url": "/agent/latest/packages/ext-byteorder-rs/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-cbor-rs",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-cbor-rs/0.1.0/index.json",
-      "description": "CBOR encode/decode with ext.data_model integration.",
-      "docs_url": "/agent/latest/packages/ext-cbor-rs/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-cbor-rs",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-cbor-rs/0.1.1/index.json",
-      "description": "CBOR encode/decode with ext.data_model integration.",
-      "docs_url": "/agent/latest/packages/ext-cbor-rs/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-cbor-rs",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-cbor-rs/0.1.2/index.json",
-      "description": "CBOR encode/decode with ext.data_model integration.",
-      "docs_url": "/agent/latest/packages/ext-cbor-rs/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-cbor-rs",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-cbor-rs/0.1.3/index.json",
-      "description": "CBOR encode/decode with ext.data_model integration.",
-      "docs_url": "/agent/latest/packages/ext-cbor-rs/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-cbor-rs",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-cbor-rs/0.1.4/index.json",
-      "description": "CBOR encode/decode with ext.data_model integration.",
-      "docs_url": "/agent/latest/packages/ext-cbor-rs/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-cbor-rs",
-      "version": "0.1.5",
-      "url": "/agent/latest/packages/ext-cbor-rs/0.1.5/index.json",
-      "description": "CBOR encode/decode with ext.data_model integration.",
-      "docs_url": "/agent/latest/packages/ext-cbor-rs/0.1.5/index.json#docs"
-    },
-    {
-      "name": "ext-cbor-rs",
-      "version": "0.1.6",
-      "url": "/agent/latest/packages/ext-cbor-rs/0.1.6/index.json",
-      "description": "CBOR encode/decode with ext.data_model integration.",
-      "docs_url": "/agent/latest/packages/ext-cbor-rs/0.1.6/index.json#docs"
-    },
-    {
-      "name": "ext-cbor-rs",
-      "version": "0.1.7",
-      "url": "/agent/latest/packages/ext-cbor-rs/0.1.7/index.json",
-      "description": "CBOR encode/decode with ext.data_model integration.",
-      "docs_url": "/agent/latest/packages/ext-cbor-rs/0.1.7/index.json#docs"
-    },
-    {
-      "name": "ext-cbor-rs",
-      "version": "0.1.8",
-      "url": "/agent/latest/packages/ext-cbor-rs/0.1.8/index.json",
-      "description": "CBOR encode/decode with ext.data_model integration.",
-      "docs_url": "/agent/latest/packages/ext-cbor-rs/0.1.8/index.json#docs"
-    },
-    {
-      "name": "ext-cbor-rs",
-      "version": "0.1.9",
-      "url": "/agent/latest/packages/ext-cbor-rs/0.1.9/index.json",
-      "description": "CBOR encode/decode with ext.data_model integration.",
-      "docs_url": "/agent/latest/packages/ext-cbor-rs/0.1.9/index.json#docs"
-    },
-    {
-      "name": "ext-checksum-rs",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-checksum-rs/0.1.0/index.json",
-      "description": "Fast non-cryptographic checksums (CRC32C, xxhash64).",
-      "docs_url": "/agent/latest/packages/ext-checksum-rs/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-checksum-rs",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-checksum-rs/0.1.1/index.json",
-      "description": "Fast non-cryptographic checksums (CRC32C, xxhash64).",
-      "docs_url": "/agent/latest/packages/ext-checksum-rs/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-checksum-rs",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-checksum-rs/0.1.2/index.json",
-      "description": "Fast non-cryptographic checksums (CRC32C, xxhash64).",
-      "docs_url": "/agent/latest/packages/ext-checksum-rs/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-cli",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-cli/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-cli/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-cli",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-cli/0.1.1/index.json",
-      "description": "Command-line argument parsing, help, and shell completion.",
-      "docs_url": "/agent/latest/packages/ext-cli/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-cli",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-cli/0.1.2/index.json",
-      "description": "Command-line argument parsing, help, and shell completion.",
-      "docs_url": "/agent/latest/packages/ext-cli/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-cli",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-cli/0.1.3/index.json",
-      "description": "Command-line argument parsing, help, and shell completion.",
-      "docs_url": "/agent/latest/packages/ext-cli/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-cli",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-cli/0.1.4/index.json",
-      "description": "Command-line argument parsing, help, and shell completion.",
-      "docs_url": "/agent/latest/packages/ext-cli/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-cli",
-      "version": "0.1.5",
-      "url": "/agent/latest/packages/ext-cli/0.1.5/index.json",
-      "description": "Command-line argument parsing, help, and shell completion.",
-      "docs_url": "/agent/latest/packages/ext-cli/0.1.5/index.json#docs"
-    },
-    {
-      "name": "ext-cli",
-      "version": "0.1.6",
-      "url": "/agent/latest/packages/ext-cli/0.1.6/index.json",
-      "description": "Command-line argument parsing, help, and shell completion.",
-      "docs_url": "/agent/latest/packages/ext-cli/0.1.6/index.json#docs"
-    },
-    {
-      "name": "ext-cli",
-      "version": "0.1.7",
-      "url": "/agent/latest/packages/ext-cli/0.1.7/index.json",
-      "description": "Command-line argument parsing, help, and shell completion.",
-      "docs_url": "/agent/latest/packages/ext-cli/0.1.7/index.json#docs"
-    },
-    {
-      "name": "ext-cli",
-      "version": "0.1.8",
-      "url": "/agent/latest/packages/ext-cli/0.1.8/index.json",
-      "description": "Command-line argument parsing, help, and shell completion.",
-      "docs_url": "/agent/latest/packages/ext-cli/0.1.8/index.json#docs"
-    },
-    {
-      "name": "ext-cli",
-      "version": "0.1.9",
-      "url": "/agent/latest/packages/ext-cli/0.1.9/index.json",
-      "description": "Command-line argument parsing, help, and shell completion.",
-      "docs_url": "/agent/latest/packages/ext-cli/0.1.9/index.json#docs"
-    },
-    {
-      "name": "ext-cli",
-      "version": "0.1.10",
-      "url": "/agent/latest/packages/ext-cli/0.1.10/index.json",
-      "description": "Command-line argument parsing, help, and shell completion.",
-      "docs_url": "/agent/latest/packages/ext-cli/0.1.10/index.json#docs"
-    },
-    {
-      "name": "ext-cli",
-      "version": "0.1.11",
-      "url": "/agent/latest/packages/ext-cli/0.1.11/index.json",
-      "description": "Command-line argument parsing, help, and shell completion.",
-      "docs_url": "/agent/latest/packages/ext-cli/0.1.11/index.json#docs"
-    },
-    {
-      "name": "ext-cli",
-      "version": "0.1.12",
-      "url": "/agent/latest/packages/ext-cli/0.1.12/index.json",
-      "description": "Command-line argument parsing, help, and shell completion.",
-      "docs_url": "/agent/latest/packages/ext-cli/0.1.12/index.json#docs"
-    },
-    {
-      "name": "ext-cli",
-      "version": "0.1.13",
-      "url": "/agent/latest/packages/ext-cli/0.1.13/index.json",
-      "description": "Command-line argument parsing, help, and shell completion.",
-      "docs_url": "/agent/latest/packages/ext-cli/0.1.13/index.json#docs"
-    },
-    {
-      "name": "ext-cli",
-      "version": "0.1.14",
-      "url": "/agent/latest/packages/ext-cli/0.1.14/index.json",
-      "description": "Command-line argument parsing, help, and shell completion.",
-      "docs_url": "/agent/latest/packages/ext-cli/0.1.14/index.json#docs"
-    },
-    {
-      "name": "ext-cli",
-      "version": "0.1.15",
-      "url": "/agent/latest/packages/ext-cli/0.1.15/index.json",
-      "description": "Command-line argument parsing, help, and shell completion.",
-      "docs_url": "/agent/latest/packages/ext-cli/0.1.15/index.json#docs"
-    },
-    {
-      "name": "ext-cli",
-      "version": "0.1.17",
-      "url": "/agent/latest/packages/ext-cli/0.1.17/index.json",
-      "description": "Command-line argument parsing, help, and shell completion.",
-      "docs_url": "/agent/latest/packages/ext-cli/0.1.17/index.json#docs"
-    },
-    {
-      "name": "ext-cli-ux",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-cli-ux/0.1.0/index.json",
-      "description": "CLI UX primitives: deterministic progress, tables, and JSONL output (pinned via arch/cli).",
-      "docs_url": "/agent/latest/packages/ext-cli-ux/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-cli-ux",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-cli-ux/0.1.1/index.json",
-      "description": "CLI UX primitives: deterministic progress, tables, and JSONL output (pinned via arch/cli).",
-      "docs_url": "/agent/latest/packages/ext-cli-ux/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-cli-ux",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-cli-ux/0.1.2/index.json",
-      "description": "CLI UX primitives: deterministic progress, tables, and JSONL output (pinned via arch/cli).",
-      "docs_url": "/agent/latest/packages/ext-cli-ux/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-cli-ux",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-cli-ux/0.1.3/index.json",
-      "description": "CLI UX primitives: deterministic progress, tables, and JSONL output (pinned via arch/cli).",
-      "docs_url": "/agent/latest/packages/ext-cli-ux/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-cli-ux",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-cli-ux/0.1.4/index.json",
-      "description": "CLI UX primitives: deterministic progress, tables, JSONL, and small rich-layout helpers (pinned via arch/cli).",
-      "docs_url": "/agent/latest/packages/ext-cli-ux/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-cli-ux",
-      "version": "0.1.5",
-      "url": "/agent/latest/packages/ext-cli-ux/0.1.5/index.json",
-      "description": "CLI UX primitives: deterministic progress, tables, JSONL, and small rich-layout helpers (pinned via arch/cli).",
-      "docs_url": "/agent/latest/packages/ext-cli-ux/0.1.5/index.json#docs"
-    },
-    {
-      "name": "ext-cli-ux",
-      "version": "0.1.6",
-      "url": "/agent/latest/packages/ext-cli-ux/0.1.6/index.json",
-      "description": "CLI UX primitives: deterministic progress, tables, JSONL, and small rich-layout helpers (pinned via arch/cli).",
-      "docs_url": "/agent/latest/packages/ext-cli-ux/0.1.6/index.json#docs"
-    },
-    {
-      "name": "ext-cli-ux",
-      "version": "0.1.7",
-      "url": "/agent/latest/packages/ext-cli-ux/0.1.7/index.json",
-      "description": "CLI UX primitives: deterministic progress, tables, JSONL, and small rich-layout helpers (pinned via arch/cli).",
-      "docs_url": "/agent/latest/packages/ext-cli-ux/0.1.7/index.json#docs"
-    },
-    {
-      "name": "ext-compress-rs",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-compress-rs/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-compress-rs/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-compress-rs",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-compress-rs/0.1.1/index.json",
-      "description": "Compression primitives and ZIP archives.",
-      "docs_url": "/agent/latest/packages/ext-compress-rs/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-compress-rs",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-compress-rs/0.1.2/index.json",
-      "description": "Compression primitives and ZIP archives.",
-      "docs_url": "/agent/latest/packages/ext-compress-rs/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-compress-rs",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-compress-rs/0.1.3/index.json",
-      "description": "Compression primitives and ZIP archives.",
-      "docs_url": "/agent/latest/packages/ext-compress-rs/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-compress-rs",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-compress-rs/0.1.4/index.json",
-      "description": "Compression primitives and ZIP archives.",
-      "docs_url": "/agent/latest/packages/ext-compress-rs/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-compress-rs",
-      "version": "0.1.5",
-      "url": "/agent/latest/packages/ext-compress-rs/0.1.5/index.json",
-      "description": "Compression primitives and ZIP archives.",
-      "docs_url": "/agent/latest/packages/ext-compress-rs/0.1.5/index.json#docs"
-    },
-    {
-      "name": "ext-crypto-rs",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-crypto-rs/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-crypto-rs/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-crypto-rs",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-crypto-rs/0.1.1/index.json",
-      "description": "SHA-256/SHA-512, HMAC-SHA256, and HKDF-SHA256 utilities.",
-      "docs_url": "/agent/latest/packages/ext-crypto-rs/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-crypto-rs",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-crypto-rs/0.1.2/index.json",
-      "description": "SHA-256/SHA-512, HMAC-SHA256, and HKDF-SHA256 utilities.",
-      "docs_url": "/agent/latest/packages/ext-crypto-rs/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-crypto-rs",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-crypto-rs/0.1.3/index.json",
-      "description": "SHA-256/SHA-512, HMAC-SHA256, and HKDF-SHA256 utilities.",
-      "docs_url": "/agent/latest/packages/ext-crypto-rs/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-crypto-rs",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-crypto-rs/0.1.4/index.json",
-      "description": "SHA-256/SHA-512, HMAC-SHA256, and HKDF-SHA256 utilities.",
-      "docs_url": "/agent/latest/packages/ext-crypto-rs/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-crypto-rs",
-      "version": "0.1.5",
-      "url": "/agent/latest/packages/ext-crypto-rs/0.1.5/index.json",
-      "description": "SHA-256/SHA-512, HMAC-SHA256, and HKDF-SHA256 utilities.",
-      "docs_url": "/agent/latest/packages/ext-crypto-rs/0.1.5/index.json#docs"
-    },
-    {
-      "name": "ext-csv-rs",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-csv-rs/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-csv-rs/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-csv-rs",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-csv-rs/0.1.1/index.json",
-      "description": "CSV parsing and writing.",
-      "docs_url": "/agent/latest/packages/ext-csv-rs/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-csv-rs",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-csv-rs/0.1.2/index.json",
-      "description": "CSV parsing and writing.",
-      "docs_url": "/agent/latest/packages/ext-csv-rs/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-csv-rs",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-csv-rs/0.1.3/index.json",
-      "description": "CSV parsing and writing.",
-      "docs_url": "/agent/latest/packages/ext-csv-rs/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-csv-rs",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-csv-rs/0.1.4/index.json",
-      "description": "CSV parsing and writing.",
-      "docs_url": "/agent/latest/packages/ext-csv-rs/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-csv-rs",
-      "version": "0.1.5",
-      "url": "/agent/latest/packages/ext-csv-rs/0.1.5/index.json",
-      "description": "CSV parsing and writing.",
-      "docs_url": "/agent/latest/packages/ext-csv-rs/0.1.5/index.json#docs"
-    },
-    {
-      "name": "ext-curl-c",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-curl-c/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-curl-c/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-curl-c",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-curl-c/0.1.1/index.json",
-      "description": "HTTP(S) client bindings via libcurl (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-curl-c/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-curl-c",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-curl-c/0.1.2/index.json",
-      "description": "HTTP(S) client bindings via libcurl (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-curl-c/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-curl-c",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-curl-c/0.1.3/index.json",
-      "description": "HTTP(S) client bindings via libcurl (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-curl-c/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-curl-c",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-curl-c/0.1.4/index.json",
-      "description": "HTTP(S) client bindings via libcurl (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-curl-c/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-curl-c",
-      "version": "0.1.5",
-      "url": "/agent/latest/packages/ext-curl-c/0.1.5/index.json",
-      "description": "HTTP(S) client bindings via libcurl (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-curl-c/0.1.5/index.json#docs"
-    },
-    {
-      "name": "ext-curl-c",
-      "version": "0.1.6",
-      "url": "/agent/latest/packages/ext-curl-c/0.1.6/index.json",
-      "description": "HTTP(S) client bindings via libcurl (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-curl-c/0.1.6/index.json#docs"
-    },
-    {
-      "name": "ext-data-model",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-data-model/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-data-model/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-data-model",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-data-model/0.1.1/index.json",
-      "description": "Typed data model with JSON/TOML/YAML codecs.",
-      "docs_url": "/agent/latest/packages/ext-data-model/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-data-model",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-data-model/0.1.2/index.json",
-      "description": "Typed data model with JSON/TOML/YAML codecs.",
-      "docs_url": "/agent/latest/packages/ext-data-model/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-data-model",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-data-model/0.1.3/index.json",
-      "description": "Typed data model with JSON/TOML/YAML codecs.",
-      "docs_url": "/agent/latest/packages/ext-data-model/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-data-model",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-data-model/0.1.4/index.json",
-      "description": "Typed data model with JSON/TOML/YAML codecs.",
-      "docs_url": "/agent/latest/packages/ext-data-model/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-data-model",
-      "version": "0.1.5",
-      "url": "/agent/latest/packages/ext-data-model/0.1.5/index.json",
-      "description": "Typed data model with JSON/TOML/YAML codecs.",
-      "docs_url": "/agent/latest/packages/ext-data-model/0.1.5/index.json#docs"
-    },
-    {
-      "name": "ext-data-model",
-      "version": "0.1.6",
-      "url": "/agent/latest/packages/ext-data-model/0.1.6/index.json",
-      "description": "Typed data model with JSON/TOML/YAML codecs.",
-      "docs_url": "/agent/latest/packages/ext-data-model/0.1.6/index.json#docs"
-    },
-    {
-      "name": "ext-data-model",
-      "version": "0.1.7",
-      "url": "/agent/latest/packages/ext-data-model/0.1.7/index.json",
-      "description": "Typed data model with JSON/TOML/YAML codecs.",
-      "docs_url": "/agent/latest/packages/ext-data-model/0.1.7/index.json#docs"
-    },
-    {
-      "name": "ext-data-model",
-      "version": "0.1.8",
-      "url": "/agent/latest/packages/ext-data-model/0.1.8/index.json",
-      "description": "Typed data model with JSON/TOML/YAML/XML/INI/CSV codecs.",
-      "docs_url": "/agent/latest/packages/ext-data-model/0.1.8/index.json#docs"
-    },
-    {
-      "name": "ext-data-model",
-      "version": "0.1.9",
-      "url": "/agent/latest/packages/ext-data-model/0.1.9/index.json",
-      "description": "Typed data model with JSON/TOML/YAML/XML/INI/CSV codecs.",
-      "docs_url": "/agent/latest/packages/ext-data-model/0.1.9/index.json#docs"
-    },
-    {
-      "name": "ext-data-model",
-      "version": "0.1.10",
-      "url": "/agent/latest/packages/ext-data-model/0.1.10/index.json",
-      "description": "Typed data model with JSON/TOML/YAML/XML/INI/CSV codecs.",
-      "docs_url": "/agent/latest/packages/ext-data-model/0.1.10/index.json#docs"
-    },
-    {
-      "name": "ext-data-model",
-      "version": "0.1.11",
-      "url": "/agent/latest/packages/ext-data-model/0.1.11/index.json",
-      "description": "Typed data model with JSON/TOML/YAML/XML/INI/CSV codecs.",
-      "docs_url": "/agent/latest/packages/ext-data-model/0.1.11/index.json#docs"
-    },
-    {
-      "name": "ext-db-core",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-db-core/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-db-core/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-db-core",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-db-core/0.1.1/index.json",
-      "description": "Database interfaces, query specs, and pooling (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-db-core/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-db-core",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-db-core/0.1.2/index.json",
-      "description": "Database interfaces, query specs, and pooling (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-db-core/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-db-core",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-db-core/0.1.3/index.json",
-      "description": "Database interfaces, query specs, and pooling (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-db-core/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-db-core",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-db-core/0.1.4/index.json",
-      "description": "Database interfaces, query specs, and pooling (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-db-core/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-db-core",
-      "version": "0.1.5",
-      "url": "/agent/latest/packages/ext-db-core/0.1.5/index.json",
-      "description": "Database interfaces, query specs, and pooling (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-db-core/0.1.5/index.json#docs"
-    },
-    {
-      "name": "ext-db-core",
-      "version": "0.1.6",
-      "url": "/agent/latest/packages/ext-db-core/0.1.6/index.json",
-      "description": "Database interfaces, query specs, and pooling (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-db-core/0.1.6/index.json#docs"
-    },
-    {
-      "name": "ext-db-core",
-      "version": "0.1.7",
-      "url": "/agent/latest/packages/ext-db-core/0.1.7/index.json",
-      "description": "Database interfaces, query specs, and pooling (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-db-core/0.1.7/index.json#docs"
-    },
-    {
-      "name": "ext-db-core",
-      "version": "0.1.8",
-      "url": "/agent/latest/packages/ext-db-core/0.1.8/index.json",
-      "description": "Database interfaces, query specs, and pooling (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-db-core/0.1.8/index.json#docs"
-    },
-    {
-      "name": "ext-db-core",
-      "version": "0.1.9",
-      "url": "/agent/latest/packages/ext-db-core/0.1.9/index.json",
-      "description": "Database interfaces, query specs, and pooling (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-db-core/0.1.9/index.json#docs"
-    },
-    {
-      "name": "ext-db-core",
-      "version": "0.1.10",
-      "url": "/agent/latest/packages/ext-db-core/0.1.10/index.json",
-      "description": "Database interfaces, query specs, and pooling (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-db-core/0.1.10/index.json#docs"
-    },
-    {
-      "name": "ext-db-core",
-      "version": "0.1.11",
-      "url": "/agent/latest/packages/ext-db-core/0.1.11/index.json",
-      "description": "Database interfaces, query specs, and pooling (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-db-core/0.1.11/index.json#docs"
-    },
-    {
-      "name": "ext-db-core",
-      "version": "0.1.12",
-      "url": "/agent/latest/packages/ext-db-core/0.1.12/index.json",
-      "description": "Database interfaces, query specs, and pooling (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-db-core/0.1.12/index.json#docs"
-    },
-    {
-      "name": "ext-db-migrate",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-db-migrate/0.1.0/index.json",
-      "description": "DB migrations + RR-backed DB fixture adapter (contracts-as-data under arch/db).",
-      "docs_url": "/agent/latest/packages/ext-db-migrate/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-db-migrate",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-db-migrate/0.1.1/index.json",
-      "description": "DB migrations + RR-backed DB fixture adapter (contracts-as-data under arch/db).",
-      "docs_url": "/agent/latest/packages/ext-db-migrate/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-db-migrate",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-db-migrate/0.1.2/index.json",
-      "description": "DB migrations + RR-backed DB fixture adapter (contracts-as-data under arch/db).",
-      "docs_url": "/agent/latest/packages/ext-db-migrate/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-db-migrate",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-db-migrate/0.1.3/index.json",
-      "description": "DB migrations + RR-backed DB fixture adapter (contracts-as-data under arch/db).",
-      "docs_url": "/agent/latest/packages/ext-db-migrate/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-db-migrate",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-db-migrate/0.1.4/index.json",
-      "description": "DB migrations + RR-backed DB fixture adapter (contracts-as-data under arch/db).",
-      "docs_url": "/agent/latest/packages/ext-db-migrate/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-db-migrate",
-      "version": "0.1.5",
-      "url": "/agent/latest/packages/ext-db-migrate/0.1.5/index.json",
-      "description": "DB migrations + RR-backed DB fixture adapter (contracts-as-data under arch/db).",
-      "docs_url": "/agent/latest/packages/ext-db-migrate/0.1.5/index.json#docs"
-    },
-    {
-      "name": "ext-db-mysql",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-db-mysql/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-db-mysql/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-db-mysql",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-db-mysql/0.1.1/index.json",
-      "description": "MySQL driver for std.db (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-db-mysql/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-db-mysql",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-db-mysql/0.1.2/index.json",
-      "description": "MySQL driver for std.db (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-db-mysql/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-db-mysql",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-db-mysql/0.1.3/index.json",
-      "description": "MySQL driver for std.db (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-db-mysql/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-db-mysql",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-db-mysql/0.1.4/index.json",
-      "description": "MySQL driver for std.db (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-db-mysql/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-db-mysql",
-      "version": "0.1.5",
-      "url": "/agent/latest/packages/ext-db-mysql/0.1.5/index.json",
-      "description": "MySQL driver for std.db (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-db-mysql/0.1.5/index.json#docs"
-    },
-    {
-      "name": "ext-db-postgres",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-db-postgres/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-db-postgres/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-db-postgres",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-db-postgres/0.1.1/index.json",
-      "description": "PostgreSQL driver for std.db (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-db-postgres/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-db-postgres",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-db-postgres/0.1.2/index.json",
-      "description": "PostgreSQL driver for std.db (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-db-postgres/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-db-postgres",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-db-postgres/0.1.3/index.json",
-      "description": "PostgreSQL driver for std.db (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-db-postgres/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-db-postgres",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-db-postgres/0.1.4/index.json",
-      "description": "PostgreSQL driver for std.db (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-db-postgres/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-db-postgres",
-      "version": "0.1.5",
-      "url": "/agent/latest/packages/ext-db-postgres/0.1.5/index.json",
-      "description": "PostgreSQL driver for std.db (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-db-postgres/0.1.5/index.json#docs"
-    },
-    {
-      "name": "ext-db-redis",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-db-redis/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-db-redis/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-db-redis",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-db-redis/0.1.1/index.json",
-      "description": "Redis client for std.db (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-db-redis/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-db-redis",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-db-redis/0.1.2/index.json",
-      "description": "Redis client for std.db (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-db-redis/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-db-redis",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-db-redis/0.1.3/index.json",
-      "description": "Redis client for std.db (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-db-redis/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-db-redis",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-db-redis/0.1.4/index.json",
-      "description": "Redis client for std.db (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-db-redis/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-db-sqlite",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-db-sqlite/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-db-sqlite/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-db-sqlite",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-db-sqlite/0.1.1/index.json",
-      "description": "SQLite driver for std.db (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-db-sqlite/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-db-sqlite",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-db-sqlite/0.1.2/index.json",
-      "description": "SQLite driver for std.db (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-db-sqlite/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-db-sqlite",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-db-sqlite/0.1.3/index.json",
-      "description": "SQLite driver for std.db (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-db-sqlite/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-db-sqlite",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-db-sqlite/0.1.4/index.json",
-      "description": "SQLite driver for std.db (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-db-sqlite/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-db-sqlite",
-      "version": "0.1.5",
-      "url": "/agent/latest/packages/ext-db-sqlite/0.1.5/index.json",
-      "description": "SQLite driver for std.db (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-db-sqlite/0.1.5/index.json#docs"
-    },
-    {
-      "name": "ext-db-sqlite",
-      "version": "0.1.6",
-      "url": "/agent/latest/packages/ext-db-sqlite/0.1.6/index.json",
-      "description": "SQLite driver for std.db (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-db-sqlite/0.1.6/index.json#docs"
-    },
-    {
-      "name": "ext-db-sqlite",
-      "version": "0.1.7",
-      "url": "/agent/latest/packages/ext-db-sqlite/0.1.7/index.json",
-      "description": "SQLite driver for std.db (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-db-sqlite/0.1.7/index.json#docs"
-    },
-    {
-      "name": "ext-db-sqlite",
-      "version": "0.1.8",
-      "url": "/agent/latest/packages/ext-db-sqlite/0.1.8/index.json",
-      "description": "SQLite driver for std.db (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-db-sqlite/0.1.8/index.json#docs"
-    },
-    {
-      "name": "ext-db-sqlite",
-      "version": "0.1.9",
-      "url": "/agent/latest/packages/ext-db-sqlite/0.1.9/index.json",
-      "description": "SQLite driver for std.db (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-db-sqlite/0.1.9/index.json#docs"
-    },
-    {
-      "name": "ext-db-sqlite",
-      "version": "0.1.10",
-      "url": "/agent/latest/packages/ext-db-sqlite/0.1.10/index.json",
-      "description": "SQLite driver for std.db (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-db-sqlite/0.1.10/index.json#docs"
-    },
-    {
-      "name": "ext-db-sqlite",
-      "version": "0.1.11",
-      "url": "/agent/latest/packages/ext-db-sqlite/0.1.11/index.json",
-      "description": "SQLite driver for std.db (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-db-sqlite/0.1.11/index.json#docs"
-    },
-    {
-      "name": "ext-db-sqlite",
-      "version": "0.1.12",
-      "url": "/agent/latest/packages/ext-db-sqlite/0.1.12/index.json",
-      "description": "SQLite driver for std.db (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-db-sqlite/0.1.12/index.json#docs"
-    },
-    {
-      "name": "ext-decimal-rs",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-decimal-rs/0.1.0/index.json",
-      "description": "Fixed-point decimal utilities (codec_v1, parse, format, basic ops).",
-      "docs_url": "/agent/latest/packages/ext-decimal-rs/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-decimal-rs",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-decimal-rs/0.1.1/index.json",
-      "description": "Fixed-point decimal utilities (codec_v1, parse, format, basic ops).",
-      "docs_url": "/agent/latest/packages/ext-decimal-rs/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-decimal-rs",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-decimal-rs/0.1.2/index.json",
-      "description": "Fixed-point decimal utilities (codec_v1, parse, format, basic ops).",
-      "docs_url": "/agent/latest/packages/ext-decimal-rs/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-diff-rs",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-diff-rs/0.1.0/index.json",
-      "description": "Deterministic diff + patch helpers (bytes/lines) with a stable patch_v1 format.",
-      "docs_url": "/agent/latest/packages/ext-diff-rs/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-diff-rs",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-diff-rs/0.1.1/index.json",
-      "description": "Deterministic diff + patch helpers (bytes/lines) with a stable patch_v1 format.",
-      "docs_url": "/agent/latest/packages/ext-diff-rs/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-diff-rs",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-diff-rs/0.1.2/index.json",
-      "description": "Deterministic diff + patch helpers (bytes/lines) with a stable patch_v1 format.",
-      "docs_url": "/agent/latest/packages/ext-diff-rs/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-error",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-error/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-error/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-error",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-error/0.1.1/index.json",
-      "description": "Error chaining, context, and formatting helpers.",
-      "docs_url": "/agent/latest/packages/ext-error/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-error",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-error/0.1.2/index.json",
-      "description": "Error chaining, context, and formatting helpers.",
-      "docs_url": "/agent/latest/packages/ext-error/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-error",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-error/0.1.3/index.json",
-      "description": "Error chaining, context, and formatting helpers.",
-      "docs_url": "/agent/latest/packages/ext-error/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-error",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-error/0.1.4/index.json",
-      "description": "Error chaining, context, and formatting helpers.",
-      "docs_url": "/agent/latest/packages/ext-error/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-fs",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-fs/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-fs/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-fs",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-fs/0.1.1/index.json",
-      "description": "OS filesystem API (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-fs/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-fs",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-fs/0.1.2/index.json",
-      "description": "OS filesystem API (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-fs/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-fs",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-fs/0.1.3/index.json",
-      "description": "OS filesystem API (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-fs/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-fs",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-fs/0.1.4/index.json",
-      "description": "OS filesystem API (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-fs/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-fs",
-      "version": "0.1.5",
-      "url": "/agent/latest/packages/ext-fs/0.1.5/index.json",
-      "description": "OS filesystem API (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-fs/0.1.5/index.json#docs"
-    },
-    {
-      "name": "ext-fs",
-      "version": "0.1.6",
-      "url": "/agent/latest/packages/ext-fs/0.1.6/index.json",
-      "description": "OS filesystem API (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-fs/0.1.6/index.json#docs"
-    },
-    {
-      "name": "ext-glob-rs",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-glob-rs/0.1.0/index.json",
-      "description": "Wildcard (glob-like) matching for ASCII paths and tokens.",
-      "docs_url": "/agent/latest/packages/ext-glob-rs/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-glob-rs",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-glob-rs/0.1.1/index.json",
-      "description": "Wildcard (glob-like) matching for ASCII paths and tokens.",
-      "docs_url": "/agent/latest/packages/ext-glob-rs/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-glob-rs",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-glob-rs/0.1.2/index.json",
-      "description": "Wildcard (glob-like) matching for ASCII paths and tokens.",
-      "docs_url": "/agent/latest/packages/ext-glob-rs/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-glob-rs",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-glob-rs/0.1.3/index.json",
-      "description": "Wildcard (glob-like) matching for ASCII paths and tokens.",
-      "docs_url": "/agent/latest/packages/ext-glob-rs/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-hex-rs",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-hex-rs/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-hex-rs/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-hex-rs",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-hex-rs/0.1.1/index.json",
-      "description": "Hex encoding and decoding.",
-      "docs_url": "/agent/latest/packages/ext-hex-rs/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-hex-rs",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-hex-rs/0.1.2/index.json",
-      "description": "Hex encoding and decoding.",
-      "docs_url": "/agent/latest/packages/ext-hex-rs/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-hex-rs",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-hex-rs/0.1.3/index.json",
-      "description": "Hex encoding and decoding.",
-      "docs_url": "/agent/latest/packages/ext-hex-rs/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-hex-rs",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-hex-rs/0.1.4/index.json",
-      "description": "Hex encoding and decoding.",
-      "docs_url": "/agent/latest/packages/ext-hex-rs/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-html-lite-rs",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-html-lite-rs/0.1.0/index.json",
-      "description": "HTML link and visible-text extraction helpers (lightweight, deterministic).",
-      "docs_url": "/agent/latest/packages/ext-html-lite-rs/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-html-lite-rs",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-html-lite-rs/0.1.1/index.json",
-      "description": "HTML link and visible-text extraction helpers (lightweight, deterministic).",
-      "docs_url": "/agent/latest/packages/ext-html-lite-rs/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-html-lite-rs",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-html-lite-rs/0.1.2/index.json",
-      "description": "HTML link and visible-text extraction helpers (lightweight, deterministic).",
-      "docs_url": "/agent/latest/packages/ext-html-lite-rs/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-ini-rs",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-ini-rs/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-ini-rs/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-ini-rs",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-ini-rs/0.1.1/index.json",
-      "description": "INI parsing and writing.",
-      "docs_url": "/agent/latest/packages/ext-ini-rs/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-ini-rs",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-ini-rs/0.1.2/index.json",
-      "description": "INI parsing and writing.",
-      "docs_url": "/agent/latest/packages/ext-ini-rs/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-ini-rs",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-ini-rs/0.1.3/index.json",
-      "description": "INI parsing and writing.",
-      "docs_url": "/agent/latest/packages/ext-ini-rs/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-ini-rs",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-ini-rs/0.1.4/index.json",
-      "description": "INI parsing and writing.",
-      "docs_url": "/agent/latest/packages/ext-ini-rs/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-json-rs",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-json-rs/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-json-rs/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-json-rs",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-json-rs/0.1.1/index.json",
-      "description": "JSON canonicalization, JSON Pointer, and ext.data_model parsing.",
-      "docs_url": "/agent/latest/packages/ext-json-rs/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-json-rs",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-json-rs/0.1.2/index.json",
-      "description": "JSON canonicalization, JSON Pointer, and ext.data_model parsing.",
-      "docs_url": "/agent/latest/packages/ext-json-rs/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-json-rs",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-json-rs/0.1.3/index.json",
-      "description": "JSON canonicalization, JSON Pointer, and ext.data_model parsing.",
-      "docs_url": "/agent/latest/packages/ext-json-rs/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-json-rs",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-json-rs/0.1.4/index.json",
-      "description": "JSON canonicalization, JSON Pointer, and ext.data_model parsing.",
-      "docs_url": "/agent/latest/packages/ext-json-rs/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-json-rs",
-      "version": "0.1.5",
-      "url": "/agent/latest/packages/ext-json-rs/0.1.5/index.json",
-      "description": "JSON canonicalization, JSON Pointer, and ext.data_model parsing.",
-      "docs_url": "/agent/latest/packages/ext-json-rs/0.1.5/index.json#docs"
-    },
-    {
-      "name": "ext-json-rs",
-      "version": "0.1.6",
-      "url": "/agent/latest/packages/ext-json-rs/0.1.6/index.json",
-      "description": "JSON canonicalization, JSON Pointer, and ext.data_model parsing.",
-      "docs_url": "/agent/latest/packages/ext-json-rs/0.1.6/index.json#docs"
-    },
-    {
-      "name": "ext-json-rs",
-      "version": "0.1.7",
-      "url": "/agent/latest/packages/ext-json-rs/0.1.7/index.json",
-      "description": "JSON canonicalization, JSON Pointer, and ext.data_model parsing.",
-      "docs_url": "/agent/latest/packages/ext-json-rs/0.1.7/index.json#docs"
-    },
-    {
-      "name": "ext-jsonschema-rs",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-jsonschema-rs/0.1.0/index.json",
-      "description": "JSON Schema validation (Draft 2020-12 default; supports $schema overrides).",
-      "docs_url": "/agent/latest/packages/ext-jsonschema-rs/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-log",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-log/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-log/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-log",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-log/0.1.1/index.json",
-      "description": "Log record encoding and formatting helpers.",
-      "docs_url": "/agent/latest/packages/ext-log/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-log",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-log/0.1.2/index.json",
-      "description": "Log record encoding and formatting helpers.",
-      "docs_url": "/agent/latest/packages/ext-log/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-log",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-log/0.1.3/index.json",
-      "description": "Log record encoding and formatting helpers.",
-      "docs_url": "/agent/latest/packages/ext-log/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-log",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-log/0.1.4/index.json",
-      "description": "Log record encoding and formatting helpers.",
-      "docs_url": "/agent/latest/packages/ext-log/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-math",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-math/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-math/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-math",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-math/0.1.1/index.json",
-      "description": "Math utilities (integers and f64).",
-      "docs_url": "/agent/latest/packages/ext-math/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-math",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-math/0.1.2/index.json",
-      "description": "Math utilities (integers and f64).",
-      "docs_url": "/agent/latest/packages/ext-math/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-math",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-math/0.1.3/index.json",
-      "description": "Math utilities (integers and f64).",
-      "docs_url": "/agent/latest/packages/ext-math/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-math",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-math/0.1.4/index.json",
-      "description": "Math utilities (integers and f64).",
-      "docs_url": "/agent/latest/packages/ext-math/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-memchr-rs",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-memchr-rs/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-memchr-rs/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-memchr-rs",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-memchr-rs/0.1.1/index.json",
-      "description": "Byte search primitives (memchr/memrchr).",
-      "docs_url": "/agent/latest/packages/ext-memchr-rs/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-memchr-rs",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-memchr-rs/0.1.2/index.json",
-      "description": "Byte search primitives (memchr/memrchr).",
-      "docs_url": "/agent/latest/packages/ext-memchr-rs/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-memchr-rs",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-memchr-rs/0.1.3/index.json",
-      "description": "Byte search primitives (memchr/memrchr).",
-      "docs_url": "/agent/latest/packages/ext-memchr-rs/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-memchr-rs",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-memchr-rs/0.1.4/index.json",
-      "description": "Byte search primitives (memchr/memrchr).",
-      "docs_url": "/agent/latest/packages/ext-memchr-rs/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-msg-amqp-c",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-msg-amqp-c/0.1.0/index.json",
-      "description": "AMQP 0-9-1 driver using rabbitmq-c; integrates with std.msg envelope and RR replay (pinned via arch/msg/amqp).",
-      "docs_url": "/agent/latest/packages/ext-msg-amqp-c/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-msg-amqp-c",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-msg-amqp-c/0.1.1/index.json",
-      "description": "AMQP 0-9-1 driver using rabbitmq-c; integrates with std.msg envelope and RR replay (pinned via arch/msg/amqp).",
-      "docs_url": "/agent/latest/packages/ext-msg-amqp-c/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-msg-amqp-c",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-msg-amqp-c/0.1.2/index.json",
-      "description": "AMQP 0-9-1 driver using rabbitmq-c; integrates with std.msg envelope and RR replay (pinned via arch/msg/amqp).",
-      "docs_url": "/agent/latest/packages/ext-msg-amqp-c/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-msg-amqp-c",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-msg-amqp-c/0.1.3/index.json",
-      "description": "AMQP 0-9-1 driver using rabbitmq-c; integrates with std.msg envelope and RR replay (pinned via arch/msg/amqp).",
-      "docs_url": "/agent/latest/packages/ext-msg-amqp-c/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-msg-amqp-c",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-msg-amqp-c/0.1.4/index.json",
-      "description": "AMQP 0-9-1 driver using rabbitmq-c; integrates with std.msg envelope and RR replay (pinned via arch/msg/amqp).",
-      "docs_url": "/agent/latest/packages/ext-msg-amqp-c/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-msg-core",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-msg-core/0.1.0/index.json",
-      "description": "Messaging core: canonical msg.envelope_v1 + msg.rr.entry_v1 + driver interface (pinned via arch/msg).",
-      "docs_url": "/agent/latest/packages/ext-msg-core/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-msg-core",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-msg-core/0.1.1/index.json",
-      "description": "Messaging core: canonical msg.envelope_v1 + msg.rr.entry_v1 + driver interface (pinned via arch/msg).",
-      "docs_url": "/agent/latest/packages/ext-msg-core/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-msg-core",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-msg-core/0.1.2/index.json",
-      "description": "Messaging core: canonical msg.envelope_v1 + msg.rr.entry_v1 + driver interface (pinned via arch/msg).",
-      "docs_url": "/agent/latest/packages/ext-msg-core/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-msg-core",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-msg-core/0.1.3/index.json",
-      "description": "Messaging core: canonical msg.envelope_v1 + msg.rr.entry_v1 + driver interface (pinned via arch/msg).",
-      "docs_url": "/agent/latest/packages/ext-msg-core/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-msg-core",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-msg-core/0.1.4/index.json",
-      "description": "Messaging core: canonical msg.envelope_v1 + msg.rr.entry_v1 + driver interface (pinned via arch/msg).",
-      "docs_url": "/agent/latest/packages/ext-msg-core/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-msg-kafka-c",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-msg-kafka-c/0.1.0/index.json",
-      "description": "Kafka driver using librdkafka; integrates with std.msg envelope and RR replay (pinned via arch/msg/kafka).",
-      "docs_url": "/agent/latest/packages/ext-msg-kafka-c/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-msg-kafka-c",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-msg-kafka-c/0.1.1/index.json",
-      "description": "Kafka driver using librdkafka; integrates with std.msg envelope and RR replay (pinned via arch/msg/kafka).",
-      "docs_url": "/agent/latest/packages/ext-msg-kafka-c/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-msg-kafka-c",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-msg-kafka-c/0.1.2/index.json",
-      "description": "Kafka driver using librdkafka; integrates with std.msg envelope and RR replay (pinned via arch/msg/kafka).",
-      "docs_url": "/agent/latest/packages/ext-msg-kafka-c/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-msg-kafka-c",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-msg-kafka-c/0.1.3/index.json",
-      "description": "Kafka driver using librdkafka; integrates with std.msg envelope and RR replay (pinned via arch/msg/kafka).",
-      "docs_url": "/agent/latest/packages/ext-msg-kafka-c/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-msg-kafka-c",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-msg-kafka-c/0.1.4/index.json",
-      "description": "Kafka driver using librdkafka; integrates with std.msg envelope and RR replay (pinned via arch/msg/kafka).",
-      "docs_url": "/agent/latest/packages/ext-msg-kafka-c/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-msgpack-rs",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-msgpack-rs/0.1.0/index.json",
-      "description": "MessagePack encode/decode with ext.data_model integration.",
-      "docs_url": "/agent/latest/packages/ext-msgpack-rs/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-msgpack-rs",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-msgpack-rs/0.1.1/index.json",
-      "description": "MessagePack encode/decode with ext.data_model integration.",
-      "docs_url": "/agent/latest/packages/ext-msgpack-rs/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-msgpack-rs",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-msgpack-rs/0.1.2/index.json",
-      "description": "MessagePack encode/decode with ext.data_model integration.",
-      "docs_url": "/agent/latest/packages/ext-msgpack-rs/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-msgpack-rs",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-msgpack-rs/0.1.3/index.json",
-      "description": "MessagePack encode/decode with ext.data_model integration.",
-      "docs_url": "/agent/latest/packages/ext-msgpack-rs/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-msgpack-rs",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-msgpack-rs/0.1.4/index.json",
-      "description": "MessagePack encode/decode with ext.data_model integration.",
-      "docs_url": "/agent/latest/packages/ext-msgpack-rs/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-msgpack-rs",
-      "version": "0.1.5",
-      "url": "/agent/latest/packages/ext-msgpack-rs/0.1.5/index.json",
-      "description": "MessagePack encode/decode with ext.data_model integration.",
-      "docs_url": "/agent/latest/packages/ext-msgpack-rs/0.1.5/index.json#docs"
-    },
-    {
-      "name": "ext-msgpack-rs",
-      "version": "0.1.6",
-      "url": "/agent/latest/packages/ext-msgpack-rs/0.1.6/index.json",
-      "description": "MessagePack encode/decode with ext.data_model integration.",
-      "docs_url": "/agent/latest/packages/ext-msgpack-rs/0.1.6/index.json#docs"
-    },
-    {
-      "name": "ext-msgpack-rs",
-      "version": "0.1.7",
-      "url": "/agent/latest/packages/ext-msgpack-rs/0.1.7/index.json",
-      "description": "MessagePack encode/decode with ext.data_model integration.",
-      "docs_url": "/agent/latest/packages/ext-msgpack-rs/0.1.7/index.json#docs"
-    },
-    {
-      "name": "ext-msgpack-rs",
-      "version": "0.1.8",
-      "url": "/agent/latest/packages/ext-msgpack-rs/0.1.8/index.json",
-      "description": "MessagePack encode/decode with ext.data_model integration.",
-      "docs_url": "/agent/latest/packages/ext-msgpack-rs/0.1.8/index.json#docs"
-    },
-    {
-      "name": "ext-msgpack-rs",
-      "version": "0.1.9",
-      "url": "/agent/latest/packages/ext-msgpack-rs/0.1.9/index.json",
-      "description": "MessagePack encode/decode with ext.data_model integration.",
-      "docs_url": "/agent/latest/packages/ext-msgpack-rs/0.1.9/index.json#docs"
-    },
-    {
-      "name": "ext-net",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-net/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-net/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-net",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-net/0.1.1/index.json",
-      "description": "Networking APIs (DNS, TCP/UDP, TLS, HTTP) (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-net/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-net",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-net/0.1.2/index.json",
-      "description": "Networking APIs (DNS, TCP/UDP, TLS, HTTP) (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-net/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-net",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-net/0.1.3/index.json",
-      "description": "Networking APIs (DNS, TCP/UDP, TLS, HTTP) (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-net/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-net",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-net/0.1.4/index.json",
-      "description": "Networking APIs (DNS, TCP/UDP, TLS, HTTP) (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-net/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-net",
-      "version": "0.1.5",
-      "url": "/agent/latest/packages/ext-net/0.1.5/index.json",
-      "description": "Networking APIs (DNS, TCP/UDP, TLS, HTTP) (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-net/0.1.5/index.json#docs"
-    },
-    {
-      "name": "ext-net",
-      "version": "0.1.6",
-      "url": "/agent/latest/packages/ext-net/0.1.6/index.json",
-      "description": "Networking APIs (DNS, TCP/UDP, TLS, HTTP) (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-net/0.1.6/index.json#docs"
-    },
-    {
-      "name": "ext-net",
-      "version": "0.1.7",
-      "url": "/agent/latest/packages/ext-net/0.1.7/index.json",
-      "description": "Networking APIs (DNS, TCP/UDP, TLS, HTTP) (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-net/0.1.7/index.json#docs"
-    },
-    {
-      "name": "ext-net",
-      "version": "0.1.8",
-      "url": "/agent/latest/packages/ext-net/0.1.8/index.json",
-      "description": "Networking APIs (DNS, TCP/UDP, TLS, HTTP) (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-net/0.1.8/index.json#docs"
-    },
-    {
-      "name": "ext-net",
-      "version": "0.1.9",
-      "url": "/agent/latest/packages/ext-net/0.1.9/index.json",
-      "description": "Networking APIs (DNS, TCP/UDP, TLS, HTTP) (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-net/0.1.9/index.json#docs"
-    },
-    {
-      "name": "ext-net",
-      "version": "0.1.10",
-      "url": "/agent/latest/packages/ext-net/0.1.10/index.json",
-      "description": "Networking APIs (DNS, TCP/UDP, TLS, HTTP) (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-net/0.1.10/index.json#docs"
-    },
-    {
-      "name": "ext-net",
-      "version": "0.1.11",
-      "url": "/agent/latest/packages/ext-net/0.1.11/index.json",
-      "description": "Networking APIs (DNS, TCP/UDP, TLS, HTTP) (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-net/0.1.11/index.json#docs"
-    },
-    {
-      "name": "ext-net-protos-c",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-net-protos-c/0.1.0/index.json",
-      "description": "HTTP/2 + WebSocket + gRPC helpers, pinned by arch/net contracts.",
-      "docs_url": "/agent/latest/packages/ext-net-protos-c/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-net-protos-c",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-net-protos-c/0.1.1/index.json",
-      "description": "HTTP/2 + WebSocket + gRPC helpers, pinned by arch/net contracts.",
-      "docs_url": "/agent/latest/packages/ext-net-protos-c/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-net-protos-c",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-net-protos-c/0.1.2/index.json",
-      "description": "HTTP/2 + WebSocket + gRPC helpers, pinned by arch/net contracts.",
-      "docs_url": "/agent/latest/packages/ext-net-protos-c/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-net-protos-c",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-net-protos-c/0.1.3/index.json",
-      "description": "HTTP/2 + WebSocket + gRPC helpers, pinned by arch/net contracts.",
-      "docs_url": "/agent/latest/packages/ext-net-protos-c/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-net-protos-c",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-net-protos-c/0.1.4/index.json",
-      "description": "HTTP/2 + WebSocket + gRPC helpers, pinned by arch/net contracts.",
-      "docs_url": "/agent/latest/packages/ext-net-protos-c/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-obj-core",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-obj-core/0.1.0/index.json",
-      "description": "Object storage core: canonical object metadata, request/response envelopes, and logical driver interface.",
-      "docs_url": "/agent/latest/packages/ext-obj-core/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-obj-core",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-obj-core/0.1.1/index.json",
-      "description": "Object storage core: canonical object metadata, request/response envelopes, and logical driver interface.",
-      "docs_url": "/agent/latest/packages/ext-obj-core/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-obj-s3",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-obj-s3/0.1.0/index.json",
-      "description": "S3-compatible object storage driver for std.obj (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-obj-s3/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-obj-s3",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-obj-s3/0.1.1/index.json",
-      "description": "S3-compatible object storage driver for std.obj (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-obj-s3/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-obj-s3",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-obj-s3/0.1.2/index.json",
-      "description": "S3-compatible object storage driver for std.obj (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-obj-s3/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-obs",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-obs/0.1.0/index.json",
-      "description": "Metrics snapshot + OpenMetrics + OTLP encoding/export (contracts-as-data under arch/obs).",
-      "docs_url": "/agent/latest/packages/ext-obs/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-obs",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-obs/0.1.1/index.json",
-      "description": "Metrics snapshot + OpenMetrics + OTLP encoding/export (contracts-as-data under arch/obs).",
-      "docs_url": "/agent/latest/packages/ext-obs/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-obs",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-obs/0.1.2/index.json",
-      "description": "Metrics snapshot + OpenMetrics + OTLP encoding/export (contracts-as-data under arch/obs).",
-      "docs_url": "/agent/latest/packages/ext-obs/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-obs",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-obs/0.1.3/index.json",
-      "description": "Metrics snapshot + OpenMetrics + OTLP encoding/export (contracts-as-data under arch/obs).",
-      "docs_url": "/agent/latest/packages/ext-obs/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-obs",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-obs/0.1.4/index.json",
-      "description": "Metrics snapshot + OpenMetrics + OTLP encoding/export (contracts-as-data under arch/obs).",
-      "docs_url": "/agent/latest/packages/ext-obs/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-obs",
-      "version": "0.1.5",
-      "url": "/agent/latest/packages/ext-obs/0.1.5/index.json",
-      "description": "Metrics snapshot + OpenMetrics + OTLP encoding/export (contracts-as-data under arch/obs).",
-      "docs_url": "/agent/latest/packages/ext-obs/0.1.5/index.json#docs"
-    },
-    {
-      "name": "ext-obs",
-      "version": "0.1.6",
-      "url": "/agent/latest/packages/ext-obs/0.1.6/index.json",
-      "description": "Metrics snapshot + OpenMetrics + OTLP encoding/export (contracts-as-data under arch/obs).",
-      "docs_url": "/agent/latest/packages/ext-obs/0.1.6/index.json#docs"
-    },
-    {
-      "name": "ext-openssl-c",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-openssl-c/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-openssl-c/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-openssl-c",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-openssl-c/0.1.1/index.json",
-      "description": "OpenSSL bindings: hashes, RNG, and Ed25519 (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-openssl-c/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-openssl-c",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-openssl-c/0.1.2/index.json",
-      "description": "OpenSSL bindings: hashes, RNG, and Ed25519 (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-openssl-c/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-openssl-c",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-openssl-c/0.1.3/index.json",
-      "description": "OpenSSL bindings: hashes, RNG, and Ed25519 (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-openssl-c/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-openssl-c",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-openssl-c/0.1.4/index.json",
-      "description": "OpenSSL bindings: hashes, RNG, and Ed25519 (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-openssl-c/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-openssl-c",
-      "version": "0.1.5",
-      "url": "/agent/latest/packages/ext-openssl-c/0.1.5/index.json",
-      "description": "OpenSSL bindings: hashes, RNG, and Ed25519 (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-openssl-c/0.1.5/index.json#docs"
-    },
-    {
-      "name": "ext-openssl-c",
-      "version": "0.1.6",
-      "url": "/agent/latest/packages/ext-openssl-c/0.1.6/index.json",
-      "description": "OpenSSL bindings: hashes, RNG, and Ed25519 (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-openssl-c/0.1.6/index.json#docs"
-    },
-    {
-      "name": "ext-openssl-c",
-      "version": "0.1.7",
-      "url": "/agent/latest/packages/ext-openssl-c/0.1.7/index.json",
-      "description": "OpenSSL bindings: hashes, RNG, Ed25519, RSA verify, and ECDSA P-256 verify (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-openssl-c/0.1.7/index.json#docs"
-    },
-    {
-      "name": "ext-openssl-c",
-      "version": "0.1.8",
-      "url": "/agent/latest/packages/ext-openssl-c/0.1.8/index.json",
-      "description": "OpenSSL bindings: hashes, RNG, Ed25519, RSA sign/verify, and ECDSA P-256 verify (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-openssl-c/0.1.8/index.json#docs"
-    },
-    {
-      "name": "ext-openssl-c",
-      "version": "0.1.9",
-      "url": "/agent/latest/packages/ext-openssl-c/0.1.9/index.json",
-      "description": "OpenSSL bindings: hashes, RNG, Ed25519, RSA sign/verify, and ECDSA P-256 verify (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-openssl-c/0.1.9/index.json#docs"
-    },
-    {
-      "name": "ext-path-glob-rs",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-path-glob-rs/0.1.0/index.json",
-      "description": "OS-world glob + walk helpers under std.os.fs.* (deterministic ordering).",
-      "docs_url": "/agent/latest/packages/ext-path-glob-rs/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-path-glob-rs",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-path-glob-rs/0.1.1/index.json",
-      "description": "OS-world glob + walk helpers under std.os.fs.* (deterministic ordering).",
-      "docs_url": "/agent/latest/packages/ext-path-glob-rs/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-path-glob-rs",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-path-glob-rs/0.1.2/index.json",
-      "description": "OS-world glob + walk helpers under std.os.fs.* (deterministic ordering).",
-      "docs_url": "/agent/latest/packages/ext-path-glob-rs/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-path-glob-rs",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-path-glob-rs/0.1.3/index.json",
-      "description": "OS-world glob + walk helpers under std.os.fs.* (deterministic ordering).",
-      "docs_url": "/agent/latest/packages/ext-path-glob-rs/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-path-glob-rs",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-path-glob-rs/0.1.4/index.json",
-      "description": "OS-world glob + walk helpers under std.os.fs.* (deterministic ordering).",
-      "docs_url": "/agent/latest/packages/ext-path-glob-rs/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-pb-rs",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-pb-rs/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-pb-rs/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-pb-rs",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-pb-rs/0.1.1/index.json",
-      "description": "Protocol Buffers wire format and ext.data_model integration.",
-      "docs_url": "/agent/latest/packages/ext-pb-rs/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-pb-rs",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-pb-rs/0.1.2/index.json",
-      "description": "Protocol Buffers wire format and ext.data_model integration.",
-      "docs_url": "/agent/latest/packages/ext-pb-rs/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-pb-rs",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-pb-rs/0.1.3/index.json",
-      "description": "Protocol Buffers wire format and ext.data_model integration.",
-      "docs_url": "/agent/latest/packages/ext-pb-rs/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-pb-rs",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-pb-rs/0.1.4/index.json",
-      "description": "Protocol Buffers wire format and ext.data_model integration.",
-      "docs_url": "/agent/latest/packages/ext-pb-rs/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-pb-rs",
-      "version": "0.1.5",
-      "url": "/agent/latest/packages/ext-pb-rs/0.1.5/index.json",
-      "description": "Protocol Buffers wire format and ext.data_model integration.",
-      "docs_url": "/agent/latest/packages/ext-pb-rs/0.1.5/index.json#docs"
-    },
-    {
-      "name": "ext-rand",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-rand/0.1.0/index.json",
-      "description": "OS CSPRNG (secure random bytes) for OS worlds (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-rand/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-regex",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-regex/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-regex/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-regex",
-      "version": "0.2.0",
-      "url": "/agent/latest/packages/ext-regex/0.2.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-regex/0.2.0/index.json#docs"
-    },
-    {
-      "name": "ext-regex",
-      "version": "0.2.1",
-      "url": "/agent/latest/packages/ext-regex/0.2.1/index.json",
-      "description": "Regular expression matching and searching.",
-      "docs_url": "/agent/latest/packages/ext-regex/0.2.1/index.json#docs"
-    },
-    {
-      "name": "ext-regex",
-      "version": "0.2.2",
-      "url": "/agent/latest/packages/ext-regex/0.2.2/index.json",
-      "description": "Regular expression matching and searching.",
-      "docs_url": "/agent/latest/packages/ext-regex/0.2.2/index.json#docs"
-    },
-    {
-      "name": "ext-regex",
-      "version": "0.2.3",
-      "url": "/agent/latest/packages/ext-regex/0.2.3/index.json",
-      "description": "Regular expression matching and searching.",
-      "docs_url": "/agent/latest/packages/ext-regex/0.2.3/index.json#docs"
-    },
-    {
-      "name": "ext-regex",
-      "version": "0.2.4",
-      "url": "/agent/latest/packages/ext-regex/0.2.4/index.json",
-      "description": "Regular expression matching and searching.",
-      "docs_url": "/agent/latest/packages/ext-regex/0.2.4/index.json#docs"
-    },
-    {
-      "name": "ext-regex",
-      "version": "0.2.5",
-      "url": "/agent/latest/packages/ext-regex/0.2.5/index.json",
-      "description": "Regular expression matching and searching.",
-      "docs_url": "/agent/latest/packages/ext-regex/0.2.5/index.json#docs"
-    },
-    {
-      "name": "ext-robots-txt-rs",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-robots-txt-rs/0.1.0/index.json",
-      "description": "robots.txt parsing helpers (allow/disallow evaluation).",
-      "docs_url": "/agent/latest/packages/ext-robots-txt-rs/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-robots-txt-rs",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-robots-txt-rs/0.1.1/index.json",
-      "description": "robots.txt parsing helpers (allow/disallow evaluation).",
-      "docs_url": "/agent/latest/packages/ext-robots-txt-rs/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-robots-txt-rs",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-robots-txt-rs/0.1.2/index.json",
-      "description": "robots.txt parsing helpers (allow/disallow evaluation).",
-      "docs_url": "/agent/latest/packages/ext-robots-txt-rs/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-robots-txt-rs",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-robots-txt-rs/0.1.3/index.json",
-      "description": "robots.txt parsing helpers (allow/disallow evaluation).",
-      "docs_url": "/agent/latest/packages/ext-robots-txt-rs/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-robots-txt-rs",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-robots-txt-rs/0.1.4/index.json",
-      "description": "robots.txt parsing helpers (allow/disallow evaluation).",
-      "docs_url": "/agent/latest/packages/ext-robots-txt-rs/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-semver-rs",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-semver-rs/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-semver-rs/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-semver-rs",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-semver-rs/0.1.1/index.json",
-      "description": "Semantic version parsing and comparison.",
-      "docs_url": "/agent/latest/packages/ext-semver-rs/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-semver-rs",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-semver-rs/0.1.2/index.json",
-      "description": "Semantic version parsing and comparison.",
-      "docs_url": "/agent/latest/packages/ext-semver-rs/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-semver-rs",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-semver-rs/0.1.3/index.json",
-      "description": "Semantic version parsing and comparison.",
-      "docs_url": "/agent/latest/packages/ext-semver-rs/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-semver-rs",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-semver-rs/0.1.4/index.json",
-      "description": "Semantic version parsing and comparison.",
-      "docs_url": "/agent/latest/packages/ext-semver-rs/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-sitemap-rs",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-sitemap-rs/0.1.0/index.json",
-      "description": "Sitemap XML helpers (extract <loc> URLs).",
-      "docs_url": "/agent/latest/packages/ext-sitemap-rs/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-sitemap-rs",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-sitemap-rs/0.1.1/index.json",
-      "description": "Sitemap XML helpers (extract <loc> URLs).",
-      "docs_url": "/agent/latest/packages/ext-sitemap-rs/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-sitemap-rs",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-sitemap-rs/0.1.2/index.json",
-      "description": "Sitemap XML helpers (extract <loc> URLs).",
-      "docs_url": "/agent/latest/packages/ext-sitemap-rs/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-sitemap-rs",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-sitemap-rs/0.1.3/index.json",
-      "description": "Sitemap XML helpers (extract <loc> URLs).",
-      "docs_url": "/agent/latest/packages/ext-sitemap-rs/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-sitemap-rs",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-sitemap-rs/0.1.4/index.json",
-      "description": "Sitemap XML helpers (extract <loc> URLs).",
-      "docs_url": "/agent/latest/packages/ext-sitemap-rs/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-sockets-c",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-sockets-c/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-sockets-c/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-sockets-c",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-sockets-c/0.1.1/index.json",
-      "description": "Sockets + TLS FFI backend for std.net (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-sockets-c/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-sockets-c",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-sockets-c/0.1.2/index.json",
-      "description": "Sockets + TLS FFI backend for std.net (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-sockets-c/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-sockets-c",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-sockets-c/0.1.3/index.json",
-      "description": "Sockets + TLS FFI backend for std.net (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-sockets-c/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-sockets-c",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-sockets-c/0.1.4/index.json",
-      "description": "Sockets + TLS FFI backend for std.net (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-sockets-c/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-sockets-c",
-      "version": "0.1.5",
-      "url": "/agent/latest/packages/ext-sockets-c/0.1.5/index.json",
-      "description": "Sockets + TLS FFI backend for std.net (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-sockets-c/0.1.5/index.json#docs"
-    },
-    {
-      "name": "ext-sockets-c",
-      "version": "0.1.6",
-      "url": "/agent/latest/packages/ext-sockets-c/0.1.6/index.json",
-      "description": "Sockets + TLS FFI backend for std.net (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-sockets-c/0.1.6/index.json#docs"
-    },
-    {
-      "name": "ext-stdio",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-stdio/0.1.0/index.json",
-      "description": "OS stdio API (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-stdio/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-streams",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-streams/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-streams/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-streams",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-streams/0.1.1/index.json",
-      "description": "Create io readers from bytes and collections.",
-      "docs_url": "/agent/latest/packages/ext-streams/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-streams",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-streams/0.1.2/index.json",
-      "description": "Create io readers from bytes and collections.",
-      "docs_url": "/agent/latest/packages/ext-streams/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-streams",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-streams/0.1.3/index.json",
-      "description": "Create io readers from bytes and collections.",
-      "docs_url": "/agent/latest/packages/ext-streams/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-streams",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-streams/0.1.4/index.json",
-      "description": "Create io readers from bytes and collections.",
-      "docs_url": "/agent/latest/packages/ext-streams/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-streams",
-      "version": "0.1.5",
-      "url": "/agent/latest/packages/ext-streams/0.1.5/index.json",
-      "description": "Create io readers from bytes, collections, and fs.",
-      "docs_url": "/agent/latest/packages/ext-streams/0.1.5/index.json#docs"
-    },
-    {
-      "name": "ext-streams",
-      "version": "0.1.6",
-      "url": "/agent/latest/packages/ext-streams/0.1.6/index.json",
-      "description": "Create io readers from bytes, collections, and fs.",
-      "docs_url": "/agent/latest/packages/ext-streams/0.1.6/index.json#docs"
-    },
-    {
-      "name": "ext-tar-rs",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-tar-rs/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-tar-rs/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-tar-rs",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-tar-rs/0.1.1/index.json",
-      "description": "TAR archive reading and writing.",
-      "docs_url": "/agent/latest/packages/ext-tar-rs/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-tar-rs",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-tar-rs/0.1.2/index.json",
-      "description": "TAR archive reading and writing.",
-      "docs_url": "/agent/latest/packages/ext-tar-rs/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-tar-rs",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-tar-rs/0.1.3/index.json",
-      "description": "TAR archive reading and writing.",
-      "docs_url": "/agent/latest/packages/ext-tar-rs/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-tar-rs",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-tar-rs/0.1.4/index.json",
-      "description": "TAR archive reading and writing.",
-      "docs_url": "/agent/latest/packages/ext-tar-rs/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-text",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-text/0.1.0/index.json",
-      "description": "Text utilities (trim/split/join/find/lines) built on bytes.",
-      "docs_url": "/agent/latest/packages/ext-text/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-text",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-text/0.1.1/index.json",
-      "description": "Text utilities (trim/split/join/find/lines) built on bytes.",
-      "docs_url": "/agent/latest/packages/ext-text/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-text",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-text/0.1.2/index.json",
-      "description": "Text utilities (trim/split/join/find/lines) built on bytes.",
-      "docs_url": "/agent/latest/packages/ext-text/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-time-rs",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-time-rs/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-time-rs/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-time-rs",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-time-rs/0.1.1/index.json",
-      "description": "Time utilities: durations, RFC 3339, and time zones.",
-      "docs_url": "/agent/latest/packages/ext-time-rs/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-time-rs",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-time-rs/0.1.2/index.json",
-      "description": "Time utilities: durations, RFC 3339, and time zones.",
-      "docs_url": "/agent/latest/packages/ext-time-rs/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-time-rs",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-time-rs/0.1.3/index.json",
-      "description": "Time utilities: durations, RFC 3339, and time zones.",
-      "docs_url": "/agent/latest/packages/ext-time-rs/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-time-rs",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-time-rs/0.1.4/index.json",
-      "description": "Time utilities: durations, RFC 3339, and time zones.",
-      "docs_url": "/agent/latest/packages/ext-time-rs/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-time-rs",
-      "version": "0.1.5",
-      "url": "/agent/latest/packages/ext-time-rs/0.1.5/index.json",
-      "description": "Time utilities: durations, RFC 3339, and time zones (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-time-rs/0.1.5/index.json#docs"
-    },
-    {
-      "name": "ext-time-rs",
-      "version": "0.1.6",
-      "url": "/agent/latest/packages/ext-time-rs/0.1.6/index.json",
-      "description": "Time utilities: durations, RFC 3339, and time zones (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-time-rs/0.1.6/index.json#docs"
-    },
-    {
-      "name": "ext-toml-rs",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-toml-rs/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-toml-rs/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-toml-rs",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-toml-rs/0.1.1/index.json",
-      "description": "TOML parsing and serialization.",
-      "docs_url": "/agent/latest/packages/ext-toml-rs/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-toml-rs",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-toml-rs/0.1.2/index.json",
-      "description": "TOML parsing and serialization.",
-      "docs_url": "/agent/latest/packages/ext-toml-rs/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-toml-rs",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-toml-rs/0.1.3/index.json",
-      "description": "TOML parsing and serialization.",
-      "docs_url": "/agent/latest/packages/ext-toml-rs/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-toml-rs",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-toml-rs/0.1.4/index.json",
-      "description": "TOML parsing and serialization.",
-      "docs_url": "/agent/latest/packages/ext-toml-rs/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-toml-rs",
-      "version": "0.1.5",
-      "url": "/agent/latest/packages/ext-toml-rs/0.1.5/index.json",
-      "description": "TOML parsing and serialization.",
-      "docs_url": "/agent/latest/packages/ext-toml-rs/0.1.5/index.json#docs"
-    },
-    {
-      "name": "ext-tracing",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-tracing/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-tracing/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-tracing",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-tracing/0.1.1/index.json",
-      "description": "Trace span/event record encoding and formatting.",
-      "docs_url": "/agent/latest/packages/ext-tracing/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-tracing",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-tracing/0.1.2/index.json",
-      "description": "Trace span/event record encoding and formatting.",
-      "docs_url": "/agent/latest/packages/ext-tracing/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-tracing",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-tracing/0.1.3/index.json",
-      "description": "Trace span/event record encoding and formatting.",
-      "docs_url": "/agent/latest/packages/ext-tracing/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-tracing",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-tracing/0.1.4/index.json",
-      "description": "Trace span/event record encoding and formatting.",
-      "docs_url": "/agent/latest/packages/ext-tracing/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-u64-rs",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-u64-rs/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-u64-rs/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-u64-rs",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-u64-rs/0.1.1/index.json",
-      "description": "Unsigned 64-bit integer utilities.",
-      "docs_url": "/agent/latest/packages/ext-u64-rs/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-u64-rs",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-u64-rs/0.1.2/index.json",
-      "description": "Unsigned 64-bit integer utilities.",
-      "docs_url": "/agent/latest/packages/ext-u64-rs/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-u64-rs",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-u64-rs/0.1.3/index.json",
-      "description": "Unsigned 64-bit integer utilities.",
-      "docs_url": "/agent/latest/packages/ext-u64-rs/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-u64-rs",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-u64-rs/0.1.4/index.json",
-      "description": "Unsigned 64-bit integer utilities.",
-      "docs_url": "/agent/latest/packages/ext-u64-rs/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-unicode-rs",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-unicode-rs/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-unicode-rs/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-unicode-rs",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-unicode-rs/0.1.1/index.json",
-      "description": "Unicode character and string utilities.",
-      "docs_url": "/agent/latest/packages/ext-unicode-rs/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-unicode-rs",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-unicode-rs/0.1.2/index.json",
-      "description": "Unicode character and string utilities.",
-      "docs_url": "/agent/latest/packages/ext-unicode-rs/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-unicode-rs",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-unicode-rs/0.1.3/index.json",
-      "description": "Unicode character and string utilities.",
-      "docs_url": "/agent/latest/packages/ext-unicode-rs/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-unicode-rs",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-unicode-rs/0.1.4/index.json",
-      "description": "Unicode character and string utilities.",
-      "docs_url": "/agent/latest/packages/ext-unicode-rs/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-unicode-rs",
-      "version": "0.1.5",
-      "url": "/agent/latest/packages/ext-unicode-rs/0.1.5/index.json",
-      "description": "Unicode character and string utilities.",
-      "docs_url": "/agent/latest/packages/ext-unicode-rs/0.1.5/index.json#docs"
-    },
-    {
-      "name": "ext-url-rs",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-url-rs/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-url-rs/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-url-rs",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-url-rs/0.1.1/index.json",
-      "description": "HTTP types/parsing and URL parsing/encoding.",
-      "docs_url": "/agent/latest/packages/ext-url-rs/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-url-rs",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-url-rs/0.1.2/index.json",
-      "description": "HTTP types/parsing and URL parsing/encoding.",
-      "docs_url": "/agent/latest/packages/ext-url-rs/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-url-rs",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-url-rs/0.1.3/index.json",
-      "description": "HTTP types/parsing and URL parsing/encoding.",
-      "docs_url": "/agent/latest/packages/ext-url-rs/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-url-rs",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-url-rs/0.1.4/index.json",
-      "description": "HTTP types/parsing and URL parsing/encoding.",
-      "docs_url": "/agent/latest/packages/ext-url-rs/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-url-rs",
-      "version": "0.1.5",
-      "url": "/agent/latest/packages/ext-url-rs/0.1.5/index.json",
-      "description": "HTTP types/parsing and URL parsing/encoding.",
-      "docs_url": "/agent/latest/packages/ext-url-rs/0.1.5/index.json#docs"
-    },
-    {
-      "name": "ext-uuid-rs",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-uuid-rs/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-uuid-rs/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-uuid-rs",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-uuid-rs/0.1.1/index.json",
-      "description": "UUID parsing and formatting.",
-      "docs_url": "/agent/latest/packages/ext-uuid-rs/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-uuid-rs",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-uuid-rs/0.1.2/index.json",
-      "description": "UUID parsing and formatting.",
-      "docs_url": "/agent/latest/packages/ext-uuid-rs/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-uuid-rs",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-uuid-rs/0.1.3/index.json",
-      "description": "UUID parsing and formatting.",
-      "docs_url": "/agent/latest/packages/ext-uuid-rs/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-uuid-rs",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-uuid-rs/0.1.4/index.json",
-      "description": "UUID parsing and formatting.",
-      "docs_url": "/agent/latest/packages/ext-uuid-rs/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-walkdir-rs",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-walkdir-rs/0.1.0/index.json",
-      "description": "Directory traversal helpers for OS worlds (wrap std.os.fs.walk_glob_sorted_text_v1).",
-      "docs_url": "/agent/latest/packages/ext-walkdir-rs/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-walkdir-rs",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-walkdir-rs/0.1.1/index.json",
-      "description": "Directory traversal helpers for OS worlds (wrap std.os.fs.walk_glob_sorted_text_v1).",
-      "docs_url": "/agent/latest/packages/ext-walkdir-rs/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-walkdir-rs",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-walkdir-rs/0.1.2/index.json",
-      "description": "Directory traversal helpers for OS worlds (wrap std.os.fs.walk_glob_sorted_text_v1).",
-      "docs_url": "/agent/latest/packages/ext-walkdir-rs/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-walkdir-rs",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-walkdir-rs/0.1.3/index.json",
-      "description": "Directory traversal helpers for OS worlds (wrap std.os.fs.walk_glob_sorted_text_v1).",
-      "docs_url": "/agent/latest/packages/ext-walkdir-rs/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-walkdir-rs",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-walkdir-rs/0.1.4/index.json",
-      "description": "Directory traversal helpers for OS worlds (wrap std.os.fs.walk_glob_sorted_text_v1).",
-      "docs_url": "/agent/latest/packages/ext-walkdir-rs/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-web-crawl",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-web-crawl/0.1.0/index.json",
-      "description": "Robots (RFC 9309) + Sitemaps + deterministic crawl scheduling (pinned via arch/crawl).",
-      "docs_url": "/agent/latest/packages/ext-web-crawl/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-web-crawl",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-web-crawl/0.1.1/index.json",
-      "description": "Robots (RFC 9309) + Sitemaps + deterministic crawl scheduling (pinned via arch/crawl).",
-      "docs_url": "/agent/latest/packages/ext-web-crawl/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-web-crawl",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-web-crawl/0.1.2/index.json",
-      "description": "Robots (RFC 9309) + Sitemaps + deterministic crawl scheduling (pinned via arch/crawl).",
-      "docs_url": "/agent/latest/packages/ext-web-crawl/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-web-crawl",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-web-crawl/0.1.3/index.json",
-      "description": "Robots (RFC 9309) + Sitemaps + deterministic crawl scheduling (pinned via arch/crawl).",
-      "docs_url": "/agent/latest/packages/ext-web-crawl/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-web-crawl",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-web-crawl/0.1.4/index.json",
-      "description": "Robots (RFC 9309) + Sitemaps + deterministic crawl scheduling (pinned via arch/crawl).",
-      "docs_url": "/agent/latest/packages/ext-web-crawl/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-web-crawl",
-      "version": "0.1.5",
-      "url": "/agent/latest/packages/ext-web-crawl/0.1.5/index.json",
-      "description": "Robots (RFC 9309) + Sitemaps + deterministic crawl scheduling (pinned via arch/crawl).",
-      "docs_url": "/agent/latest/packages/ext-web-crawl/0.1.5/index.json#docs"
-    },
-    {
-      "name": "ext-web-crawl",
-      "version": "0.1.6",
-      "url": "/agent/latest/packages/ext-web-crawl/0.1.6/index.json",
-      "description": "Robots (RFC 9309) + Sitemaps + deterministic crawl scheduling (pinned via arch/crawl).",
-      "docs_url": "/agent/latest/packages/ext-web-crawl/0.1.6/index.json#docs"
-    },
-    {
-      "name": "ext-web-kit",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-web-kit/0.1.0/index.json",
-      "description": "Web service kit: router + canonical errors + OpenAPI 3.1 generation (pinned via arch/web).",
-      "docs_url": "/agent/latest/packages/ext-web-kit/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-web-kit",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-web-kit/0.1.1/index.json",
-      "description": "Web service kit: router + canonical errors + OpenAPI 3.1 generation (pinned via arch/web).",
-      "docs_url": "/agent/latest/packages/ext-web-kit/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-web-kit",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-web-kit/0.1.2/index.json",
-      "description": "Web service kit: router + canonical errors + OpenAPI 3.1 generation (pinned via arch/web).",
-      "docs_url": "/agent/latest/packages/ext-web-kit/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-web-kit",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-web-kit/0.1.3/index.json",
-      "description": "Web service kit: router + canonical errors + OpenAPI 3.1 generation (pinned via arch/web).",
-      "docs_url": "/agent/latest/packages/ext-web-kit/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-web-kit",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-web-kit/0.1.4/index.json",
-      "description": "Web service kit: router + canonical errors + OpenAPI 3.1 generation (pinned via arch/web).",
-      "docs_url": "/agent/latest/packages/ext-web-kit/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-xml-rs",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-xml-rs/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-xml-rs/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-xml-rs",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-xml-rs/0.1.1/index.json",
-      "description": "XML parsing and ext.data_model integration.",
-      "docs_url": "/agent/latest/packages/ext-xml-rs/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-xml-rs",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-xml-rs/0.1.2/index.json",
-      "description": "XML parsing and ext.data_model integration.",
-      "docs_url": "/agent/latest/packages/ext-xml-rs/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-xml-rs",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-xml-rs/0.1.3/index.json",
-      "description": "XML parsing and ext.data_model integration.",
-      "docs_url": "/agent/latest/packages/ext-xml-rs/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-xml-rs",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-xml-rs/0.1.4/index.json",
-      "description": "XML parsing and ext.data_model integration.",
-      "docs_url": "/agent/latest/packages/ext-xml-rs/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-yaml-rs",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-yaml-rs/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-yaml-rs/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-yaml-rs",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-yaml-rs/0.1.1/index.json",
-      "description": "YAML parsing and serialization.",
-      "docs_url": "/agent/latest/packages/ext-yaml-rs/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-yaml-rs",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-yaml-rs/0.1.2/index.json",
-      "description": "YAML parsing and serialization.",
-      "docs_url": "/agent/latest/packages/ext-yaml-rs/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-yaml-rs",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-yaml-rs/0.1.3/index.json",
-      "description": "YAML parsing and serialization.",
-      "docs_url": "/agent/latest/packages/ext-yaml-rs/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-yaml-rs",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-yaml-rs/0.1.4/index.json",
-      "description": "YAML parsing and serialization.",
-      "docs_url": "/agent/latest/packages/ext-yaml-rs/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-zlib-c",
-      "version": "0.1.0",
-      "url": "/agent/latest/packages/ext-zlib-c/0.1.0/index.json",
-      "description": "",
-      "docs_url": "/agent/latest/packages/ext-zlib-c/0.1.0/index.json#docs"
-    },
-    {
-      "name": "ext-zlib-c",
-      "version": "0.1.1",
-      "url": "/agent/latest/packages/ext-zlib-c/0.1.1/index.json",
-      "description": "zlib compression bindings (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-zlib-c/0.1.1/index.json#docs"
-    },
-    {
-      "name": "ext-zlib-c",
-      "version": "0.1.2",
-      "url": "/agent/latest/packages/ext-zlib-c/0.1.2/index.json",
-      "description": "zlib compression bindings (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-zlib-c/0.1.2/index.json#docs"
-    },
-    {
-      "name": "ext-zlib-c",
-      "version": "0.1.3",
-      "url": "/agent/latest/packages/ext-zlib-c/0.1.3/index.json",
-      "description": "zlib compression bindings (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-zlib-c/0.1.3/index.json#docs"
-    },
-    {
-      "name": "ext-zlib-c",
-      "version": "0.1.4",
-      "url": "/agent/latest/packages/ext-zlib-c/0.1.4/index.json",
-      "description": "zlib compression bindings (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-zlib-c/0.1.4/index.json#docs"
-    },
-    {
-      "name": "ext-zlib-c",
-      "version": "0.1.5",
-      "url": "/agent/latest/packages/ext-zlib-c/0.1.5/index.json",
-      "description": "zlib compression bindings (run-os only).",
-      "docs_url": "/agent/latest/packages/ext-zlib-c/0.1.5/index.json#docs"
-    }
-  ]
-} as const;
-
-export const latestStdlibIndexMeta = {
-  url: '/agent/latest/stdlib/index.json',
-  module_count: 19,
-} as const;
@@ -0,0 +1,34 @@
+/**
+ * THIS FILE IS GENERATED by scripts/generate_agent_indexes.py
+ * DO NOT EDIT BY HAND.
+ *
+ * Counts and URLs only. Item lists live in the sibling JSON chunks; import the
+ * one a page renders (e.g. './_agent_data/skills.json') from that page.
+ */
+
+export type SkillItem = {
+  id: string;
+  summary: string;
+  docs_url: string;
+  report_schema_url: string | null;
+};
+
+export type SchemaItem = {id: string; url: string};
+
+export type ExampleItem = {id: string; purpose: string; url: string};
+
+export type PackageItem = {name: string; version: string; url: string};
+
+export type AgentDataChunk<T> = {source: string; items: T[]};
+
+export const latestAgentDataMeta = {
+  skills: {url: '/agent/latest/skills/index.json', count: 14},
+  schemas: {url: '/agent/latest/schemas/index.json', count: 258},
+  examples: {url: '/agent/latest/examples/index.json', count: 17},
+  packages: {url: '/agent/latest/packages/index.json', count: 410},
+} as const;
+
+export const latestStdlibIndexMeta = {
+  url: '/agent/latest/stdlib/index.json',
+  module_count: 19,
+} as const;
@@ -8,6 +8,8 @@ export const AGENT_ENDPOINTS = {
   examples_catalog_index: '/agent/latest/examples/catalog.json',
   packages_index: '/agent/latest/packages/index.json',
   stdlib_index: '/agent/latest/stdlib/index.json',
+  symbols_index: '/agent/latest/symbols/index.json',
+  capabilities_index: '/agent/latest/capabilities/index.json',
   toolchain_versions: '/versions/toolchain_versions.json',
 } as const;
 
@@ -2,9 +2,12 @@ import type {ReactNode} from 'react';
 import Layout from '@theme/Layout';
 import Heading from '@theme/Heading';
 
-import {latestExamplesIndex} from './_agent_data';
+import type {AgentDataChunk, ExampleItem} from './_agent_data';
+import examplesChunk from './_agent_data/examples.json';
 import {AGENT_ENDPOINTS} from './_snippets';
 
+const latestExamplesIndex = examplesChunk as AgentDataChunk<ExampleItem>;
+
 export default function AgentExamples(): ReactNode {
   return (
     <Layout title="Agent examples" description="Example X07 programs for agents to copy.">
@@ -4,13 +4,7 @@ import Heading from '@theme/Heading';
 import Link from '@docusaurus/Link';
 import toolchainVersionsFile from '@site/static/versions/toolchain_versions.json';
 
-import {
-  latestExamplesIndex,
-  latestPackagesIndex,
-  latestSchemasIndex,
-  latestSkillsIndex,
-  latestStdlibIndexMeta,
-} from './_agent_data';
+import {latestAgentDataMeta, latestStdlibIndexMeta} from './_agent_data';
 import {AGENT_ENDPOINTS, MINIMAL_AGENT_LOOP_COMMANDS} from './_snippets';
 
 type ToolchainVersionEntry = {
@@ -79,10 +73,10 @@ export default function AgentPortal(): ReactNode {
     return b.toolchain_version.localeCompare(a.toolchain_version);
   });
 
-  const skillsCount = latestSkillsIndex.items.length;
-  const schemasCount = latestSchemasIndex.items.length;
-  const examplesCount = latestExamplesIndex.items.length;
-  const packagesCount = latestPackagesIndex.items.length;
+  const skillsCount = latestAgentDataMeta.skills.count;
+  const schemasCount = latestAgentDataMeta.schemas.count;
+  const examplesCount = latestAgentDataMeta.examples.count;
+  const packagesCount = latestAgentDataMeta.packages.count;
 
   return (
     <Layout
@@ -149,6 +143,16 @@ export default function AgentPortal(): ReactNode {
                 <code>{`GET ${AGENT_ENDPOINTS.stdlib_index}`}</code>
               </a>
             </li>
+            <li>
+              <a href={AGENT_ENDPOINTS.symbols_index}>
+                <code>{`GET ${AGENT_ENDPOINTS.symbols_index}`}</code>
+              </a>
+            </li>
+            <li>
+              <a href={AGENT_ENDPOINTS.capabilities_index}>
+                <code>{`GET ${AGENT_ENDPOINTS.capabilities_index}`}</code>
+              </a>
+            </li>
           </ul>
         </div>
 
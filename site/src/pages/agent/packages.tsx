@@ -2,9 +2,12 @@ import type {ReactNode} from 'react';
 import Layout from '@theme/Layout';
 import Heading from '@theme/Heading';
 
-import {latestPackagesIndex} from './_agent_data';
+import type {AgentDataChunk, PackageItem} from './_agent_data';
+import packagesChunk from './_agent_data/packages.json';
 import {AGENT_ENDPOINTS} from './_snippets';
 
+const latestPackagesIndex = packagesChunk as AgentDataChunk<PackageItem>;
+
 export default function AgentPackages(): ReactNode {
   return (
     <Layout title="Agent packages" description="Machine-first indexes for official external packages.">
@@ -2,9 +2,12 @@ import type {ReactNode} from 'react';
 import Layout from '@theme/Layout';
 import Heading from '@theme/Heading';
 
-import {latestSchemasIndex} from './_agent_data';
+import type {AgentDataChunk, SchemaItem} from './_agent_data';
+import schemasChunk from './_agent_data/schemas.json';
 import {AGENT_ENDPOINTS} from './_snippets';
 
+const latestSchemasIndex = schemasChunk as AgentDataChunk<SchemaItem>;
+
 export default function AgentSchemas(): ReactNode {
   return (
     <Layout title="Agent schemas" description="JSON schemas required by agents and tooling.">
@@ -3,9 +3,12 @@ import Layout from '@theme/Layout';
 import Heading from '@theme/Heading';
 import Link from '@docusaurus/Link';
 
-import {latestSkillsIndex} from './_agent_data';
+import type {AgentDataChunk, SkillItem} from './_agent_data';
+import skillsChunk from './_agent_data/skills.json';
 import {AGENT_ENDPOINTS} from './_snippets';
 
+const latestSkillsIndex = skillsChunk as AgentDataChunk<SkillItem>;
+
 const GITHUB_RELEASES_URL = 'https://github.com/x07lang/x07/releases';
 
 export default function AgentSkills(): ReactNode {